@@ -0,0 +1,159 @@
+"""Benchmark of the docx converter, which compares the generation of the headings and
+    record tables by the python-docx API with the generation as XML.
+
+    Both paths convert the same synthetic TRLC corpus and the document bodies are
+    compared to verify that they are equivalent.
+    Run it from the repository root:
+        python benchmarks/bench_docx_tables.py --results out/bench_docx.json
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import argparse
+import json
+import os
+import sys
+import tempfile
+from typing import List, Tuple
+
+import docx
+from lxml import etree
+from bench_end_to_end import _measure, _parse_converter_args
+from trlc_corpus import CorpusConfig, generate_corpus
+from pyTRLCConverter.docx_converter import DocxConverter
+from pyTRLCConverter.item_walker import ItemWalker
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.trlc_helper import get_trlc_symbols
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+class _ApiDocxConverter(DocxConverter):
+    """
+    Docx converter, which adds the headings and record tables by the python-docx API.
+    """
+
+    def convert_section(self, section: str, level: int) -> Ret:
+        self._docx.add_heading(section, level)
+
+        return Ret.OK
+
+    def _add_record_table(self, rows: List[Tuple[str, str]]) -> None:
+        # Overriding it selects the python-docx API path of the converter.
+        super()._add_record_table(rows)
+
+# Functions ********************************************************************
+
+def _get_canonical_body(file_name: str) -> bytes:
+    """
+    Get the document body of a docx file in canonical form, without formatting whitespace.
+
+    Args:
+        file_name (str): The docx file name.
+
+    Returns:
+        bytes: Canonical XML of the document body.
+    """
+    body_xml = etree.tostring(docx.Document(file_name).element.body)
+    parser = etree.XMLParser(remove_blank_text=True)
+
+    return etree.tostring(etree.fromstring(body_xml, parser), method="c14n")
+
+def run_benchmark(config: CorpusConfig, repeat: int, work_dir: str) -> dict:
+    """
+    Generate the corpus and measure both paths.
+
+    Args:
+        config (CorpusConfig): Corpus configuration.
+        repeat (int): Number of repetitions per path.
+        work_dir (str): Folder for the corpus and the generated documents.
+
+    Returns:
+        dict: Benchmark results
+    """
+    corpus_dir = os.path.join(work_dir, "corpus")
+    generate_corpus(corpus_dir, config)
+    symbols = get_trlc_symbols([corpus_dir], None)
+
+    if symbols is None:
+        raise RuntimeError("Failed to parse the corpus.")
+
+    phases = {}
+    body_list = []
+
+    for name, converter_class in [("api", _ApiDocxConverter), ("xml", DocxConverter)]:
+        out_dir = os.path.join(work_dir, name)
+        os.makedirs(out_dir, exist_ok=True)
+        args = _parse_converter_args("docx", corpus_dir, out_dir)
+
+        # Bind the arguments of this path to the lambda.
+        phases[name] = _measure(
+            lambda args=args, converter_class=converter_class:
+                ItemWalker(args, converter_class(args)).walk_symbols(symbols), repeat)
+
+        body_list.append(_get_canonical_body(os.path.join(out_dir, args.name)))
+
+    return {
+        "config": config.to_dict(),
+        "records": config.get_record_count(),
+        "repeat": repeat,
+        "equivalent": body_list[0] == body_list[1],
+        "speedup": phases["api"]["min"] / phases["xml"]["min"],
+        "phases": phases
+    }
+
+def main() -> int:
+    """
+    Run the docx benchmark and write the results as JSON file.
+
+    Returns:
+        int: Program status
+    """
+    parser = argparse.ArgumentParser(description="Benchmark of the docx record tables.")
+    parser.add_argument("--results", type=str, default="bench_docx.json",
+                        help="JSON file for the results (default: bench_docx.json).")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="Number of repetitions (default: 1).")
+    CorpusConfig.add_arguments(parser)
+
+    # The python-docx API is slow, therefore the default corpus is smaller.
+    parser.set_defaults(packages=1, files=2, sections=10, records=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        results = run_benchmark(CorpusConfig.from_args(args), args.repeat, work_dir)
+
+    with open(args.results, "w", encoding="utf-8") as fd:
+        json.dump(results, fd, indent=4)
+
+    print(f"{'Path':<20} {'Min':>10} {'Mean':>10}")
+
+    for name, phase in results["phases"].items():
+        print(f"{name:<20} {phase['min']:9.3f}s {phase['mean']:9.3f}s")
+
+    print(f"Speedup {results['speedup']:.1f}x, equivalent documents: {results['equivalent']}.")
+    print(f"Results written to {args.results}.")
+
+    return 0 if results["equivalent"] is True else 1
+
+# Main *************************************************************************
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""End-to-end benchmark of the parsing, the item walker and the built-in converters.
+
+    A synthetic TRLC corpus is generated and every phase is measured separately.
+    Run it from the repository root:
+        python benchmarks/bench_end_to_end.py --results out/benchmark.json
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from typing import Callable, List
+
+from trlc.version import TRLC_VERSION
+from trlc_corpus import CorpusConfig, generate_corpus
+from pyTRLCConverter.__main__ import BUILD_IN_CONVERTER_LIST, _create_args_parser
+from pyTRLCConverter.abstract_converter import AbstractConverter
+from pyTRLCConverter.converter_registry import LazyConverterParser, register_converter
+from pyTRLCConverter.item_walker import ItemWalker
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.trlc_helper import Record_Object, get_trlc_symbols
+from pyTRLCConverter.version import __version__
+
+# Variables ********************************************************************
+
+# Subcommands of the built-in converters, which are measured by default.
+CONVERTERS_DEFAULT = ["markdown", "rst", "docx", "dump", "json"]
+
+# Classes **********************************************************************
+
+class _NullConverter(AbstractConverter):
+    """
+    Converter which doesn't convert anything, used to measure the item walker alone.
+    """
+    def begin(self) -> Ret:
+        return Ret.OK
+
+    def enter_file(self, file_name: str) -> Ret:
+        return Ret.OK
+
+    def leave_file(self, file_name: str) -> Ret:
+        return Ret.OK
+
+    def convert_section(self, section: str, level: int) -> Ret:
+        return Ret.OK
+
+    def convert_record_object(self, record: Record_Object, level: int) -> Ret:
+        return Ret.OK
+
+    def finish(self) -> Ret:
+        return Ret.OK
+
+# Functions ********************************************************************
+
+def _measure(run: Callable[[], Ret], repeat: int) -> dict:
+    """
+    Measure a phase several times.
+
+    Args:
+        run (Callable[[], Ret]): Runs the phase once.
+        repeat (int): Number of repetitions.
+
+    Returns:
+        dict: The min. and mean duration and all durations in seconds.
+    """
+    durations = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        # Console output, e.g. of the dump converter, shall not be measured.
+        with redirect_stdout(io.StringIO()):
+            result = run()
+
+        durations.append(time.perf_counter() - start)
+
+        if result == Ret.ERROR:
+            raise RuntimeError("Phase failed.")
+
+    return {
+        "min": min(durations),
+        "mean": sum(durations) / len(durations),
+        "runs": durations
+    }
+
+def _parse_converter_args(subcommand: str, corpus_dir: str, out_dir: str) -> argparse.Namespace:
+    """
+    Parse the program arguments of a converter like the command line interface does.
+
+    Args:
+        subcommand (str): The subcommand of the converter.
+        corpus_dir (str): The corpus folder.
+        out_dir (str): The output folder.
+
+    Returns:
+        argparse.Namespace: Parsed program arguments
+    """
+    parser = _create_args_parser()
+    sub_parser = parser.add_subparsers(required=True, parser_class=LazyConverterParser)
+
+    for converter_entry in BUILD_IN_CONVERTER_LIST:
+        register_converter(sub_parser, converter_entry)
+
+    return parser.parse_args(["--source", corpus_dir, "--out", out_dir, subcommand])
+
+def run_benchmark(config: CorpusConfig, converters: List[str], repeat: int, work_dir: str) -> dict:
+    """
+    Generate the corpus and measure every phase separately.
+
+    Args:
+        config (CorpusConfig): Corpus configuration.
+        converters (List[str]): Subcommands of the converters to measure.
+        repeat (int): Number of repetitions per phase.
+        work_dir (str): Folder for the corpus and the generated output.
+
+    Returns:
+        dict: Benchmark results
+    """
+    corpus_dir = os.path.join(work_dir, "corpus")
+    file_list = generate_corpus(corpus_dir, config)
+    symbols = get_trlc_symbols([corpus_dir], None)
+
+    if symbols is None:
+        raise RuntimeError("Failed to parse the corpus.")
+
+    phases = {}
+    phases["get_trlc_symbols"] = _measure(lambda: get_trlc_symbols([corpus_dir], None), repeat)
+
+    walker_args = _parse_converter_args("dump", corpus_dir, work_dir)
+    phases["walk_symbols"] = _measure(
+        lambda: ItemWalker(walker_args, _NullConverter()).walk_symbols(symbols), repeat)
+
+    for subcommand in converters:
+        out_dir = os.path.join(work_dir, subcommand)
+        os.makedirs(out_dir, exist_ok=True)
+        args = _parse_converter_args(subcommand, corpus_dir, out_dir)
+
+        # Bind the arguments of this converter to the lambda.
+        phases[subcommand] = _measure(
+            lambda args=args: ItemWalker(args, args.converter_class(args)).walk_symbols(symbols), repeat)
+
+    return {
+        "version": __version__,
+        "trlc_version": TRLC_VERSION,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config.to_dict(),
+        "corpus": {
+            "files": len(file_list),
+            "records": config.get_record_count(),
+            "bytes": sum(os.path.getsize(file_name) for file_name in file_list)
+        },
+        "repeat": repeat,
+        "phases": phases
+    }
+
+def main() -> int:
+    """
+    Run the end-to-end benchmark and write the results as JSON file.
+
+    Returns:
+        int: Program status
+    """
+    parser = argparse.ArgumentParser(description="End-to-end benchmark of pyTRLCConverter.")
+    parser.add_argument("--results", type=str, default="benchmark.json",
+                        help="JSON file for the results (default: benchmark.json).")
+    parser.add_argument("--converters", type=str, nargs="+", default=CONVERTERS_DEFAULT,
+                        choices=CONVERTERS_DEFAULT, help="Converters to measure (default: all).")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Number of repetitions (default: 3).")
+    CorpusConfig.add_arguments(parser)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        results = run_benchmark(CorpusConfig.from_args(args), args.converters, args.repeat, work_dir)
+
+    with open(args.results, "w", encoding="utf-8") as fd:
+        json.dump(results, fd, indent=4)
+
+    print(f"{'Phase':<20} {'Min':>10} {'Mean':>10}")
+
+    for name, phase in results["phases"].items():
+        print(f"{name:<20} {phase['min']:9.3f}s {phase['mean']:9.3f}s")
+
+    print(f"Results written to {args.results}.")
+
+    return 0
+
+# Main *************************************************************************
+
+if __name__ == "__main__":
+    sys.exit(main())
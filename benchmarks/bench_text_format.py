@@ -0,0 +1,120 @@
+"""Micro-benchmark of the text formatting kernel against its reference implementation.
+
+    Run it from the repository root:
+        python benchmarks/bench_text_format.py
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import argparse
+import random
+import sys
+import timeit
+from typing import Callable, List
+
+import text_format_reference
+from pyTRLCConverter.markdown_converter import MarkdownConverter
+from pyTRLCConverter.rst_converter import RstConverter
+
+# Variables ********************************************************************
+
+# Characters the sample texts consist of, including all escaped characters and LF.
+SAMPLE_CHARACTERS = "abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ 0123456789 \\`*_{}[]<>()#+-.!|\n"
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+def create_sample_texts(count: int, seed: int = 0) -> List[str]:
+    """
+    Create reproducible sample texts with escaped characters and line feeds.
+
+    Args:
+        count (int): Number of sample texts.
+        seed (int): Seed of the random generator.
+
+    Returns:
+        List[str]: Sample texts
+    """
+    rng = random.Random(seed)
+
+    return ["".join(rng.choice(SAMPLE_CHARACTERS) for _ in range(rng.randint(0, 120))) for _ in range(count)]
+
+def _measure(name: str, reference: Callable[[], None], kernel: Callable[[], None], repeat: int) -> None:
+    """
+    Measure the reference and the kernel implementation and print the speedup.
+
+    Args:
+        name (str): Name of the measured function.
+        reference (Callable[[], None]): Runs the reference implementation.
+        kernel (Callable[[], None]): Runs the kernel implementation.
+        repeat (int): Number of repetitions, the best one is taken.
+    """
+    reference_time = min(timeit.repeat(reference, number=1, repeat=repeat))
+    kernel_time = min(timeit.repeat(kernel, number=1, repeat=repeat))
+
+    print(f"{name:<28} {reference_time * 1000:10.2f} ms {kernel_time * 1000:10.2f} ms " \
+          f"{reference_time / kernel_time:8.2f}x")
+
+def main() -> int:
+    """
+    Run the micro-benchmark.
+
+    Returns:
+        int: Program status
+    """
+    parser = argparse.ArgumentParser(description="Micro-benchmark of the text formatting kernel.")
+    parser.add_argument("-c", "--count", type=int, default=20000, help="Number of sample texts (default: 20000).")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Number of repetitions (default: 5).")
+    args = parser.parse_args()
+
+    texts = create_sample_texts(args.count)
+    rows = list(zip(texts[0::2], texts[1::2]))
+    max_widths = [120, 120]
+
+    print(f"{'Function':<28} {'Reference':>13} {'Kernel':>13} {'Speedup':>9}")
+
+    _measure("markdown_escape",
+             lambda: [text_format_reference.markdown_escape(text) for text in texts],
+             lambda: [MarkdownConverter.markdown_escape(text) for text in texts],
+             args.repeat)
+    _measure("rst_escape",
+             lambda: [text_format_reference.rst_escape(text) for text in texts],
+             lambda: [RstConverter.rst_escape(text) for text in texts],
+             args.repeat)
+    _measure("markdown_create_table_head",
+             lambda: [text_format_reference.markdown_create_table_head(list(row)) for row in rows],
+             lambda: [MarkdownConverter.markdown_create_table_head(list(row)) for row in rows],
+             args.repeat)
+    _measure("markdown_append_table_row",
+             lambda: [text_format_reference.markdown_append_table_row(list(row)) for row in rows],
+             lambda: [MarkdownConverter.markdown_append_table_row(list(row)) for row in rows],
+             args.repeat)
+    _measure("rst_append_table_row",
+             lambda: [text_format_reference.rst_append_table_row(list(row), max_widths) for row in rows],
+             lambda: [RstConverter.rst_append_table_row(list(row), max_widths) for row in rows],
+             args.repeat)
+
+    return 0
+
+# Main *************************************************************************
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""Reference implementation of the text formatting before the text formatting kernel.
+
+    It is kept unchanged to verify that the kernel produces byte-identical output
+    and to measure its speedup.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+from typing import List
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+def markdown_escape(text: str) -> str:
+    """
+    Escapes the text to be used in a Markdown document.
+
+    Args:
+        text (str): Text to escape
+
+    Returns:
+        str: Escaped text
+    """
+    characters = ["\\", "`", "*", "_", "{", "}", "[", "]", "<", ">", "(", ")", "#", "+", "-", ".", "!", "|"]
+
+    for character in characters:
+        text = text.replace(character, "\\" + character)
+
+    return text
+
+def rst_escape(text: str) -> str:
+    """
+    Escapes the text to be used in a reStructuredText document.
+
+    Args:
+        text (str): Text to escape
+
+    Returns:
+        str: Escaped text
+    """
+    characters = ["\\", "`", "*", "_", "{", "}", "[", "]", "<", ">", "(", ")", "#", "+", "-", ".", "!", "|"]
+
+    for character in characters:
+        text = text.replace(character, "\\" + character)
+
+    return text
+
+def markdown_create_table_head(column_titles : List[str], escape: bool = True) -> str:
+    """
+    Create the table head for a Markdown table.
+
+    Args:
+        column_titles ([str]): List of column titles.
+        escape (bool): Escape the titles (default: True).
+
+    Returns:
+        str: Table head
+    """
+    table_head = "|"
+
+    for column_title in column_titles:
+        column_title_raw = column_title
+
+        if escape is True:
+            column_title_raw = markdown_escape(column_title)
+
+        table_head += f" {column_title_raw} |"
+
+    table_head += "\n"
+
+    table_head += "|"
+
+    for column_title in column_titles:
+        column_title_raw = column_title
+
+        if escape is True:
+            column_title_raw = markdown_escape(column_title)
+
+        table_head += " "
+
+        for _ in range(len(column_title_raw)):
+            table_head += "-"
+
+        table_head += " |"
+
+    table_head += "\n"
+
+    return table_head
+
+def markdown_append_table_row(row_values: List[str], escape: bool = True) -> str:
+    """
+    Append a row to a Markdown table.
+
+    Args:
+        row_values ([str]): List of row values.
+        escape (bool): Escapes every row value (default: True).
+
+    Returns:
+        str: Table row
+    """
+    table_row = "|"
+
+    for row_value in row_values:
+        row_value_raw = row_value
+
+        if escape is True:
+            row_value_raw = markdown_escape(row_value)
+
+        # Replace every LF with a HTML <br>.
+        row_value_raw = row_value_raw.replace("\n", "<br>")
+
+        table_row += f" {row_value_raw} |"
+
+    table_row += "\n"
+
+    return table_row
+
+def rst_append_table_row(row_values: List[str], max_widths: List[int], escape: bool = True) -> str:
+    """
+    Append a row to a reStructuredText table in grid format.
+
+    Args:
+        row_values ([str]): List of row values.
+        max_widths ([int]): List of maximum widths for each column.
+        escape (bool): Escapes every row value (default: True).
+
+    Returns:
+        str: Table row
+    """
+    if escape:
+        row_values = [rst_escape(value) for value in row_values]
+
+    # Split each cell value into lines.
+    split_values = [value.split('\n') for value in row_values]
+    max_lines = max(len(lines) for lines in split_values)
+
+    # Create the row with multi-line support.
+    table_row = ""
+    for line_idx in range(max_lines):
+        table_row += "    |"
+        for col_idx, lines in enumerate(split_values):
+            if line_idx < len(lines):
+                table_row += f" {lines[line_idx].ljust(max_widths[col_idx])} "
+            else:
+                table_row += " " * (max_widths[col_idx] + 2)
+            table_row += "|"
+        table_row += "\n"
+
+    # Create the separator row.
+    separator_row = "    +" + "+".join(["-" * (width + 2) for width in max_widths]) + "+\n"
+
+    return table_row + separator_row
+
+# Main *************************************************************************
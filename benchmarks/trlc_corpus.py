@@ -0,0 +1,297 @@
+"""Generator of synthetic TRLC corpora for the benchmarks.
+
+    Run it from the repository root to write a corpus into a folder:
+        python benchmarks/trlc_corpus.py -o out/corpus
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import argparse
+import os
+import random
+import sys
+from typing import List
+
+# Variables ********************************************************************
+
+# Words the generated descriptions consist of, including characters which are escaped.
+SAMPLE_WORDS = [
+    "The", "software", "shall", "convert", "every", "record", "into", "a", "table", "row",
+    "with", "its", "attributes", "and", "references", "(see", "chapter)", "*important*",
+    "e.g.", "[optional]", "<value>", "#1", "a_b", "x+y", "10-20", "done!", "`code`", "a|b"
+]
+
+# Default corpus size, about 20000 records.
+PACKAGES_DEFAULT = 2
+FILES_DEFAULT = 10
+SECTIONS_DEFAULT = 10
+RECORDS_DEFAULT = 100
+ATTRIBUTES_DEFAULT = 4
+ARRAY_SIZE_DEFAULT = 5
+REFERENCE_DENSITY_DEFAULT = 1.0
+
+# Classes **********************************************************************
+
+class CorpusConfig():
+    """
+    Configuration of a synthetic TRLC corpus.
+    """
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(self,
+                 packages: int = PACKAGES_DEFAULT,
+                 files: int = FILES_DEFAULT,
+                 sections: int = SECTIONS_DEFAULT,
+                 records: int = RECORDS_DEFAULT,
+                 attributes: int = ATTRIBUTES_DEFAULT,
+                 array_size: int = ARRAY_SIZE_DEFAULT,
+                 reference_density: float = REFERENCE_DENSITY_DEFAULT,
+                 seed: int = 0) -> None:
+        """
+        Initializes the corpus configuration.
+
+        Args:
+            packages (int): Number of packages, every package has its own model file.
+            files (int): Number of TRLC files per package.
+            sections (int): Number of sections per TRLC file.
+            records (int): Number of records per section.
+            attributes (int): Number of additional string attributes per record.
+            array_size (int): Number of values in the array attribute of every record.
+            reference_density (float): Average number of references per record.
+            seed (int): Seed of the random generator.
+        """
+        self.packages = packages
+        self.files = files
+        self.sections = sections
+        self.records = records
+        self.attributes = attributes
+        self.array_size = array_size
+        self.reference_density = reference_density
+        self.seed = seed
+
+    def get_record_count(self) -> int:
+        """
+        Get the total number of records in the corpus.
+
+        Returns:
+            int: Number of records
+        """
+        return self.packages * self.files * self.sections * self.records
+
+    def to_dict(self) -> dict:
+        """
+        Get the configuration as dictionary, e.g. for the benchmark results.
+
+        Returns:
+            dict: Configuration
+        """
+        return dict(vars(self))
+
+    @staticmethod
+    def add_arguments(parser: argparse.ArgumentParser) -> None:
+        """
+        Add the configuration as program arguments.
+
+        Args:
+            parser (argparse.ArgumentParser): Program argument parser.
+        """
+        parser.add_argument("--packages", type=int, default=PACKAGES_DEFAULT,
+                            help=f"Number of packages (default: {PACKAGES_DEFAULT}).")
+        parser.add_argument("--files", type=int, default=FILES_DEFAULT,
+                            help=f"Number of TRLC files per package (default: {FILES_DEFAULT}).")
+        parser.add_argument("--sections", type=int, default=SECTIONS_DEFAULT,
+                            help=f"Number of sections per TRLC file (default: {SECTIONS_DEFAULT}).")
+        parser.add_argument("--records", type=int, default=RECORDS_DEFAULT,
+                            help=f"Number of records per section (default: {RECORDS_DEFAULT}).")
+        parser.add_argument("--attributes", type=int, default=ATTRIBUTES_DEFAULT,
+                            help=f"Number of additional string attributes (default: {ATTRIBUTES_DEFAULT}).")
+        parser.add_argument("--array-size", type=int, default=ARRAY_SIZE_DEFAULT,
+                            help=f"Number of values in the array attribute (default: {ARRAY_SIZE_DEFAULT}).")
+        parser.add_argument("--reference-density", type=float, default=REFERENCE_DENSITY_DEFAULT,
+                            help=f"Average number of references per record (default: {REFERENCE_DENSITY_DEFAULT}).")
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator (default: 0).")
+
+    @staticmethod
+    def from_args(args: argparse.Namespace) -> "CorpusConfig":
+        """
+        Create the configuration from the program arguments.
+
+        Args:
+            args (argparse.Namespace): Parsed program arguments.
+
+        Returns:
+            CorpusConfig: Configuration
+        """
+        return CorpusConfig(args.packages, args.files, args.sections, args.records, args.attributes,
+                            args.array_size, args.reference_density, args.seed)
+
+# Functions ********************************************************************
+
+def _create_model(package: str, config: CorpusConfig) -> str:
+    """
+    Create the model (.rsl) of a package.
+
+    Args:
+        package (str): Package name.
+        config (CorpusConfig): Corpus configuration.
+
+    Returns:
+        str: Model file content
+    """
+    lines = [
+        f"package {package}",
+        "",
+        "type Requirement {",
+        "    description String",
+    ]
+
+    for index in range(config.attributes):
+        lines.append(f"    attribute_{index} optional String")
+
+    lines.extend([
+        "    values optional Integer[0 .. *]",
+        "    derived optional Requirement[0 .. *]",
+        "}",
+        ""
+    ])
+
+    return "\n".join(lines)
+
+def _create_text(rng: random.Random, word_count: int) -> str:
+    """
+    Create a random text.
+
+    Args:
+        rng (random.Random): Random generator.
+        word_count (int): Number of words.
+
+    Returns:
+        str: Text
+    """
+    return " ".join(rng.choice(SAMPLE_WORDS) for _ in range(word_count))
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def _create_record(rng: random.Random, name: str, config: CorpusConfig, earlier_names: List[str]) -> List[str]:
+    """
+    Create a record, which references randomly chosen earlier records of the same package.
+
+    Args:
+        rng (random.Random): Random generator.
+        name (str): Record name.
+        config (CorpusConfig): Corpus configuration.
+        earlier_names (List[str]): Names of the earlier records of the same package.
+
+    Returns:
+        List[str]: Lines of the record
+    """
+    lines = [
+        f"        Requirement {name} {{",
+        f"            description = \"{_create_text(rng, 12)}\""
+    ]
+
+    for index in range(config.attributes):
+        lines.append(f"            attribute_{index} = \"{_create_text(rng, 4)}\"")
+
+    if 0 < config.array_size:
+        values = ", ".join(str(rng.randint(0, 1000)) for _ in range(config.array_size))
+        lines.append(f"            values = [{values}]")
+
+    # The fractional part of the density is the probability of one more reference.
+    reference_count = int(config.reference_density)
+    if rng.random() < (config.reference_density - reference_count):
+        reference_count += 1
+
+    reference_count = min(reference_count, len(earlier_names))
+    if 0 < reference_count:
+        lines.append(f"            derived = [{', '.join(rng.sample(earlier_names, reference_count))}]")
+
+    lines.append("        }")
+
+    return lines
+
+def generate_corpus(out_dir: str, config: CorpusConfig) -> List[str]:
+    """
+    Generate a synthetic TRLC corpus into the given folder.
+    The same configuration results always in the same corpus.
+
+    Args:
+        out_dir (str): Output folder, which is created if necessary.
+        config (CorpusConfig): Corpus configuration.
+
+    Returns:
+        List[str]: The generated files.
+    """
+    rng = random.Random(config.seed)
+    file_list = []
+
+    os.makedirs(out_dir, exist_ok=True)
+
+    for package_index in range(config.packages):
+        package = f"Bench{package_index}"
+        earlier_names = []
+
+        file_list.append(os.path.join(out_dir, f"{package.lower()}.rsl"))
+        with open(file_list[-1], "w", encoding="utf-8") as fd:
+            fd.write(_create_model(package, config))
+
+        for file_index in range(config.files):
+            lines = [f"package {package}", ""]
+
+            for section_index in range(config.sections):
+                lines.append(f"section \"Section {file_index}.{section_index}\" {{")
+                section_names = []
+
+                for record_index in range(config.records):
+                    name = f"req_{file_index}_{section_index}_{record_index}"
+                    lines.extend(_create_record(rng, name, config, earlier_names))
+                    section_names.append(name)
+
+                lines.extend(["}", ""])
+                earlier_names.extend(section_names)
+
+            file_list.append(os.path.join(out_dir, f"{package.lower()}_{file_index}.trlc"))
+            with open(file_list[-1], "w", encoding="utf-8") as fd:
+                fd.write("\n".join(lines))
+
+    return file_list
+
+def main() -> int:
+    """
+    Generate a synthetic TRLC corpus.
+
+    Returns:
+        int: Program status
+    """
+    parser = argparse.ArgumentParser(description="Generator of synthetic TRLC corpora.")
+    parser.add_argument("-o", "--out", type=str, required=True, help="Output folder.")
+    CorpusConfig.add_arguments(parser)
+    args = parser.parse_args()
+
+    config = CorpusConfig.from_args(args)
+    file_list = generate_corpus(args.out, config)
+
+    print(f"Generated {len(file_list)} files with {config.get_record_count()} records in {args.out}.")
+
+    return 0
+
+# Main *************************************************************************
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,4 +16,15 @@
 # You should have received a copy of the GNU General Public License along with pyTRLCConverter.
 # If not, see <https://www.gnu.org/licenses/>.
 
-from .version import __version__, __author__, __email__, __repository__, __license__
+from . import version
+
+def __getattr__(name: str) -> str:
+    """Get the tool related information, e.g. __version__, which is loaded on demand.
+
+    Args:
+        name (str): Dunder name of the tool related information.
+
+    Returns:
+        str: Tool related information
+    """
+    return getattr(version, name)
@@ -27,38 +27,109 @@ import inspect
 import os
 import sys
 import argparse
-from typing import Optional
+from typing import List, Optional
+from pyTRLCConverter import version
 from pyTRLCConverter.abstract_converter import AbstractConverter
-from pyTRLCConverter.dump_converter import DumpConverter
+from pyTRLCConverter.converter_registry import DOCX_CONVERTER_DESCRIPTION, DUMP_CONVERTER_DESCRIPTION, \
+    JSON_CONVERTER_DESCRIPTION, MARKDOWN_CONVERTER_DESCRIPTION, RST_CONVERTER_DESCRIPTION, ConverterEntry, \
+    LazyConverterParser, register_converter
 from pyTRLCConverter.item_walker import ItemWalker
+from pyTRLCConverter.multiplex_converter import MultiplexConverter
 from pyTRLCConverter.ret import Ret
-from pyTRLCConverter.version import __license__, __repository__, __version__
-from pyTRLCConverter.trlc_helper import get_trlc_symbols
-from pyTRLCConverter.markdown_converter import MarkdownConverter
-from pyTRLCConverter.docx_converter import DocxConverter
-from pyTRLCConverter.logger import enable_verbose, log_verbose, is_verbose_enabled, log_error
-from pyTRLCConverter.rst_converter import RstConverter
+from pyTRLCConverter.trlc_helper import Symbol_Table, get_trlc_symbols
+from pyTRLCConverter.logger import enable_verbose, log_verbose, is_verbose_enabled, log_error, log_info
+from pyTRLCConverter.parse_cache import ParseCache
+from pyTRLCConverter.snapshot import Snapshot, read_snapshot, write_snapshot
+from pyTRLCConverter.profiler import CATEGORY_PHASE, add_sample, enable_profile, get_elapsed, get_timestamp, \
+    measure, take_samples, write_profile
+from pyTRLCConverter.file_watcher import FileWatcher
 
 # Variables ********************************************************************
 
 PROG_NAME = "pyTRLCConverter"
 PROG_DESC = "A CLI tool to convert TRLC into different formats."
-PROG_COPYRIGHT = "Copyright (c) 2024 - 2025 NewTec GmbH - " + __license__
-PROG_GITHUB = "Find the project on GitHub: " + __repository__
-PROG_EPILOG = PROG_COPYRIGHT + " - " + PROG_GITHUB
+PROG_COPYRIGHT = "Copyright (c) 2024 - 2025 NewTec GmbH"
 
 # List of built-in converters to use or subclass by a project converter.
+# A converter is imported only if its subcommand is chosen.
 BUILD_IN_CONVERTER_LIST = [
-    MarkdownConverter,
-    DocxConverter,
-    DumpConverter,
-    RstConverter
+    ConverterEntry("markdown", MARKDOWN_CONVERTER_DESCRIPTION,
+                   "pyTRLCConverter.markdown_converter", "MarkdownConverter"),
+    ConverterEntry("docx", DOCX_CONVERTER_DESCRIPTION,
+                   "pyTRLCConverter.docx_converter", "DocxConverter"),
+    ConverterEntry("dump", DUMP_CONVERTER_DESCRIPTION,
+                   "pyTRLCConverter.dump_converter", "DumpConverter"),
+    ConverterEntry("rst", RST_CONVERTER_DESCRIPTION,
+                   "pyTRLCConverter.rst_converter", "RstConverter"),
+    ConverterEntry("json", JSON_CONVERTER_DESCRIPTION,
+                   "pyTRLCConverter.json_converter", "JsonConverter")
 ]
 
+# Separates the subcommands of several converters, which convert in one walk.
+CONVERTER_SEPARATOR = "+"
+
 # Classes **********************************************************************
 
+class _ProgramArgumentParser(argparse.ArgumentParser):
+    # lobster-trace: SwRequirements.sw_req_cli_lazy_loading
+    """
+    Program argument parser, which loads the tool related information for the epilog
+    only if the help is shown.
+    """
+
+    def format_help(self) -> str:
+        """
+        Format the help with the copyright and repository as epilog.
+
+        Returns:
+            str: Help
+        """
+        if self.epilog is None:
+            self.epilog = PROG_COPYRIGHT + " - " + version.__license__ + \
+                " - Find the project on GitHub: " + version.__repository__
+
+        return super().format_help()
+
+class _VersionAction(argparse.Action):
+    # lobster-trace: SwRequirements.sw_req_cli_version
+    """
+    Prints the program version and exits, like the argparse version action does.
+    The version is loaded only if this action is taken.
+    """
+
+    def __init__(self, option_strings: list, dest: str = argparse.SUPPRESS, default: any = argparse.SUPPRESS,
+                 help: str = "show program's version number and exit") -> None: # pylint: disable=redefined-builtin
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser: argparse.ArgumentParser, namespace: any, values: any, option_string: any = None) -> None:
+        print(f"{parser.prog} {version.__version__}")
+        parser.exit()
+
 # Functions ********************************************************************
 
+def _job_count(value: str) -> int:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    """Convert the number of worker processes from the command line.
+
+    Args:
+        value (str): The number of worker processes as string.
+
+    Returns:
+        int: The number of worker processes.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer of at least 1.
+    """
+    try:
+        job_count = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid number of jobs: '{value}'") from e
+
+    if job_count < 1:
+        raise argparse.ArgumentTypeError(f"number of jobs must be at least 1: '{value}'")
+
+    return job_count
+
 def _create_args_parser() -> argparse.ArgumentParser:
     # lobster-trace: SwRequirements.sw_req_cli_help
     """ Creater parser for command line arguments.
@@ -66,15 +137,13 @@ def _create_args_parser() -> argparse.ArgumentParser:
     Returns:
         argparse.ArgumentParser:  The parser object for command line arguments.
     """
-    parser = argparse.ArgumentParser(prog=PROG_NAME,
-                                     description=PROG_DESC,
-                                     epilog=PROG_EPILOG)
+    parser = _ProgramArgumentParser(prog=PROG_NAME,
+                                    description=PROG_DESC)
 
     # lobster-trace: SwRequirements.sw_req_cli_version
     parser.add_argument(
         "--version",
-        action="version",
-        version="%(prog)s " + __version__
+        action=_VersionAction
     )
 
     parser.add_argument(
@@ -96,16 +165,27 @@ def _create_args_parser() -> argparse.ArgumentParser:
         help="Add additional directory which to include on demand. Can be specified several times."
     )
 
+    # The TRLC files are either parsed or a snapshot of already parsed ones is read.
+    source_group = parser.add_mutually_exclusive_group(required=True)
+
     # lobster-trace: SwRequirements.sw_req_cli_source
-    parser.add_argument(
+    source_group.add_argument(
         "-s",
         "--source",
         type=str,
-        required=True,
         action="append",
         help="The path to the TRLC files folder or a single TRLC file."
     )
 
+    # lobster-trace: SwRequirements.sw_req_cli_snapshot
+    source_group.add_argument(
+        "-fs",
+        "--from-snapshot",
+        type=str,
+        default=None,
+        help="Read the parsed TRLC files from the given snapshot file instead of parsing the sources."
+    )
+
     # lobster-trace: SwRequirements.sw_req_cli_exclude
     parser.add_argument(
         "-ex",
@@ -147,6 +227,69 @@ def _create_args_parser() -> argparse.ArgumentParser:
         help="Requirement attribute translation JSON file."
     )
 
+    # lobster-trace: SwRequirements.sw_req_cli_language
+    parser.add_argument(
+        "-la",
+        "--language",
+        type=str,
+        default=None,
+        required=False,
+        help="Language to use of a translation file with several languages (default = the first one)."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+    parser.add_argument(
+        "-cd",
+        "--cache-dir",
+        type=str,
+        default=None,
+        required=False,
+        help="Folder where to cache the parsed TRLC files and the generated diagrams. " \
+             "Unchanged ones will not be processed again."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_snapshot
+    parser.add_argument(
+        "-ts",
+        "--to-snapshot",
+        type=str,
+        default=None,
+        required=False,
+        help="Write a snapshot of the parsed TRLC files to the given file, which can be converted " \
+             "by further runs with --from-snapshot."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_watch
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        required=False,
+        default=False,
+        help="Keep running and convert again whenever a TRLC file in the source or include folders changes."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_job_count,
+        default=1,
+        required=False,
+        help="Number of worker processes which convert the TRLC files in parallel, " \
+             "if supported by the converter (default: 1)."
+    )
+
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        required=False,
+        help="Record the wall and CPU time of every conversion phase and write it to the given JSON file. " \
+             "A human-readable summary is written beside it as text file."
+    )
+
     return parser
 
 def main() -> int:
@@ -159,12 +302,23 @@ def main() -> int:
     """
     ret_status = Ret.OK
 
+    # The profiler is enabled by a program argument, therefore the phases until the
+    # program arguments are parsed, are measured in advance.
+    timestamp = get_timestamp()
+
     # Create program arguments parser.
     args_parser = _create_args_parser()
-    args_sub_parser = args_parser.add_subparsers(required='True')
+    # lobster-trace: SwRequirements.sw_req_cli_multiple_converters
+    args_sub_parser = args_parser.add_subparsers(
+        required='True',
+        parser_class=LazyConverterParser,
+        help=f"The converter. Several converters separated by '{CONVERTER_SEPARATOR}' convert in one walk, " \
+             "each into a sub folder of the output path, named by its subcommand."
+    )
 
     # Check if a project specific converter is given and load it.
     project_converter = None
+    project_timestamp = get_timestamp()
 
     try:
         project_converter = _get_project_converter()
@@ -172,6 +326,8 @@ def main() -> int:
         log_error(exc)
         ret_status = Ret.ERROR
 
+    project_elapsed = get_elapsed(project_timestamp)
+
     if ret_status == Ret.OK:
 
         project_converter_cmd = None
@@ -180,20 +336,36 @@ def main() -> int:
             project_converter.register(args_sub_parser)
             project_converter_cmd = project_converter.get_subcommand()
 
-        # Load the built-in converters unless a project converter is replacing built-in.
+        # Register the built-in converters unless a project converter is replacing built-in.
         # lobster-trace: SwRequirements.sw_req_no_prj_spec
-        for converter in BUILD_IN_CONVERTER_LIST:
-            if converter.get_subcommand() != project_converter_cmd:
-                converter.register(args_sub_parser)
+        # lobster-trace: SwRequirements.sw_req_cli_lazy_loading
+        for converter_entry in BUILD_IN_CONVERTER_LIST:
+            if converter_entry.get_subcommand() != project_converter_cmd:
+                register_converter(args_sub_parser, converter_entry)
 
-        args = args_parser.parse_args()
+        # lobster-trace: SwRequirements.sw_req_cli_multiple_converters
+        argv_list = _split_converter_arguments(sys.argv[1:])
+        args = args_parser.parse_args(argv_list[0])
 
         if args is None:
             ret_status = Ret.ERROR
 
         else:
+            converter_args_list = _get_converter_args_list(args_parser, args_sub_parser, args, argv_list[1:])
+
             enable_verbose(args.verbose)
 
+            # lobster-trace: SwRequirements.sw_req_cli_profile
+            if args.profile is not None:
+                arguments_elapsed = get_elapsed(timestamp)
+
+                take_samples()
+                enable_profile(True)
+                add_sample(CATEGORY_PHASE, "arguments",
+                           arguments_elapsed[0] - project_elapsed[0],
+                           arguments_elapsed[1] - project_elapsed[1])
+                add_sample(CATEGORY_PHASE, "project_import", *project_elapsed)
+
             # In verbose mode print all program arguments.
             if is_verbose_enabled() is True:
                 log_verbose("Program arguments: ")
@@ -202,27 +374,243 @@ def main() -> int:
                     log_verbose(f"* {arg} = {vars(args)[arg]}")
                 log_verbose("\n")
 
-            # lobster-trace: SwRequirements.sw_req_process_trlc_symbols
-            symbols = get_trlc_symbols(args.source, args.include)
+            parse_cache = None
+
+            # In watch mode the last symbol table is kept in memory, even without a cache folder.
+            if (args.cache_dir is not None) or (args.watch is True):
+                parse_cache = ParseCache(args.cache_dir)
 
-            if symbols is None:
-                log_error(f"No items found at {args.source}.")
-                ret_status = Ret.ERROR
+            if args.watch is True:
+                if args.from_snapshot is not None:
+                    log_error("A snapshot can't be watched for changes.")
+                    ret_status = Ret.ERROR
+                else:
+                    ret_status = _watch(args, converter_args_list, parse_cache)
             else:
+                ret_status = _convert(args, converter_args_list, parse_cache)
+
+            # lobster-trace: SwRequirements.sw_req_cli_profile
+            if args.profile is not None:
+                add_sample(CATEGORY_PHASE, "total", *get_elapsed(timestamp))
+
                 try:
-                    _create_out_folder(args.out)
+                    summary_file_name = write_profile(args.profile)
+                    log_verbose(f"Profile written to {args.profile} and {summary_file_name}.")
+                except OSError as exc:
+                    log_error(f"Failed to write profile: {exc}")
+                    ret_status = Ret.ERROR
+
+                enable_profile(False)
+                take_samples()
 
-                    # Feed the items into the given converter.
-                    log_verbose(
-                        f"Using converter {args.converter_class.__name__}: {args.converter_class.get_description()}")
-                    converter = args.converter_class(args)
+    return ret_status
 
-                    walker = ItemWalker(args, converter)
-                    ret_status = walker.walk_symbols(symbols)
+def _split_converter_arguments(argv: List[str]) -> List[List[str]]:
+    # lobster-trace: SwRequirements.sw_req_cli_multiple_converters
+    """Split the program arguments at the converter separators.
 
-                except (FileNotFoundError, OSError) as exc:
-                    log_error(exc)
-                    ret_status = Ret.ERROR
+    Args:
+        argv (List[str]): The program arguments without the program name.
+
+    Returns:
+        List[List[str]]: The program arguments with the first converter, followed by
+            the subcommand and arguments of every further converter.
+    """
+    argv_list = [[]]
+
+    for argument in argv:
+        if argument == CONVERTER_SEPARATOR:
+            argv_list.append([])
+        else:
+            argv_list[-1].append(argument)
+
+    return argv_list
+
+def _get_converter_args_list(args_parser: argparse.ArgumentParser,
+                             args_sub_parser: any,
+                             args: any,
+                             converter_argv_list: List[List[str]]) -> List[any]:
+    # lobster-trace: SwRequirements.sw_req_cli_multiple_converters
+    """Get the arguments of every converter. They consist of the program arguments and the
+    converter specific arguments. If several converters are given, each one writes into a
+    sub folder of the output path, named by its subcommand.
+
+    Args:
+        args_parser (argparse.ArgumentParser): The program argument parser, used to report errors.
+        args_sub_parser (any): The sub parsers of the converters.
+        args (any): The parsed program arguments with the ones of the first converter.
+        converter_argv_list (List[List[str]]): The subcommand and arguments of every further converter.
+
+    Returns:
+        List[any]: The arguments per converter.
+    """
+    converter_args_list = [args]
+
+    if 0 < len(converter_argv_list):
+        subcommand = args.converter_class.get_subcommand()
+        subcommand_list = [subcommand]
+
+        # The program arguments without the ones of the first converter are shared by all converters.
+        argument_names = args_sub_parser.choices[subcommand].get_argument_names()
+        program_args_dict = {name: value for name, value in vars(args).items() if name not in argument_names}
+
+        converter_args_list = [argparse.Namespace(**vars(args))]
+
+        for converter_argv in converter_argv_list:
+            if (0 == len(converter_argv)) or (converter_argv[0] not in args_sub_parser.choices):
+                args_parser.error(f"a converter subcommand is required after '{CONVERTER_SEPARATOR}', " \
+                                  f"choose from {', '.join(args_sub_parser.choices)}")
+
+            if converter_argv[0] in subcommand_list:
+                args_parser.error(f"the converter {converter_argv[0]} is given more than once")
+
+            subcommand_list.append(converter_argv[0])
+            converter_args = argparse.Namespace(**program_args_dict)
+            vars(converter_args).update(vars(args_sub_parser.choices[converter_argv[0]].parse_args(converter_argv[1:])))
+            converter_args_list.append(converter_args)
+
+        for converter_args, subcommand in zip(converter_args_list, subcommand_list):
+            converter_args.out = os.path.join(args.out, subcommand)
+
+    return converter_args_list
+
+def _convert(args: any, converter_args_list: List[any], parse_cache: Optional[ParseCache]) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_process_trlc_symbols
+    """Parse the TRLC files or read them from a snapshot and convert them with the selected converters.
+
+    Args:
+        args (any): The parsed program arguments.
+        converter_args_list (List[any]): The arguments per converter, see _get_converter_args_list().
+        parse_cache (Optional[ParseCache]): Cache for the parsed TRLC files or None.
+
+    Returns:
+        Ret: Status
+    """
+    ret_status = Ret.OK
+
+    # lobster-trace: SwRequirements.sw_req_cli_snapshot
+    if args.from_snapshot is not None:
+        symbols = _read_snapshot(args)
+
+    else:
+        with measure(CATEGORY_PHASE, "parse"):
+            symbols = get_trlc_symbols(args.source, args.include, parse_cache, args.exclude)
+
+        if parse_cache is not None:
+            log_verbose(f"Parse cache: {parse_cache.get_hits()} hit(s), {parse_cache.get_misses()} miss(es).")
+
+        if symbols is None:
+            log_error(f"No items found at {args.source}.")
+
+    if symbols is None:
+        ret_status = Ret.ERROR
+
+    # lobster-trace: SwRequirements.sw_req_cli_snapshot
+    elif args.to_snapshot is not None:
+        with measure(CATEGORY_PHASE, "snapshot_write"):
+            ret_status = write_snapshot(args.to_snapshot, Snapshot(symbols, args.source, args.include))
+
+    if ret_status == Ret.OK:
+        try:
+            converter_list = []
+
+            for converter_args in converter_args_list:
+                _create_out_folder(converter_args.out)
+
+                log_verbose(f"Using converter {converter_args.converter_class.__name__}: " \
+                            f"{converter_args.converter_class.get_description()}")
+                converter_list.append(converter_args.converter_class(converter_args))
+
+            # Feed the items into the given converter or pass them to all given converters.
+            # lobster-trace: SwRequirements.sw_req_cli_multiple_converters
+            if 1 == len(converter_list):
+                converter = converter_list[0]
+            else:
+                converter = MultiplexConverter(converter_list)
+
+            walker = ItemWalker(args, converter)
+
+            with measure(CATEGORY_PHASE, "walk"):
+                ret_status = walker.walk_symbols(symbols)
+
+        except (FileNotFoundError, OSError) as exc:
+            log_error(exc)
+            ret_status = Ret.ERROR
+
+    return ret_status
+
+def _read_snapshot(args: any) -> Optional[Symbol_Table]:
+    # lobster-trace: SwRequirements.sw_req_cli_snapshot
+    """Read the symbol table from the snapshot given by the program arguments.
+    The source and include paths are taken from the snapshot, because converters
+    may use them to locate further files.
+
+    Args:
+        args (any): The parsed program arguments.
+
+    Returns:
+        Optional[Symbol_Table]: The TRLC symbol table or None if the snapshot can't be read.
+    """
+    symbols = None
+
+    with measure(CATEGORY_PHASE, "snapshot_read"):
+        snapshot = read_snapshot(args.from_snapshot)
+
+    if snapshot is not None:
+        symbols = snapshot.symbol_table
+        args.source = snapshot.source_items
+        args.include = snapshot.includes
+
+    return symbols
+
+def _watch(args: any, converter_args_list: List[any], parse_cache: ParseCache) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_watch
+    """Convert and watch the source and include folders to convert again on every change.
+    The converter classes and the project specific converter stay loaded. Every change
+    parses the whole model again, because the parse cache key covers all TRLC files.
+    If the converter supports the incremental mode, it is enabled to convert only the
+    outdated files.
+
+    Args:
+        args (any): The parsed program arguments.
+        converter_args_list (List[any]): The arguments per converter, see _get_converter_args_list().
+        parse_cache (ParseCache): Cache for the parsed TRLC files.
+
+    Returns:
+        Ret: Status of the last conversion.
+    """
+    watched_paths = list(args.source)
+
+    if args.include is not None:
+        watched_paths.extend(args.include)
+
+    for converter_args in converter_args_list:
+        if hasattr(converter_args, "incremental"):
+            converter_args.incremental = True
+
+    file_watcher = FileWatcher(watched_paths)
+
+    # The first conversion may be interrupted as well.
+    ret_status = Ret.ERROR
+
+    try:
+        ret_status = _convert(args, converter_args_list, parse_cache)
+
+        log_info(f"Watching {', '.join(watched_paths)} for changes. Press Ctrl+C to stop.")
+
+        while True:
+            changed_files = file_watcher.wait_for_changes()
+
+            for file_name in changed_files:
+                log_verbose(f"Changed: {file_name}")
+
+            ret_status = _convert(args, converter_args_list, parse_cache)
+
+            if ret_status != Ret.OK:
+                log_error("Conversion failed, waiting for changes.")
+
+    except KeyboardInterrupt:
+        log_info("Watching stopped.")
 
     return ret_status
 
@@ -22,7 +22,7 @@ Author: Norbert Schulz (norbert.schulz@newtec.de)
 # Imports **********************************************************************
 from abc import ABC, abstractmethod
 from pyTRLCConverter.ret import Ret
-from pyTRLCConverter.trlc_helper import Record_Object
+from pyTRLCConverter.trlc_helper import Record_Object, Symbol_Table
 
 # Variables ********************************************************************
 
@@ -68,6 +68,133 @@ class AbstractConverter(ABC):
         """
         raise NotImplementedError
 
+    def set_symbol_table(self, symbol_table : Symbol_Table) -> None:
+        # lobster-trace: SwRequirements.sw_req_referenced_by
+        """Set the symbol table, which is walked afterwards. Its called before begin().
+        It allows to look up other record objects than the converted one.
+
+        Args:
+            symbol_table (Symbol_Table): The TRLC symbol table.
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def is_file_up_to_date(self, file_name : str) -> bool:
+        """Check whether the output of the given file is up to date.
+        An up to date file is not entered, its conversion is skipped.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            bool: True if the conversion of the file can be skipped, otherwise False.
+        """
+        # pylint: disable=unused-argument
+        return False
+
+    def is_parallel_file_processing_supported(self) -> bool:
+        """Check whether the files can be converted in parallel worker processes.
+        This requires that every file is converted independent of the others,
+        e.g. into its own output file.
+
+        It is opt-in like is_parallel_item_processing_supported(): A built-in converter supports
+        it only for its own class and a derived converter shall override this method to enable it.
+
+        Returns:
+            bool: True if parallel processing is supported, otherwise False.
+        """
+        return False
+
+    def get_file_result(self, file_name : str) -> any:
+        """Get the result of a file conversion, which was done in a worker process.
+        It is passed to merge_file_result() of the converter in the main process.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            any: Picklable file conversion result or None.
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def merge_file_result(self, file_name : str, file_result : any) -> None:
+        """Merge the result of a file conversion, which was done in a worker process.
+
+        Args:
+            file_name (str): File name
+            file_result (any): The file conversion result provided by get_file_result().
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def take_worker_misses(self) -> any:
+        """Take the failed translations of a worker process since the last call.
+        They are passed to merge_worker_misses() of the converter in the main process.
+
+        Returns:
+            any: Picklable failed translations or None.
+        """
+        return None
+
+    def merge_worker_misses(self, misses : any) -> None:
+        """Merge the failed translations of a worker process.
+
+        Args:
+            misses (any): The failed translations provided by take_worker_misses().
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def is_parallel_item_processing_supported(self) -> bool:
+        """Check whether the items can be rendered into fragments in parallel worker processes.
+        This requires that the converter state after begin() doesn't change by
+        converting items, otherwise the fragments would differ from the sequential output.
+
+        It is opt-in: A built-in converter supports it only for its own class, because a derived
+        project converter may keep state in its record handlers. A derived converter, which doesn't,
+        shall override this method to enable it.
+
+        Returns:
+            bool: True if parallel processing is supported, otherwise False.
+        """
+        return False
+
+    def begin_fragment(self) -> None:
+        """Begin to render the following items into a fragment instead of the output.
+        """
+        return None
+
+    def end_fragment(self) -> str:
+        """End to render items into a fragment.
+
+        Returns:
+            str: The rendered fragment.
+        """
+        return ""
+
+    def write_fragment(self, fragment : str) -> Ret:
+        """Write a fragment, which was rendered by a worker process, to the output.
+
+        Args:
+            fragment (str): The fragment provided by end_fragment().
+
+        Returns:
+            Ret: Status
+        """
+        # pylint: disable=unused-argument
+        return Ret.OK
+
+    def finish_background_jobs(self) -> Ret:
+        """Wait until all jobs, which the converter started in the background, are finished.
+        Its called by finish() of the converter, before the output is completed, and by the
+        item walker at the end of every task of a worker process.
+
+        Returns:
+            Ret: Status
+        """
+        return Ret.OK
+
     @abstractmethod
     def convert_section(self, section: str, level: int) -> Ret:
         """ Process the given section item.
@@ -20,13 +20,19 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import hashlib
+import json
+import os
 from enum import Enum
-from typing import Optional
+from typing import Dict, List, Optional
 from pyTRLCConverter.abstract_converter import AbstractConverter
 from pyTRLCConverter.ret import Ret
-from pyTRLCConverter.trlc_helper import Record_Object
+from pyTRLCConverter.trlc_helper import Record_Object, RecordAttributes, Symbol_Table, get_record_references, \
+    get_referenced_by_dict, iter_record_types
 from pyTRLCConverter.translator import Translator
-from pyTRLCConverter.logger import log_error
+from pyTRLCConverter.logger import log_error, log_verbose
+from pyTRLCConverter.output_manifest import OutputManifest
+from pyTRLCConverter.profiler import CATEGORY_RECORD_HANDLER, measure
 
 # Variables ********************************************************************
 
@@ -59,6 +65,9 @@ class BaseConverter(AbstractConverter):
     # Default value used to replace empty attribute values.
     EMPTY_ATTRIBUTE_DEFAULT = "N/A"
 
+    # Attribute name of the record objects, which reference a record object.
+    REFERENCED_BY_ATTRIBUTE_NAME = "Referenced by"
+
     def __init__(self, args: any) -> None:
         """
         Initializes the converter with the given arguments.
@@ -82,6 +91,24 @@ class BaseConverter(AbstractConverter):
         # Requirement type attribute translator.
         self._translator = Translator()
 
+        # Manifest of the generated output files, only used in incremental mode.
+        self._output_manifest = None  # type: Optional[OutputManifest]
+
+        # PlantUML image generator, created on demand.
+        self._plantuml = None
+
+        # The walked symbol table, set before the conversion begins.
+        self._symbol_table = None  # type: Optional[Symbol_Table]
+
+        # The referencing record objects per referenced record object, created on demand.
+        self._referenced_by_dict = None  # type: Optional[dict[Record_Object, List[Record_Object]]]
+
+        # The hash of the references into the record objects per file, created on demand.
+        self._referenced_by_hash_dict = None  # type: Optional[dict[str, str]]
+
+        # The attribute view of the current record object, created on the first attribute access.
+        self._record_attributes = None  # type: Optional[RecordAttributes]
+
     @classmethod
     def register(cls, args_parser: any) -> None:
         """Register converter specific argument parser.
@@ -95,6 +122,17 @@ class BaseConverter(AbstractConverter):
         )
         BaseConverter._parser.set_defaults(converter_class=cls)
 
+    def set_symbol_table(self, symbol_table: Symbol_Table) -> None:
+        # lobster-trace: SwRequirements.sw_req_referenced_by
+        """Set the symbol table, which is walked afterwards. Its called before begin().
+
+        Args:
+            symbol_table (Symbol_Table): The TRLC symbol table.
+        """
+        self._symbol_table = symbol_table
+        self._referenced_by_dict = None
+        self._referenced_by_hash_dict = None
+
     def begin(self) -> Ret:
         """ Begin the conversion process.
 
@@ -104,9 +142,14 @@ class BaseConverter(AbstractConverter):
         result = Ret.OK
 
         if isinstance(self._args.translation, str):
-            if self._translator.load(self._args.translation) is False:
+            if self._translator.load(self._args.translation, getattr(self._args, "language", None)) is False:
                 result = Ret.ERROR
 
+            # lobster-trace: SwRequirements.sw_req_translation_validation
+            # The findings are only reported, the translation file may be shared by several models.
+            elif self._symbol_table is not None:
+                self._translator.validate(iter_record_types(self._symbol_table))
+
         return result
 
     def enter_file(self, file_name: str) -> Ret:
@@ -156,10 +199,17 @@ class BaseConverter(AbstractConverter):
         # Get the record attribute translation dictionary.
         translation = self._translator.get_translation(record.n_typ.name)
 
+        # The current output depends on the files where the record references point into.
+        if self._output_manifest is not None:
+            for record_reference in get_record_references(record):
+                self._output_manifest.add_reference(record_reference.target.location.file_name)
+
         # Check for a specific record handler.
         record_handler = self._record_handler_dict.get(record.n_typ.name)
         if callable(record_handler):
-            result = record_handler(record, level, translation)
+            # lobster-trace: SwRequirements.sw_req_cli_profile
+            with measure(CATEGORY_RECORD_HANDLER, getattr(record_handler, "__qualname__", record.n_typ.name)):
+                result = record_handler(record, level, translation)
 
             # Don't trust project specific handlers to return a valid status.
             if not isinstance(result, Ret):
@@ -172,12 +222,59 @@ class BaseConverter(AbstractConverter):
         else:
             result = Ret.OK
 
+        # Release the attribute view, the record object is converted.
+        self._record_attributes = None
+
         return result
 
+    def take_worker_misses(self) -> Dict[str, int]:
+        # lobster-trace: SwRequirements.sw_req_translation_misses
+        """Take the failed translations of a worker process since the last call.
+
+        Returns:
+            Dict[str, int]: The number of failed translations per requirement type and attribute.
+        """
+        return self._translator.take_misses()
+
+    def merge_worker_misses(self, misses: Dict[str, int]) -> None:
+        # lobster-trace: SwRequirements.sw_req_translation_misses
+        """Merge the failed translations of a worker process, which are reported by finish().
+
+        Args:
+            misses (Dict[str, int]): The failed translations provided by take_worker_misses().
+        """
+        self._translator.merge_misses(misses)
+
     def finish(self):
         """Finish the conversion process.
         """
-        return Ret.OK
+        # lobster-trace: SwRequirements.sw_req_translation_misses
+        self._translator.log_misses()
+
+        return self.finish_background_jobs()
+
+    def finish_background_jobs(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_plantuml_async
+        """Wait until all diagrams, which are generated in the background, are finished.
+        All failed diagrams are reported together.
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        if self._plantuml is not None:
+            errors = self._plantuml.wait_for_jobs()
+
+            if 0 < len(errors):
+                log_error(f"Failed to generate {len(errors)} diagram(s):")
+
+                for error in errors:
+                    log_error(f"* {error}")
+
+                result = Ret.ERROR
+
+        return result
 
     # helpers **************************************************************
 
@@ -196,6 +293,105 @@ class BaseConverter(AbstractConverter):
 
         raise NotImplementedError
 
+    def _get_plantuml(self) -> any:
+        # lobster-trace: SwRequirements.sw_req_plantuml_async
+        """Get the PlantUML image generator, which is shared by all diagrams of the conversion.
+        Use its generate_async() to generate a diagram in the background, finish() waits for it.
+        With a cache folder, the generated images are cached in its "plantuml" sub folder.
+
+        Returns:
+            PlantUML: The PlantUML image generator.
+        """
+        if self._plantuml is None:
+            # Imported on demand, because most conversions don't contain diagrams.
+            from pyTRLCConverter.plantuml import PlantUML  # pylint: disable=import-outside-toplevel
+
+            # lobster-trace: SwRequirements.sw_req_plantuml_cache
+            cache_dir = None
+            if getattr(self._args, "cache_dir", None) is not None:
+                cache_dir = os.path.join(self._args.cache_dir, "plantuml")
+
+            log_verbose("Generate the diagrams in the background.")
+            self._plantuml = PlantUML(cache_dir=cache_dir)
+
+        return self._plantuml
+
+    def _get_referenced_by(self, record: Record_Object) -> List[Record_Object]:
+        # lobster-trace: SwRequirements.sw_req_referenced_by
+        """Get the record objects, which reference the given record object, e.g. for a
+        "Traced by" or "Verified by" column of a project specific record handler.
+        The index of all references is created by walking the symbol table once.
+        In incremental mode, the current output depends on the files of the referencing record objects.
+
+        Args:
+            record (Record_Object): The referenced record object.
+
+        Returns:
+            List[Record_Object]: The referencing record objects in walk order.
+        """
+        referenced_by_list = self._get_referenced_by_dict().get(record, [])
+
+        if self._output_manifest is not None:
+            for referencing_record in referenced_by_list:
+                self._output_manifest.add_reference(referencing_record.location.file_name)
+
+        return referenced_by_list
+
+    def _get_referenced_by_dict(self) -> dict:
+        # lobster-trace: SwRequirements.sw_req_referenced_by
+        """Get the index of all references, which is created on the first call.
+        Create it in begin() to let the worker processes inherit it and to let the
+        incremental mode consider the references into the records of a file.
+
+        Returns:
+            dict[Record_Object, List[Record_Object]]: The referencing record objects per referenced record object.
+        """
+        if self._referenced_by_dict is None:
+            if self._symbol_table is None:
+                self._referenced_by_dict = {}
+            else:
+                self._referenced_by_dict = get_referenced_by_dict(self._symbol_table)
+
+        return self._referenced_by_dict
+
+    def _get_referenced_by_hash(self, file_name: str) -> Optional[str]:
+        # lobster-trace: SwRequirements.sw_req_referenced_by
+        """Get the hash of the references into the record objects of the given file.
+        In incremental mode it is stored in the manifest, because the output of a file which
+        shows its referencing record objects is stale, if a reference is added or removed in
+        another file. It is only available, if the index of all references is created already.
+
+        Args:
+            file_name (str): The normalized name of the TRLC file.
+
+        Returns:
+            Optional[str]: The hash or None if no record object of the file is referenced or
+                the index of all references isn't created.
+        """
+        if (self._referenced_by_hash_dict is None) and (self._referenced_by_dict is not None):
+            reference_dict = {}  # type: dict[str, list]
+
+            for record, referenced_by_list in self._referenced_by_dict.items():
+                record_file_name = os.path.normpath(record.location.file_name)
+                reference_dict.setdefault(record_file_name, []).append([
+                    record.fully_qualified_name(),
+                    [[referencing_record.fully_qualified_name(), referencing_record.location.file_name]
+                     for referencing_record in referenced_by_list]
+                ])
+
+            self._referenced_by_hash_dict = {}
+
+            for record_file_name, reference_list in reference_dict.items():
+                reference_json = json.dumps(sorted(reference_list)).encode("utf-8")
+                self._referenced_by_hash_dict[record_file_name] = hashlib.sha256(reference_json).hexdigest()
+
+        referenced_by_hash = None
+
+        if self._referenced_by_hash_dict is not None:
+            referenced_by_hash = self._referenced_by_hash_dict.get(file_name)
+
+        return referenced_by_hash
+
     def _set_project_record_handler(self, record_type: str, handler: callable) -> None:
         """Set a project specific record handler.
 
@@ -214,7 +410,25 @@ class BaseConverter(AbstractConverter):
         for record_type, handler in handlers.items():
             self._set_project_record_handler(record_type, handler)
 
+    def _get_attributes(self, record: Record_Object) -> RecordAttributes:
+        # lobster-trace: SwRequirements.sw_req_record_attributes
+        """Get the attribute view of the record object. It is shared by all handler calls,
+        therefore every attribute value is converted only once. Only the view of the latest
+        record object is kept and it is released after the record object is converted.
+
+        Args:
+            record (Record_Object): The record object
+
+        Returns:
+            RecordAttributes: The attribute view.
+        """
+        if (self._record_attributes is None) or (self._record_attributes.get_record() is not record):
+            self._record_attributes = RecordAttributes(record)
+
+        return self._record_attributes
+
     def _get_attribute(self, record: Record_Object, attribute_name: str) -> str:
+        # lobster-trace: SwRequirements.sw_req_record_attributes
         """Get the attribute value from the record object.
             If the attribute is not found or empty, return the default value.
 
@@ -225,8 +439,7 @@ class BaseConverter(AbstractConverter):
         Returns:
             str: The attribute value.
         """
-        record_dict = record.to_python_dict()
-        attribute_value = record_dict[attribute_name]
+        attribute_value = self._get_attributes(record).get_value(attribute_name)
 
         if attribute_value is None:
             attribute_value = self._empty_attribute_value
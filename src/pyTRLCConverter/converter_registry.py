@@ -0,0 +1,180 @@
+"""Registry of the converters, which imports a converter only if its subcommand is chosen.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import argparse
+import importlib
+from typing import List, Optional
+
+# Variables ********************************************************************
+
+# Descriptions of the built-in converters. The help shows them without importing the converters,
+# which return them by their get_description() method.
+DOCX_CONVERTER_DESCRIPTION = "Convert into docx format."
+DUMP_CONVERTER_DESCRIPTION = "Dump TRCL item list to console."
+JSON_CONVERTER_DESCRIPTION = "Convert into JSON or NDJSON format."
+MARKDOWN_CONVERTER_DESCRIPTION = "Convert into markdown format."
+RST_CONVERTER_DESCRIPTION = "Convert into reStructuredText format."
+
+# Classes **********************************************************************
+
+class ConverterEntry():
+    # lobster-trace: SwRequirements.sw_req_cli_lazy_loading
+    """
+    Registry entry of a converter with its subcommand and description.
+    The converter class is imported from its module on demand.
+    """
+
+    def __init__(self, subcommand: str, description: str, module_name: str, class_name: str) -> None:
+        """
+        Initializes the registry entry.
+
+        Args:
+            subcommand (str): The subcommand of the converter.
+            description (str): The description of the converter, shown in the help.
+            module_name (str): The module which contains the converter class.
+            class_name (str): The name of the converter class.
+        """
+        self._subcommand = subcommand
+        self._description = description
+        self._module_name = module_name
+        self._class_name = class_name
+        self._converter_class = None
+
+    def get_subcommand(self) -> str:
+        """
+        Get the subcommand of the converter.
+
+        Returns:
+            str: Subcommand
+        """
+        return self._subcommand
+
+    def get_description(self) -> str:
+        """
+        Get the description of the converter.
+
+        Returns:
+            str: Description
+        """
+        return self._description
+
+    def load(self) -> type:
+        """
+        Get the converter class, which is imported on the first call.
+
+        Returns:
+            type: The converter class.
+        """
+        if self._converter_class is None:
+            module = importlib.import_module(self._module_name)
+            self._converter_class = getattr(module, self._class_name)
+
+        return self._converter_class
+
+class LazyConverterParser(argparse.ArgumentParser):
+    # lobster-trace: SwRequirements.sw_req_cli_lazy_loading
+    """
+    Argument parser of a converter subcommand. The converter is imported and registers its
+    arguments not until the subcommand is parsed, which happens only if it was chosen.
+    """
+
+    def __init__(self, *args, converter_entry: Optional[ConverterEntry] = None, **kwargs) -> None:
+        """
+        Initializes the argument parser.
+
+        Args:
+            converter_entry (Optional[ConverterEntry]): The registry entry of the converter. If None,
+                                                        the converter registered its arguments already.
+        """
+        super().__init__(*args, **kwargs)
+        self._converter_entry = converter_entry
+
+    def parse_known_args(self, args: any = None, namespace: any = None) -> any:
+        """
+        Import the converter and let it register its arguments, before parsing them.
+
+        Args:
+            args (any): The arguments to parse.
+            namespace (any): The namespace to fill.
+
+        Returns:
+            any: The namespace and the remaining arguments.
+        """
+        # The arguments are registered once per parser, the entry may be used by several parsers.
+        if self._converter_entry is not None:
+            self._converter_entry.load().register(_SubParserProxy(self))
+            self._converter_entry = None
+
+        return super().parse_known_args(args, namespace)
+
+    def get_argument_names(self) -> List[str]:
+        # lobster-trace: SwRequirements.sw_req_cli_multiple_converters
+        """
+        Get the names of the converter specific arguments in the parsed namespace.
+        The converter shall be registered already, e.g. by parsing its arguments.
+
+        Returns:
+            List[str]: The argument names.
+        """
+        return [action.dest for action in self._actions if action.dest != argparse.SUPPRESS]
+
+class _SubParserProxy():
+    """
+    Passed to the register() method of a converter instead of the sub parsers. It returns
+    the already created argument parser of the subcommand, where the converter adds its arguments.
+    """
+
+    def __init__(self, parser: LazyConverterParser) -> None:
+        """
+        Initializes the proxy.
+
+        Args:
+            parser (LazyConverterParser): The argument parser of the subcommand.
+        """
+        self._parser = parser
+
+    def add_parser(self, *_args, **_kwargs) -> LazyConverterParser:
+        """
+        Get the argument parser of the subcommand.
+
+        Returns:
+            LazyConverterParser: The argument parser of the subcommand.
+        """
+        return self._parser
+
+# Functions ********************************************************************
+
+def register_converter(args_sub_parser: any, converter_entry: ConverterEntry) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_lazy_loading
+    """
+    Register the subcommand of a converter without importing it.
+    The sub parsers shall be created with the LazyConverterParser as parser class.
+
+    Args:
+        args_sub_parser (any): The sub parsers of the program argument parser.
+        converter_entry (ConverterEntry): The registry entry of the converter.
+    """
+    args_sub_parser.add_parser(converter_entry.get_subcommand(),
+                               help=converter_entry.get_description(),
+                               converter_entry=converter_entry)
+
+# Main *************************************************************************
@@ -20,16 +20,28 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import copy
+import io
 import os
-from typing import Optional
+import re
+from typing import List, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
 import docx
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Emu, Inches
 from pyTRLCConverter.base_converter import BaseConverter
-from pyTRLCConverter.logger import log_verbose
+from pyTRLCConverter.logger import log_verbose, log_error
 from pyTRLCConverter.ret import Ret
 from pyTRLCConverter.trlc_helper import Record_Object
+from pyTRLCConverter.converter_registry import DOCX_CONVERTER_DESCRIPTION
 
 # Variables ********************************************************************
 
+# Splits a text into the characters, which are not written as text by a run, and the text between.
+_RUN_CONTENT_SPLIT_PATTERN = re.compile(r"([\t\r\n])")
+
 # Classes **********************************************************************
 
 class DocxConverter(BaseConverter):
@@ -51,14 +63,26 @@ class DocxConverter(BaseConverter):
         """
         super().__init__(args)
 
+        # The template file content. Its loaded once and every document is created from it.
+        self._template = None
+
         if args.template is not None:
             log_verbose(f"Loading template file {args.template}.")
 
-        self._docx = docx.Document(docx=args.template)
+            with open(args.template, "rb") as fd:
+                self._template = fd.read()
 
-        # Ensure default table style is present in the document.
-        if not 'Table Grid' in self._docx.styles:
-            self._docx.styles.add_style('Table Grid', docx.enum.style.WD_STYLE_TYPE.TABLE, builtin=True)
+        # The document parsed from the template. In multiple document mode every document is a copy of it.
+        self._template_document = None
+
+        # Style ids by style name. Resolving a style name by python-docx is expensive.
+        self._style_ids = {}
+
+        # In multiple document mode the document of a TRLC file is created when the file is entered.
+        self._docx = None
+
+        if self._is_multiple_document_mode() is False:
+            self._docx = self._create_document()
 
     @staticmethod
     def get_subcommand() -> str:
@@ -78,7 +102,7 @@ class DocxConverter(BaseConverter):
         Returns:
             Ret: Status
         """
-        return "Convert into docx format."
+        return DOCX_CONVERTER_DESCRIPTION
 
     @classmethod
     def register(cls, args_parser: any) -> None:
@@ -105,9 +129,76 @@ class DocxConverter(BaseConverter):
             default=DocxConverter.OUTPUT_FILE_NAME_DEFAULT,
             required=False,
             help="Name of the generated output file inside the output folder " \
-                f"(default = {DocxConverter.OUTPUT_FILE_NAME_DEFAULT})."
+                f"(default = {DocxConverter.OUTPUT_FILE_NAME_DEFAULT}) in " \
+                "case a single document is generated."
+        )
+
+        # lobster-trace: SwRequirements.sw_req_docx_multiple_doc_mode
+        BaseConverter._parser.add_argument(
+            "-md",
+            "--multiple-document",
+            action="store_true",
+            required=False,
+            default=False,
+            help="Generate a docx file per TRLC file instead of a single document. " \
+                "The default is to generate a single document."
         )
 
+    def is_parallel_file_processing_supported(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_docx_multiple_doc_mode
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Check whether the files can be converted in parallel worker processes.
+        This is the case in multiple document mode, because every TRLC file is
+        converted into its own docx file. A derived converter shall enable it explicitly,
+        see AbstractConverter.
+
+        Returns:
+            bool: True if parallel processing is supported, otherwise False.
+        """
+        return (type(self) is DocxConverter) and (self._is_multiple_document_mode() is True)
+
+    def enter_file(self, file_name: str) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_docx_multiple_doc_mode
+        """
+        Enter a file.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            Ret: Status
+        """
+        # Multiple document mode?
+        if self._is_multiple_document_mode() is True:
+            assert self._docx is None
+
+            self._docx = self._create_document()
+
+        return Ret.OK
+
+    def leave_file(self, file_name: str) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_docx_multiple_doc_mode
+        """
+        Leave a file.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        # Multiple document mode?
+        if self._is_multiple_document_mode() is True:
+            assert self._docx is not None
+
+            file_name_docx = os.path.splitext(os.path.basename(file_name))[0] + ".docx"
+            result = self._save_document(file_name_docx)
+
+        return result
+
     def convert_section(self, section: str, level: int) -> Ret:
         # lobster-trace: SwRequirements.sw_req_docx_section
         """Process the given section item.
@@ -119,7 +210,7 @@ class DocxConverter(BaseConverter):
         Returns:
             Ret: Status
         """
-        self._docx.add_heading(section, level)
+        self._add_xml(self._get_heading_xml(section, level))
 
         return Ret.OK
 
@@ -150,17 +241,101 @@ class DocxConverter(BaseConverter):
         Returns:
             Ret: Status
         """
-        result = Ret.ERROR
+        # lobster-trace: SwRequirements.sw_req_translation_misses
+        self._translator.log_misses()
+
+        # lobster-trace: SwRequirements.sw_req_plantuml_async
+        # The diagrams shall be generated, before the document is saved.
+        result = self.finish_background_jobs()
 
-        if self._docx is not None:
-            output_file_name = self._args.name
-            if 0 < len(self._args.out):
-                output_file_name = os.path.join(self._args.out, self._args.name)
+        # In multiple document mode the documents are saved when their file is left.
+        if self._is_multiple_document_mode() is False:
+            if self._docx is None:
+                result = Ret.ERROR
 
-            log_verbose(f"Writing docx {output_file_name}.")
-            self._docx.save(output_file_name)
-            self._docx = None
-            result = Ret.OK
+            elif self._save_document(self._args.name) != Ret.OK:
+                result = Ret.ERROR
+
+        return result
+
+    def _is_multiple_document_mode(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_docx_multiple_doc_mode
+        """
+        Check whether a docx file per TRLC file is generated.
+
+        Returns:
+            bool: True in multiple document mode, otherwise False.
+        """
+        return getattr(self._args, "multiple_document", False) is True
+
+    def _create_document(self) -> docx.document.Document:
+        # lobster-trace: SwRequirements.sw_req_docx_template
+        """
+        Create a document from the template or the default template.
+        In multiple document mode the template is parsed only once and every document
+        is a deep copy of it, which is faster than parsing it again.
+
+        Returns:
+            docx.document.Document: The document.
+        """
+        if self._is_multiple_document_mode() is False:
+            document = self._load_template()
+
+        else:
+            if self._template_document is None:
+                self._template_document = self._load_template()
+
+            document = copy.deepcopy(self._template_document)
+
+        return document
+
+    def _load_template(self) -> docx.document.Document:
+        # lobster-trace: SwRequirements.sw_req_docx_template
+        """
+        Parse the template or the default template.
+
+        Returns:
+            docx.document.Document: The document with the template content.
+        """
+        template = None
+
+        if self._template is not None:
+            template = io.BytesIO(self._template)
+
+        document = docx.Document(docx=template)
+
+        # Ensure default table style is present in the document.
+        if not 'Table Grid' in document.styles:
+            document.styles.add_style('Table Grid', docx.enum.style.WD_STYLE_TYPE.TABLE, builtin=True)
+
+        return document
+
+    def _save_document(self, file_name: str) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_docx_file
+        """
+        Save the document into the output folder and release it.
+
+        Args:
+            file_name (str): The output file name without path.
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+        file_name_with_path = file_name
+
+        if 0 < len(self._args.out):
+            file_name_with_path = os.path.join(self._args.out, file_name)
+
+        log_verbose(f"Writing docx {file_name_with_path}.")
+
+        try:
+            self._docx.save(file_name_with_path)
+        except IOError as e:
+            log_error(f"Failed to write file {file_name_with_path}: {e}")
+            result = Ret.ERROR
+
+        self._docx = None
 
         return result
 
@@ -178,38 +353,211 @@ class DocxConverter(BaseConverter):
         Returns:
             Ret: Status
         """
-        self._docx.add_heading(f"{record.name} ({record.n_typ.name})", level + 1)
         attributes = record.to_python_dict()
 
-        table = self._docx.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        table.autofit = True
-
         # Set table headers
-        header_cells = table.rows[0].cells
-        header_cells[0].text = "Element"
-        header_cells[1].text = "Value"
+        rows = [("Element", "Value")]
 
         # Populate table with attribute key-value pairs
         for key, value in attributes.items():
             if value is None:
                 value = self._empty_attribute_value
 
-            if translation is not None:
-                if key in translation:
-                    key = translation[key]
+            if (translation is not None) and (key in translation):
+                key = translation[key]
+            else:
+                # lobster-trace: SwRequirements.sw_req_translation_misses
+                self._translator.count_misses(record.n_typ.name, [key])
+
+            rows.append((key, str(value)))
+
+        heading = f"{record.name} ({record.n_typ.name})"
+        location = f"from {record.location.file_name}:{record.location.line_no}"
+
+        # The heading, the table and the paragraph with the record object location are
+        # generated as XML and added in one step, which is much faster than by the python-docx API.
+        # If a derived converter customizes the record table, the python-docx API is used.
+        if type(self)._add_record_table is DocxConverter._add_record_table:
+            self._add_xml(
+                self._get_heading_xml(heading, level + 1) +
+                self._get_table_xml(rows) +
+                f"<w:p><w:r><w:rPr><w:i/></w:rPr>{_get_run_content_xml(location)}</w:r></w:p>"
+            )
+
+        else:
+            self._docx.add_heading(heading, level + 1)
+            self._add_record_table(rows)
+
+            paragraph = self._docx.add_paragraph()
+            paragraph.add_run(location).italic = True
+
+        return Ret.OK
+
+    def _add_record_table(self, rows: List[Tuple[str, str]]) -> None:
+        # lobster-trace: SwRequirements.sw_req_docx_record
+        """
+        Add the record table with two columns in the 'Table Grid' style by the python-docx API.
+        The built-in converter generates the same table as XML instead, see _get_table_xml().
+        A derived converter may override this method to customize the record table, then
+        the records are added by the python-docx API.
+
+        Args:
+            rows (List[Tuple[str, str]]): The texts of the cells per row, the first row is the table head.
+        """
+        table = self._docx.add_table(rows=1, cols=2)
+        table.style = 'Table Grid'
+        table.autofit = True
+
+        header_cells = table.rows[0].cells
+        header_cells[0].text = rows[0][0]
+        header_cells[1].text = rows[0][1]
 
+        for key, value in rows[1:]:
             cells = table.add_row().cells
             cells[0].text = key
-            cells[1].text = str(value)
+            cells[1].text = value
 
-        # Add a paragraph with the record object location
-        p = self._docx.add_paragraph()
-        p.add_run(f"from {record.location.file_name}:{record.location.line_no}").italic = True
+    def _get_style_id(self, style_name: str, style_type: WD_STYLE_TYPE) -> Optional[str]:
+        # lobster-trace: SwRequirements.sw_req_docx_record
+        """
+        Get the style id of the given style name, like python-docx does, but resolved only once.
 
-        return Ret.OK
+        Args:
+            style_name (str): The style name, e.g. 'Heading 1'.
+            style_type (WD_STYLE_TYPE): The style type.
+
+        Returns:
+            Optional[str]: The style id or None if it is the default style.
+        """
+        if style_name not in self._style_ids:
+            self._style_ids[style_name] = self._docx.part.get_style_id(style_name, style_type)
+
+        return self._style_ids[style_name]
+
+    def _get_heading_xml(self, text: str, level: int) -> str:
+        # lobster-trace: SwRequirements.sw_req_docx_section
+        # lobster-trace: SwRequirements.sw_req_docx_record
+        """
+        Get the XML of a heading paragraph, like python-docx Document.add_heading() creates it.
+
+        Args:
+            text (str): The heading text.
+            level (int): The heading level, 0 for the title.
+
+        Raises:
+            ValueError: Invalid heading level.
+
+        Returns:
+            str: The paragraph XML.
+        """
+        if not 0 <= level <= 9:
+            raise ValueError(f"level must be in range 0-9, got {level}")
+
+        style_name = "Title" if level == 0 else f"Heading {level}"
+        style_id = self._get_style_id(style_name, WD_STYLE_TYPE.PARAGRAPH)
+        paragraph_xml = "<w:p>"
+
+        if style_id is not None:
+            paragraph_xml += f"<w:pPr><w:pStyle w:val={quoteattr(style_id)}/></w:pPr>"
+
+        if 0 < len(text):
+            paragraph_xml += f"<w:r>{_get_run_content_xml(text)}</w:r>"
+
+        return paragraph_xml + "</w:p>"
+
+    def _get_table_xml(self, rows: List[Tuple[str, str]]) -> str:
+        # lobster-trace: SwRequirements.sw_req_docx_record
+        """
+        Get the XML of a table with two columns in the 'Table Grid' style, like python-docx
+        creates it by Document.add_table() and setting the cell texts.
+
+        Args:
+            rows (List[Tuple[str, str]]): The texts of the cells per row.
+
+        Returns:
+            str: The table XML.
+        """
+        # The columns share the width between the margins of the last section.
+        section = self._docx.sections[-1]
+        block_width = (section.page_width or Inches(8.5)) - \
+            (section.left_margin or Inches(1)) - (section.right_margin or Inches(1))
+        column_width = Emu(block_width // 2).twips
+        style_id = self._get_style_id("Table Grid", WD_STYLE_TYPE.TABLE)
+
+        table_xml = "<w:tbl><w:tblPr>"
+
+        if style_id is not None:
+            table_xml += f"<w:tblStyle w:val={quoteattr(style_id)}/>"
+
+        table_xml += "<w:tblW w:type=\"auto\" w:w=\"0\"/><w:tblLayout w:type=\"autofit\"/>" \
+            "<w:tblLook w:firstColumn=\"1\" w:firstRow=\"1\" w:lastColumn=\"0\" w:lastRow=\"0\" " \
+            "w:noHBand=\"0\" w:noVBand=\"1\" w:val=\"04A0\"/></w:tblPr>" \
+            f"<w:tblGrid><w:gridCol w:w=\"{column_width}\"/><w:gridCol w:w=\"{column_width}\"/></w:tblGrid>"
+
+        cell_begin_xml = f"<w:tc><w:tcPr><w:tcW w:type=\"dxa\" w:w=\"{column_width}\"/></w:tcPr><w:p><w:r>"
+        cell_end_xml = "</w:r></w:p></w:tc>"
+
+        for row in rows:
+            table_xml += "<w:tr>"
+
+            for text in row:
+                table_xml += cell_begin_xml + _get_run_content_xml(text) + cell_end_xml
+
+            table_xml += "</w:tr>"
+
+        return table_xml + "</w:tbl>"
+
+    def _add_xml(self, block_xml: str) -> None:
+        # lobster-trace: SwRequirements.sw_req_docx_record
+        """
+        Add the given paragraphs and tables at the end of the document body.
+
+        Args:
+            block_xml (str): The XML of the paragraphs and tables.
+        """
+        body = self._docx.element.body
+        fragment = parse_xml(f"<w:body {nsdecls('w')}>{block_xml}</w:body>")
+
+        # The section properties are the last element of the body, if available.
+        anchor = None
+        if (0 < len(body)) and (body[-1].tag == qn("w:sectPr")):
+            anchor = body[-1]
+
+        for element in list(fragment):
+            if anchor is None:
+                body.append(element)
+            else:
+                anchor.addprevious(element)
 
 
 # Functions ********************************************************************
 
+def _get_run_content_xml(text: str) -> str:
+    # lobster-trace: SwRequirements.sw_req_docx_record
+    """
+    Get the XML of the run content for the given text, like python-docx creates it by setting
+    the run text. Tabs become tab elements, line feeds and carriage returns become line breaks.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        str: The run content XML.
+    """
+    content_xml = ""
+
+    for part in _RUN_CONTENT_SPLIT_PATTERN.split(text):
+        if part == "\t":
+            content_xml += "<w:tab/>"
+        elif part in ("\r", "\n"):
+            content_xml += "<w:br/>"
+        elif 0 < len(part):
+            # Leading and trailing whitespace shall be kept.
+            if len(part.strip()) < len(part):
+                content_xml += f"<w:t xml:space=\"preserve\">{escape(part)}</w:t>"
+            else:
+                content_xml += f"<w:t>{escape(part)}</w:t>"
+
+    return content_xml
+
 # Main *************************************************************************
@@ -24,6 +24,7 @@ from typing import Optional
 from pyTRLCConverter.base_converter import BaseConverter
 from pyTRLCConverter.ret import Ret
 from pyTRLCConverter.trlc_helper import Record_Object
+from pyTRLCConverter.converter_registry import DUMP_CONVERTER_DESCRIPTION
 
 # Variables ********************************************************************
 
@@ -51,7 +52,7 @@ class DumpConverter(BaseConverter):
         Returns:
             str: Converter description
         """
-        return "Dump TRCL item list to console."
+        return DUMP_CONVERTER_DESCRIPTION
 
     def enter_file(self, file_name: str) -> Ret:
         """Enter a file.
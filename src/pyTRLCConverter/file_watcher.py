@@ -0,0 +1,133 @@
+"""Watches TRLC source files for changes.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import os
+import time
+from typing import List
+
+# Variables ********************************************************************
+
+# File extensions of the TRLC files which are watched.
+TRLC_FILE_EXTENSIONS = (".rsl", ".trlc")
+
+# Classes **********************************************************************
+
+class FileWatcher():
+    # lobster-trace: SwRequirements.sw_req_cli_watch
+    """
+    Watches the TRLC files in the given folders and files for changes by polling.
+
+    Only the file status (modification time and size) is read, not the file content.
+    Therefore polling stays cheap even for large TRLC projects.
+    """
+
+    # Default time in seconds between two polls.
+    POLL_INTERVAL_DEFAULT = 1.0
+
+    def __init__(self, paths: List[str], poll_interval: float = POLL_INTERVAL_DEFAULT) -> None:
+        """
+        Initializes the file watcher and takes the initial snapshot of the watched files.
+
+        Args:
+            paths (List[str]): Folders and files to watch.
+            poll_interval (float): Time in seconds between two polls.
+        """
+        self._paths = paths
+        self._poll_interval = poll_interval
+        self._snapshot = self._take_snapshot()
+
+    def poll(self) -> List[str]:
+        """
+        Check once for changed files.
+
+        Returns:
+            List[str]: The added, modified and removed files since the last poll.
+        """
+        snapshot = self._take_snapshot()
+        changed_files = []
+
+        for file_name, file_status in snapshot.items():
+            if self._snapshot.get(file_name) != file_status:
+                changed_files.append(file_name)
+
+        for file_name in self._snapshot:
+            if file_name not in snapshot:
+                changed_files.append(file_name)
+
+        self._snapshot = snapshot
+
+        return sorted(changed_files)
+
+    def wait_for_changes(self) -> List[str]:
+        """
+        Block until at least one watched file changed.
+
+        Returns:
+            List[str]: The added, modified and removed files.
+        """
+        changed_files = []
+
+        while 0 == len(changed_files):
+            time.sleep(self._poll_interval)
+            changed_files = self.poll()
+
+        return changed_files
+
+    def _take_snapshot(self) -> dict:
+        """
+        Get the status of all watched files.
+
+        Returns:
+            dict: File status (modification time, size) per file name.
+        """
+        snapshot = {}
+
+        for path in self._paths:
+            if os.path.isdir(path):
+                for dir_path, _, file_names in os.walk(path):
+                    for file_name in file_names:
+                        if file_name.endswith(TRLC_FILE_EXTENSIONS):
+                            self._add_file_status(snapshot, os.path.join(dir_path, file_name))
+            else:
+                self._add_file_status(snapshot, path)
+
+        return snapshot
+
+    @staticmethod
+    def _add_file_status(snapshot: dict, file_name: str) -> None:
+        """
+        Add the status of the given file to the snapshot.
+        Files which don't exist (anymore) are not added.
+
+        Args:
+            snapshot (dict): The snapshot to add to.
+            file_name (str): The file name.
+        """
+        try:
+            file_stat = os.stat(file_name)
+            snapshot[file_name] = (file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            pass
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
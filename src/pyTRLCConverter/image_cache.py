@@ -0,0 +1,303 @@
+"""Persistent, content-addressed cache for generated diagram images.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import hashlib
+import os
+import re
+import shutil
+import threading
+from typing import List, Optional, Set
+from pyTRLCConverter.logger import log_verbose
+
+# Variables ********************************************************************
+
+# Default max. size of all cache entries in bytes.
+IMAGE_CACHE_SIZE_MAX_DEFAULT = 100 * 1024 * 1024
+
+# PlantUML preprocessor directives which include another file, e.g. "!include common.iuml" or
+# "!includesub common.iuml!PART". The file name is followed by an optional "!" and the part.
+INCLUDE_PATTERN = re.compile(rb"^[ \t]*!include(url|sub|_many|_once)?[ \t]+([^!\r\n]*)", re.MULTILINE)
+
+# Classes **********************************************************************
+
+class ImageCache():
+    # lobster-trace: SwRequirements.sw_req_plantuml_cache
+    """
+    On-disk cache for generated diagram images.
+
+    A cache entry is addressed by a key which is derived from the diagram source including
+    the files it includes, the diagram type and the identity of the backend which generates
+    the image. If any of them changes, a different key results and the image will be
+    generated again. A diagram with an include which can't be resolved is not cached.
+
+    If the size of all entries exceeds the limit, the least recently used entries are
+    removed. Every cache hit updates the modification time of its entry, which is used
+    to find the least recently used ones.
+    """
+
+    def __init__(self, cache_dir: str, size_max: int = IMAGE_CACHE_SIZE_MAX_DEFAULT) -> None:
+        """
+        Initializes the image cache.
+
+        Args:
+            cache_dir (str): The folder where the cache entries are stored.
+            size_max (int): Max. size of all cache entries in bytes.
+        """
+        self._cache_dir = cache_dir
+        self._size_max = size_max
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get_hits(self) -> int:
+        """
+        Get the number of cache hits.
+
+        Returns:
+            int: Number of cache hits
+        """
+        return self._hits
+
+    def get_misses(self) -> int:
+        """
+        Get the number of cache misses.
+
+        Returns:
+            int: Number of cache misses
+        """
+        return self._misses
+
+    @staticmethod
+    def get_key(diagram_type: str, diagram_path: str, backend_id: str) -> Optional[str]:
+        """
+        Get the cache key of a diagram.
+        The files which are included by the diagram are part of the key too.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg.
+            diagram_path (str): Path to the diagram source.
+            backend_id (str): Identity of the backend which generates the image.
+
+        Returns:
+            Optional[str]: Cache key or None if the diagram source or one of its included
+                files can't be read.
+        """
+        key = None
+
+        try:
+            hash_obj = hashlib.sha256()
+            hash_obj.update(diagram_type.encode("utf-8") + b"\0")
+            hash_obj.update(backend_id.encode("utf-8") + b"\0")
+
+            if ImageCache._update_hash(hash_obj, diagram_path, set()) is True:
+                key = hash_obj.hexdigest()
+
+        except OSError:
+            pass
+
+        return key
+
+    def fetch(self, key: str, diagram_type: str, dst_file: str) -> bool:
+        """
+        Copy the cached image of the given key to the destination file.
+
+        Args:
+            key (str): Cache key
+            diagram_type (str): Diagram type, e.g. svg.
+            dst_file (str): The destination image file.
+
+        Returns:
+            bool: True if the image was found in the cache, otherwise False.
+        """
+        is_found = False
+        file_name = self._get_file_name(key, diagram_type)
+
+        try:
+            shutil.copyfile(file_name, dst_file)
+
+            # Mark it as most recently used.
+            os.utime(file_name)
+            is_found = True
+
+            log_verbose(f"Copied {dst_file} from image cache entry {file_name}.")
+
+        except OSError:
+            pass
+
+        with self._lock:
+            if is_found is True:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+        return is_found
+
+    def store(self, key: str, diagram_type: str, src_file: str) -> None:
+        """
+        Store the generated image for the given cache key.
+        A failure is not critical, because it just results in a cache miss in the next run.
+
+        Args:
+            key (str): Cache key
+            diagram_type (str): Diagram type, e.g. svg.
+            src_file (str): The generated image file.
+        """
+        file_name = self._get_file_name(key, diagram_type)
+        file_name_tmp = file_name + f".{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            shutil.copyfile(src_file, file_name_tmp)
+
+            # Replace it atomically to avoid that a parallel run reads a partial written entry.
+            os.replace(file_name_tmp, file_name)
+
+            log_verbose(f"Stored {src_file} in image cache entry {file_name}.")
+
+        except OSError as exc:
+            log_verbose(f"Failed to store image cache entry {file_name}: {exc}")
+
+            if os.path.exists(file_name_tmp):
+                os.remove(file_name_tmp)
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the size of all entries is within the limit.
+        """
+        entry_list = []
+        size = 0
+
+        try:
+            with os.scandir(self._cache_dir) as dir_iter:
+                for entry in dir_iter:
+                    if (entry.is_file() is True) and (entry.name.endswith(".tmp") is False):
+                        stat_result = entry.stat()
+                        entry_list.append((stat_result.st_mtime_ns, stat_result.st_size, entry.path))
+                        size += stat_result.st_size
+
+        except OSError:
+            pass
+
+        # Oldest first.
+        entry_list.sort()
+
+        for _, entry_size, entry_path in entry_list:
+            if size <= self._size_max:
+                break
+
+            try:
+                os.remove(entry_path)
+                log_verbose(f"Removed image cache entry {entry_path}.")
+
+            except OSError:
+                # Maybe removed by a parallel run already.
+                pass
+
+            size -= entry_size
+
+    @staticmethod
+    def _update_hash(hash_obj: any, diagram_path: str, visited_set: Set[str]) -> bool:
+        """
+        Update the hash with the diagram source and recursively with the files it includes.
+        Every file is hashed only once, which covers repeated and circular includes too.
+
+        Args:
+            hash_obj (any): The hash object to update.
+            diagram_path (str): Path to the diagram source.
+            visited_set (Set[str]): The absolute paths of the files which are hashed already.
+
+        Raises:
+            OSError: If the diagram source or one of its included files can't be read.
+
+        Returns:
+            bool: True if all included files are hashed, False if the diagram includes a file,
+                which can't be resolved, e.g. by an URL.
+        """
+        is_resolved = True
+        visited_set.add(os.path.abspath(diagram_path))
+
+        with open(diagram_path, "rb") as fd:
+            diagram_source = fd.read()
+
+        hash_obj.update(diagram_source + b"\0")
+
+        include_list = ImageCache._get_include_list(diagram_path, diagram_source)
+
+        if include_list is None:
+            is_resolved = False
+        else:
+            for include_path in include_list:
+                if os.path.abspath(include_path) not in visited_set:
+                    if ImageCache._update_hash(hash_obj, include_path, visited_set) is False:
+                        is_resolved = False
+                        break
+
+        return is_resolved
+
+    @staticmethod
+    def _get_include_list(diagram_path: str, diagram_source: bytes) -> Optional[List[str]]:
+        """
+        Get the paths of the files, which are included by the diagram source.
+        The files of the PlantUML standard library, e.g. "!include <C4/C4_Container>", are
+        part of the backend and therefore not included in the list.
+
+        Args:
+            diagram_path (str): Path to the diagram source.
+            diagram_source (bytes): The diagram source.
+
+        Returns:
+            Optional[List[str]]: The paths of the included files relative to the diagram folder
+                or None if an included file can't be resolved, e.g. by an URL.
+        """
+        include_list = []
+        diagram_folder = os.path.dirname(diagram_path)
+
+        for match in INCLUDE_PATTERN.finditer(diagram_source):
+            include_name = os.fsdecode(match.group(2).strip().strip(b"\""))
+
+            if include_name.startswith("<") is True:
+                continue
+
+            if (match.group(1) == b"url") or ("://" in include_name):
+                include_list = None
+                break
+
+            include_list.append(os.path.join(diagram_folder, include_name))
+
+        return include_list
+
+    def _get_file_name(self, key: str, diagram_type: str) -> str:
+        """
+        Get the cache entry file name of the given key.
+
+        Args:
+            key (str): Cache key
+            diagram_type (str): Diagram type, e.g. svg.
+
+        Returns:
+            str: File name with path
+        """
+        return os.path.join(self._cache_dir, f"{key}.{diagram_type}")
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
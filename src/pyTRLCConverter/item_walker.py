@@ -21,17 +21,33 @@ Author: Norbert Schulz (norbert.schulz@newtec.de)
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import io
+import multiprocessing
 import os
+import sys
 import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from typing import Iterator, List, Optional, Tuple
 from trlc.ast import Symbol_Table
 
 from pyTRLCConverter.abstract_converter import AbstractConverter
 from pyTRLCConverter.logger import log_verbose, log_error
-from pyTRLCConverter.trlc_helper import get_file_dict_from_symbols, is_item_record, is_item_section
+from pyTRLCConverter.profiler import CATEGORY_FILE, CATEGORY_OUTPUT, CATEGORY_RECORD_TYPE, measure, \
+    merge_samples, take_samples
+from pyTRLCConverter.trlc_helper import RecordItem, SectionItem, TrlcItem, iter_items_by_file
 from pyTRLCConverter.ret import Ret
 
 # Variables ********************************************************************
 
+# Max. number of items which a worker process renders into one fragment.
+ITEM_CHUNK_SIZE = 64
+
+# The item walker and its tasks, inherited by the forked worker processes.
+# They are not passed as task arguments to avoid serializing the TRLC model.
+_worker_walker = None  # pylint: disable=invalid-name
+_worker_task_list = []  # pylint: disable=invalid-name
+
 # Classes **********************************************************************
 
 
@@ -50,11 +66,12 @@ class ItemWalker:  # pylint: disable=too-few-public-methods
         Initializes the TrlcWalker with the given arguments and converter.
 
         Args:
-            args (any): Arguments containing the exclude file paths.
+            args (any): Arguments containing the exclude file paths and the number of jobs.
             converter (AbstractConverter): The converter used for processing items.
         """
         self._converter = converter
         self._exclude_files = args.exclude
+        self._jobs = getattr(args, "jobs", 1)
 
     def walk_symbols(self, symbol_table: Symbol_Table) -> Ret:
         """
@@ -66,48 +83,342 @@ class ItemWalker:  # pylint: disable=too-few-public-methods
         Returns:
             Ret: Status of the walk operation.
         """
+        self._converter.set_symbol_table(symbol_table)
+
         result = self._converter.begin()
 
         if result == Ret.OK:
-            files_dict = get_file_dict_from_symbols(symbol_table)
-            for file_name, item_list in files_dict.items():
-                skip_it = False
+            # The items are consumed lazily, the ones of skipped files are not materialized.
+            file_iter = iter_items_by_file(symbol_table)
+
+            if self._is_parallel(self._converter.is_parallel_file_processing_supported()) is True:
+                result = self._walk_files_parallel(file_iter)
+
+            elif self._is_parallel(self._converter.is_parallel_item_processing_supported()) is True:
+                result = self._walk_items_parallel(file_iter)
+
+            else:
+                for file_name, item_iter in file_iter:
+                    # Normalize the file name to make it comparable.
+                    file_name = os.path.normpath(file_name)
+
+                    if self._is_file_skipped(file_name) is False:
+                        log_verbose(f"Processing file {file_name}.")
+                        result = self._walk_file(file_name, item_iter)
+
+                    if result != Ret.OK:
+                        break
+
+        if result == Ret.OK:
+            with measure(CATEGORY_OUTPUT, "finish"):
+                result = self._converter.finish()
+
+        return result
+
+    def _is_file_skipped(self, file_name: str) -> bool:
+        """
+        Check whether the file is excluded or its output is up to date.
+
+        Args:
+            file_name (str): The normalized name of the file.
+
+        Returns:
+            bool: True if the file shall be skipped, otherwise False.
+        """
+        skip_it = False
+
+        if self._exclude_files is not None:
+            for excluded_path in self._exclude_files:
+
+                # Normalize the excluded path to make it comparable.
+                excluded_path = os.path.normpath(excluded_path)
+
+                if os.path.commonpath([excluded_path, file_name]) == excluded_path:
+                    skip_it = True
+                    break
+
+        if skip_it is True:
+            log_verbose(f"Skipping file {file_name}.")
+
+        elif self._converter.is_file_up_to_date(file_name) is True:
+            log_verbose(f"Skipping up to date file {file_name}.")
+            skip_it = True
+
+        return skip_it
+
+    def _is_parallel(self, is_supported: bool) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Check whether the walk shall be done by parallel worker processes.
+        The worker processes are forked to inherit the TRLC model and the converter.
+        If the platform doesn't support this, the files are walked sequentially.
+
+        Args:
+            is_supported (bool): Whether the converter supports the parallel processing.
+
+        Returns:
+            bool: True if the walk is done in parallel, otherwise False.
+        """
+        is_parallel = False
+
+        if (1 < self._jobs) and (is_supported is True):
+            if "fork" in multiprocessing.get_all_start_methods():
+                is_parallel = True
+            else:
+                log_verbose("Parallel conversion is not supported on this platform.")
+
+        return is_parallel
+
+    def _get_files_to_walk(self,
+                           file_iter: Iterator[Tuple[str, Iterator[TrlcItem]]]) -> List[Tuple[str, List[TrlcItem]]]:
+        """
+        Get the files which are not skipped with their items.
+        The worker processes inherit them, therefore they are materialized.
+
+        Args:
+            file_iter (Iterator[Tuple[str, Iterator[TrlcItem]]]): The items per file.
+
+        Returns:
+            List[Tuple[str, List[TrlcItem]]]: The normalized file names with their items.
+        """
+        file_list = []
+
+        for file_name, item_iter in file_iter:
+            # Normalize the file name to make it comparable.
+            file_name = os.path.normpath(file_name)
+
+            if self._is_file_skipped(file_name) is False:
+                file_list.append((file_name, list(item_iter)))
+
+        return file_list
 
-                # Normalize the file name to make it comparable.
-                file_name = os.path.normpath(file_name)
+    def _create_executor(self, task_list: list) -> ProcessPoolExecutor:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Create the pool of forked worker processes for the given tasks.
+
+        Args:
+            task_list (list): The tasks, which are inherited by the worker processes.
+
+        Returns:
+            ProcessPoolExecutor: The worker process pool.
+        """
+        global _worker_walker, _worker_task_list  # pylint: disable=global-statement
 
-                if self._exclude_files is not None:
-                    for excluded_path in self._exclude_files:
+        _worker_walker = self
+        _worker_task_list = task_list
 
-                        # Normalize the excluded path to make it comparable.
-                        excluded_path = os.path.normpath(excluded_path)
+        return ProcessPoolExecutor(max_workers=self._jobs, mp_context=multiprocessing.get_context("fork"))
 
-                        if os.path.commonpath([excluded_path, file_name]) == excluded_path:
-                            skip_it = True
-                            break
+    def _walk_files_parallel(self, file_iter: Iterator[Tuple[str, Iterator[TrlcItem]]]) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Walks through the files in parallel worker processes.
+        The output of each file is reported in the file order after it is completed,
+        so the messages don't depend on the scheduling of the worker processes.
+        After the first failed file, no further files are reported.
+
+        Args:
+            file_iter (Iterator[Tuple[str, Iterator[TrlcItem]]]): The items per file.
 
-                if skip_it is True:
-                    log_verbose(f"Skipping file {file_name}.")
+        Returns:
+            Ret: The result of the walk operation.
+        """
+        result = Ret.OK
+        file_list = self._get_files_to_walk(file_iter)
+
+        try:
+            with self._create_executor(file_list) as executor:
+                futures = [executor.submit(_walk_file_in_worker, index) for index in range(len(file_list))]
+
+                for (file_name, _), future in zip(file_list, futures):
+                    worker_result = _get_worker_result(future, file_name)
+
+                    if worker_result is None:
+                        result = Ret.ERROR
+                        break
+
+                    (file_ret, stdout, stderr, file_result), samples, misses = worker_result
+                    merge_samples(samples)
+                    self._converter.merge_worker_misses(misses)
+
+                    sys.stdout.write(stdout)
+                    sys.stderr.write(stderr)
+
+                    if file_ret != Ret.OK:
+                        result = file_ret
+                        break
+
+                    self._converter.merge_file_result(file_name, file_result)
+
+                if result != Ret.OK:
+                    for future in futures:
+                        future.cancel()
+        finally:
+            _clear_worker_tasks()
 
-                else:
+        return result
+
+    def _walk_items_parallel(self, file_iter: Iterator[Tuple[str, Iterator[TrlcItem]]]) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Walks through the items in parallel worker processes, which render chunks of items
+        into fragments. The fragments are written in the walk order, so the output is the
+        same as by walking sequentially.
+
+        Args:
+            file_iter (Iterator[Tuple[str, Iterator[TrlcItem]]]): The items per file.
+
+        Returns:
+            Ret: The result of the walk operation.
+        """
+        result = Ret.OK
+        file_list = self._get_files_to_walk(file_iter)
+        task_list = []
+        task_range_list = []
+
+        for _, item_list in file_list:
+            task_index = len(task_list)
+
+            for chunk_index in range(0, len(item_list), ITEM_CHUNK_SIZE):
+                task_list.append(item_list[chunk_index:chunk_index + ITEM_CHUNK_SIZE])
+
+            task_range_list.append(range(task_index, len(task_list)))
+
+        try:
+            with self._create_executor(task_list) as executor:
+                futures = [executor.submit(_render_items_in_worker, index) for index in range(len(task_list))]
+
+                for (file_name, _), task_range in zip(file_list, task_range_list):
                     log_verbose(f"Processing file {file_name}.")
-                    result = self._walk_file(file_name, item_list)
+
+                    with measure(CATEGORY_FILE, file_name):
+                        result = self._write_fragments(file_name, [futures[index] for index in task_range])
+
+                    if result != Ret.OK:
+                        break
 
                 if result != Ret.OK:
-                    break
+                    for future in futures:
+                        future.cancel()
+        finally:
+            _clear_worker_tasks()
 
-        if result == Ret.OK:
-            result = self._converter.finish()
+        return result
+
+    def _write_fragments(self, file_name: str, futures: list) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Writes the fragments of the given file in the walk order.
+
+        Args:
+            file_name (str): The name of the file.
+            futures (list): The futures of the worker processes, which render the fragments.
+
+        Returns:
+            Ret: The result of the walk operation.
+        """
+        result = Ret.ERROR
+
+        try:
+            if Ret.OK == self._enter_file(file_name):
+                result = Ret.OK
+
+                for future in futures:
+                    worker_result = _get_worker_result(future, file_name)
+
+                    if worker_result is None:
+                        result = Ret.ERROR
+                        break
+
+                    (result, stdout, stderr, fragment), samples, misses = worker_result
+                    merge_samples(samples)
+                    self._converter.merge_worker_misses(misses)
+
+                    sys.stdout.write(stdout)
+                    sys.stderr.write(stderr)
+
+                    if result == Ret.OK:
+                        with measure(CATEGORY_OUTPUT, "write_fragment"):
+                            result = self._converter.write_fragment(fragment)
+
+                    if result != Ret.OK:
+                        break
+
+                if (result == Ret.OK) and (Ret.OK != self._leave_file(file_name)):
+                    result = Ret.ERROR
+
+        except Exception as e:  # pylint: disable=broad-except
+            log_error(f"Error processing file {file_name}: {e}")
+            result = Ret.ERROR
 
         return result
 
+    def _walk_file_captured(self, file_name: str, item_list: any) -> Tuple[Ret, str, str, any]:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Walks through the items in the given file and captures its console output.
+        Runs in a worker process.
+
+        Args:
+            file_name (str): The name of the file.
+            item_list (any): The list of trlc items in the file.
+
+        Returns:
+            Tuple[Ret, str, str, any]: The result of the walk operation, the captured
+                standard output and error output and the file result of the converter.
+        """
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        file_result = None
+
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            log_verbose(f"Processing file {file_name}.")
+            result = self._walk_file(file_name, item_list)
+
+            # The worker process ends after the task, therefore wait for its background jobs.
+            if Ret.OK != self._converter.finish_background_jobs():
+                result = Ret.ERROR
+
+            if result == Ret.OK:
+                file_result = self._converter.get_file_result(file_name)
+
+        return result, stdout.getvalue(), stderr.getvalue(), file_result
+
+    def _render_items_captured(self, item_list: list) -> Tuple[Ret, str, str, str]:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Renders the given items into a fragment and captures its console output.
+        Runs in a worker process.
+
+        Args:
+            item_list (list): The list of trlc items to render.
+
+        Returns:
+            Tuple[Ret, str, str, str]: The result of the walk operation, the captured
+                standard output and error output and the rendered fragment.
+        """
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            self._converter.begin_fragment()
+            result = self._walk_items(item_list)
+            fragment = self._converter.end_fragment()
+
+            # The worker process ends after the task, therefore wait for its background jobs.
+            if Ret.OK != self._converter.finish_background_jobs():
+                result = Ret.ERROR
+
+        return result, stdout.getvalue(), stderr.getvalue(), fragment
+
     def _walk_file(self, file_name: str, item_list: any) -> Ret:
         """
         Walks through the items in the given file.
 
         Args:
             file_name (str): The name of the file.
-            item_list (any): The list of trlc items in the file.
+            item_list (any): The trlc items in the file.
 
         Returns:
             Ret: The result of the walk operation.
@@ -115,22 +426,53 @@ class ItemWalker:  # pylint: disable=too-few-public-methods
         result = Ret.ERROR
 
         try:
-            if Ret.OK == self._converter.enter_file(file_name):
-                if Ret.OK == self._walk_items(item_list):
-                    if Ret.OK == self._converter.leave_file(file_name):
-                        result = Ret.OK
+            with measure(CATEGORY_FILE, file_name):
+                if Ret.OK == self._enter_file(file_name):
+                    if Ret.OK == self._walk_items(item_list):
+                        if Ret.OK == self._leave_file(file_name):
+                            result = Ret.OK
 
         except Exception as e:  # pylint: disable=broad-except
             log_error(f"Error processing file {file_name}: {e}")
 
         return result
 
-    def _walk_items(self, item_list: list) -> Ret:
+    def _enter_file(self, file_name: str) -> Ret:
+        """
+        Lets the converter enter the given file, which usually opens its output file.
+
+        Args:
+            file_name (str): The name of the file.
+
+        Returns:
+            Ret: The result of the converter.
+        """
+        with measure(CATEGORY_OUTPUT, "enter_file"):
+            result = self._converter.enter_file(file_name)
+
+        return result
+
+    def _leave_file(self, file_name: str) -> Ret:
         """
-        Walks through the given list of items.
+        Lets the converter leave the given file, which usually writes and closes its output file.
 
         Args:
-            item_list (list): The list of items to walk through.
+            file_name (str): The name of the file.
+
+        Returns:
+            Ret: The result of the converter.
+        """
+        with measure(CATEGORY_OUTPUT, "leave_file"):
+            result = self._converter.leave_file(file_name)
+
+        return result
+
+    def _walk_items(self, item_list: Iterator[TrlcItem]) -> Ret:
+        """
+        Walks through the given items.
+
+        Args:
+            item_list (Iterator[TrlcItem]): The items to walk through.
 
         Returns:
             Ret: The result of the walk operation.
@@ -151,22 +493,24 @@ class ItemWalker:  # pylint: disable=too-few-public-methods
 
         return result
 
-    def _visit_item(self, item: any) -> Ret:
+    def _visit_item(self, item: TrlcItem) -> Ret:
         """
         Visits the given item and processes it based on its type.
 
         Args:
-            item (any): The item to visit.
+            item (TrlcItem): The item to visit.
 
         Returns:
             Ret: The result of the visit.
         """
         result = Ret.OK
+        item_type = type(item)
 
-        if is_item_section(item):
-            result = self._converter.convert_section(item[0], item[1])
-        elif is_item_record(item):
-            result = self._converter.convert_record_object(item[0], item[1])
+        if item_type is RecordItem:
+            with measure(CATEGORY_RECORD_TYPE, item.record.n_typ.name):
+                result = self._converter.convert_record_object(item.record, item.level)
+        elif item_type is SectionItem:
+            result = self._converter.convert_section(item.name, item.level)
         else:
             log_error(f"Unrecognized item type {item}")
             result = Ret.ERROR
@@ -175,5 +519,80 @@ class ItemWalker:  # pylint: disable=too-few-public-methods
 
 # Functions ********************************************************************
 
+def _clear_worker_tasks() -> None:
+    """
+    Clear the tasks of the worker processes to release the TRLC model.
+    """
+    global _worker_walker, _worker_task_list  # pylint: disable=global-statement
+
+    _worker_walker = None
+    _worker_task_list = []
+
+def _get_worker_result(future: Future, file_name: str) -> Optional[tuple]:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    """
+    Get the result of a worker process task. A failed task, e.g. because the worker
+    process terminated abruptly or its result can't be pickled, is reported as error.
+
+    Args:
+        future (Future): The future of the worker process task.
+        file_name (str): The name of the file, which is processed by the task.
+
+    Returns:
+        Optional[tuple]: The result of the task or None if it failed.
+    """
+    worker_result = None
+
+    try:
+        worker_result = future.result()
+    except Exception as e:  # pylint: disable=broad-except
+        log_error(f"Worker process failed to process file {file_name}: {e}")
+
+    return worker_result
+
+def _walk_file_in_worker(index: int) -> Tuple[Tuple[Ret, str, str, any], dict, any]:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    """
+    Walks through the items of a file in a worker process.
+
+    Args:
+        index (int): Index of the file in the list of files to walk.
+
+    Returns:
+        Tuple[Tuple[Ret, str, str, any], dict, any]: See ItemWalker._walk_file_captured(),
+            the profiler samples and the failed translations of the task.
+    """
+    file_name, item_list = _worker_task_list[index]
+
+    # The samples and failed translations inherited from the parent process or of the
+    # previous task are reported already.
+    take_samples()
+    _worker_walker._converter.take_worker_misses()  # pylint: disable=protected-access
+
+    # pylint: disable=protected-access
+    return _worker_walker._walk_file_captured(file_name, item_list), take_samples(), \
+        _worker_walker._converter.take_worker_misses()
+
+def _render_items_in_worker(index: int) -> Tuple[Tuple[Ret, str, str, str], dict, any]:
+    # lobster-trace: SwRequirements.sw_req_cli_jobs
+    """
+    Renders a chunk of items into a fragment in a worker process.
+
+    Args:
+        index (int): Index of the chunk in the list of chunks to render.
+
+    Returns:
+        Tuple[Tuple[Ret, str, str, str], dict, any]: See ItemWalker._render_items_captured(),
+            the profiler samples and the failed translations of the task.
+    """
+    # The samples and failed translations inherited from the parent process or of the
+    # previous task are reported already.
+    take_samples()
+    _worker_walker._converter.take_worker_misses()  # pylint: disable=protected-access
+
+    # pylint: disable=protected-access
+    return _worker_walker._render_items_captured(_worker_task_list[index]), take_samples(), \
+        _worker_walker._converter.take_worker_misses()
+
 
 # Main *************************************************************************
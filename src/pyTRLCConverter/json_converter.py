@@ -0,0 +1,361 @@
+"""Converter to JSON and NDJSON format, e.g. for dashboards and search indexes.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import io
+import json
+import os
+import sys
+from typing import Optional
+from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.logger import log_error, log_verbose
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.trlc_helper import Record_Object, get_record_references
+from pyTRLCConverter.converter_registry import JSON_CONVERTER_DESCRIPTION
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+class JsonConverter(BaseConverter):
+    """
+    Converter to JSON and NDJSON format. Every file, section and record is written as
+    JSON object, while walking through the items. In NDJSON format one object per line,
+    in JSON format as one array.
+    """
+
+    FORMAT_NDJSON = "ndjson"
+    FORMAT_JSON = "json"
+    OUTPUT_FILE_NAME_DEFAULT = "output"
+
+    # Output file name to write to stdout.
+    STDOUT_FILE_NAME = "-"
+
+    def __init__(self, args: any) -> None:
+        # lobster-trace: SwRequirements.sw_req_no_prj_spec
+        # lobster-trace: SwRequirements.sw_req_json
+        """
+        Initializes the converter.
+
+        Args:
+            args (any): The parsed program arguments.
+        """
+        super().__init__(args)
+
+        # The file descriptor for the output file.
+        self._fd = None
+
+        # The file descriptor for the output file, while items are rendered into a fragment.
+        self._fd_document = None
+
+        # Number of objects written into the JSON array.
+        self._object_count = 0
+
+    @staticmethod
+    def get_subcommand() -> str:
+        # lobster-trace: SwRequirements.sw_req_json
+        """
+        Return subcommand token for this converter.
+
+        Returns:
+            str: Parser subcommand token
+        """
+        return "json"
+
+    @staticmethod
+    def get_description() -> str:
+        # lobster-trace: SwRequirements.sw_req_json
+        """
+        Return converter description.
+
+        Returns:
+            str: Converter description
+        """
+        return JSON_CONVERTER_DESCRIPTION
+
+    @classmethod
+    def register(cls, args_parser: any) -> None:
+        # lobster-trace: SwRequirements.sw_req_json
+        # lobster-trace: SwRequirements.sw_req_json_format
+        # lobster-trace: SwRequirements.sw_req_json_out_file_name
+        """
+        Register converter specific argument parser.
+
+        Args:
+            args_parser (any): Argument parser
+        """
+        super().register(args_parser)
+
+        BaseConverter._parser.add_argument(
+            "-f",
+            "--format",
+            type=str,
+            choices=[JsonConverter.FORMAT_NDJSON, JsonConverter.FORMAT_JSON],
+            default=JsonConverter.FORMAT_NDJSON,
+            required=False,
+            help="Write one JSON object per line or a single JSON array " \
+                f"(default = {JsonConverter.FORMAT_NDJSON})."
+        )
+
+        BaseConverter._parser.add_argument(
+            "-n",
+            "--name",
+            type=str,
+            default=None,
+            required=False,
+            help="Name of the generated output file inside the output folder or " \
+                f"'{JsonConverter.STDOUT_FILE_NAME}' to write to stdout " \
+                f"(default = {JsonConverter.OUTPUT_FILE_NAME_DEFAULT}.<format>)."
+        )
+
+    def begin(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_json_out_file_name
+        """
+        Begin the conversion process.
+
+        Returns:
+            Ret: Status
+        """
+        assert self._fd is None
+
+        # Call the base converter to initialize the common stuff.
+        result = BaseConverter.begin(self)
+
+        if result == Ret.OK:
+            file_name = self._args.name
+
+            if file_name is None:
+                file_name = f"{JsonConverter.OUTPUT_FILE_NAME_DEFAULT}.{self._args.format}"
+
+            if file_name == JsonConverter.STDOUT_FILE_NAME:
+                self._fd = sys.stdout
+
+            else:
+                if 0 < len(self._args.out):
+                    file_name = os.path.join(self._args.out, file_name)
+
+                log_verbose(f"Writing {self._args.format} {file_name}.")
+
+                try:
+                    self._fd = open(file_name, "w", encoding="utf-8") #pylint: disable=consider-using-with
+                except IOError as e:
+                    log_error(f"Failed to open file {file_name}: {e}")
+                    result = Ret.ERROR
+
+        if (result == Ret.OK) and (self._args.format == JsonConverter.FORMAT_JSON):
+            self._fd.write("[")
+
+            # Forked worker processes shall not inherit buffered output.
+            self._fd.flush()
+
+        return result
+
+    def is_parallel_item_processing_supported(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Check whether the items can be rendered into fragments in parallel worker processes.
+        This is the case in NDJSON format, because every object is written independent of
+        the objects before. A derived converter shall enable it explicitly, see AbstractConverter.
+
+        Returns:
+            bool: True if parallel processing is supported, otherwise False.
+        """
+        return (type(self) is JsonConverter) and (self._args.format == JsonConverter.FORMAT_NDJSON)
+
+    def begin_fragment(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Begin to render the following items into a fragment instead of the output file.
+        """
+        assert self._fd is not None
+        assert self._fd_document is None
+
+        self._fd_document = self._fd
+        self._fd = io.StringIO()
+
+    def end_fragment(self) -> str:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        End to render items into a fragment.
+
+        Returns:
+            str: The rendered fragment.
+        """
+        assert self._fd_document is not None
+
+        fragment = self._fd.getvalue()
+        self._fd = self._fd_document
+        self._fd_document = None
+
+        return fragment
+
+    def write_fragment(self, fragment: str) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Write a fragment, which was rendered by a worker process, to the output file.
+
+        Args:
+            fragment (str): The fragment provided by end_fragment().
+
+        Returns:
+            Ret: Status
+        """
+        assert self._fd is not None
+
+        self._fd.write(fragment)
+
+        return Ret.OK
+
+    def enter_file(self, file_name: str) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_json
+        """
+        Enter a file.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            Ret: Status
+        """
+        self._write_object({"type": "file", "name": file_name})
+
+        return Ret.OK
+
+    def convert_section(self, section: str, level: int) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_json
+        """
+        Process the given section item.
+
+        Args:
+            section (str): The section name
+            level (int): The section indentation level
+
+        Returns:
+            Ret: Status
+        """
+        self._write_object({"type": "section", "name": section, "level": level})
+
+        return Ret.OK
+
+    def convert_record_object_generic(self, record: Record_Object, level: int, translation: Optional[dict]) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_json_record
+        """
+        Process the given record object in a generic way.
+
+        The handler is called by the base converter if no specific handler is
+        defined for the record type.
+
+        Args:
+            record (Record_Object): The record object.
+            level (int): The record level.
+            translation (Optional[dict]): Translation dictionary for the record object.
+                                            Not applied, the attribute names are kept for machines.
+
+        Returns:
+            Ret: Status
+        """
+        self._write_object(self._create_record_object(record, level))
+
+        return Ret.OK
+
+    def finish(self) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_json
+        """
+        Finish the conversion.
+
+        Returns:
+            Ret: Status
+        """
+        # lobster-trace: SwRequirements.sw_req_translation_misses
+        self._translator.log_misses()
+
+        result = self.finish_background_jobs()
+
+        if self._fd is not None:
+            if self._args.format == JsonConverter.FORMAT_JSON:
+                self._fd.write("\n]\n")
+
+            if self._fd is sys.stdout:
+                self._fd.flush()
+            else:
+                self._fd.close()
+
+            self._fd = None
+
+        return result
+
+    def _create_record_object(self, record: Record_Object, level: int) -> dict:
+        # lobster-trace: SwRequirements.sw_req_json_record
+        """
+        Create the JSON object of the given record object.
+        A project specific converter may override it to add further information.
+
+        Args:
+            record (Record_Object): The record object.
+            level (int): The record level.
+
+        Returns:
+            dict: The JSON object.
+        """
+        references = []
+
+        for record_reference in get_record_references(record):
+            target = record_reference.target
+
+            references.append({
+                "name": target.fully_qualified_name(),
+                "file": target.location.file_name,
+                "line": target.location.line_no
+            })
+
+        return {
+            "type": "record",
+            "name": record.name,
+            "record_type": record.n_typ.name,
+            "package": record.n_package.name,
+            "level": level,
+            "file": record.location.file_name,
+            "line": record.location.line_no,
+            "attributes": record.to_python_dict(),
+            "references": references
+        }
+
+    def _write_object(self, json_object: dict) -> None:
+        # lobster-trace: SwRequirements.sw_req_json_format
+        """
+        Write the given JSON object to the output file.
+
+        Args:
+            json_object (dict): The JSON object.
+        """
+        json_string = json.dumps(json_object, ensure_ascii=False, separators=(",", ":"))
+
+        if self._args.format == JsonConverter.FORMAT_JSON:
+            separator = ",\n" if 0 < self._object_count else "\n"
+            self._fd.write(separator + json_string)
+            self._object_count += 1
+
+        else:
+            self._fd.write(json_string + "\n")
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
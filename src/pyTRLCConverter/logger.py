@@ -63,6 +63,15 @@ def log_verbose(message : str) -> None:
     if _VERBOSE_ENABLED:
         print(message)
 
+def log_info(message : str) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_watch
+    """Print a message, independent of the verbose mode.
+
+    Args:
+        message (str): The message to print.
+    """
+    print(message)
+
 def log_error(message : str, show_timestamp : str = False) -> None:
     # lobster-trace: SwRequirements.sw_req_error
     """Prints an error and optionally a timestamp with it
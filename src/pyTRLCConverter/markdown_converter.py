@@ -20,13 +20,17 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import io
 import os
 from typing import List, Optional
-from trlc.ast import Implicit_Null, Record_Object, Record_Reference
+from trlc.ast import Array_Type, Expression, Implicit_Null, Record_Object, Record_Reference, Record_Type, Type, Union_Type
 from pyTRLCConverter.base_converter import BaseConverter
 from pyTRLCConverter.ret import Ret
-from pyTRLCConverter.trlc_helper import TrlcAstWalker
+from pyTRLCConverter.trlc_helper import RecordTypeRenderPlan, TrlcAstWalker, get_model_file_names
 from pyTRLCConverter.logger import log_verbose, log_error
+from pyTRLCConverter.output_manifest import OutputManifest
+from pyTRLCConverter import text_format
+from pyTRLCConverter.converter_registry import MARKDOWN_CONVERTER_DESCRIPTION
 
 # Variables ********************************************************************
 
@@ -56,7 +60,7 @@ class MarkdownConverter(BaseConverter):
         self._out_path = args.out
 
         # The excluded files in normalized form.
-        self._excluded_files = []
+        self._excluded_paths = []
 
         if args.exclude is not None:
             self._excluded_paths = [os.path.normpath(path) for path in args.exclude]
@@ -64,6 +68,18 @@ class MarkdownConverter(BaseConverter):
         # The file descriptor for the output file.
         self._fd = None
 
+        # The file descriptor for the output file, while items are rendered into a fragment.
+        self._fd_document = None
+
+        # The TRLC AST walker for the record field values. Its created on demand.
+        self._trlc_ast_walker = None
+
+        # The rendering plans of the record types.
+        self._render_plan_dict = {}  # type: dict[Record_Type, RecordTypeRenderPlan]
+
+        # The link targets of the referenced record objects, resolved once per record object.
+        self._link_target_dict = {}  # type: dict[Record_Object, str]
+
         # The base level for the headings. Its the minimum level for the headings which depends
         # on the single/multiple document mode.
         self._base_level = 1
@@ -98,7 +114,7 @@ class MarkdownConverter(BaseConverter):
         Returns:
             str: Converter description
         """
-        return "Convert into markdown format."
+        return MARKDOWN_CONVERTER_DESCRIPTION
 
     @classmethod
     def register(cls, args_parser: any) -> None:
@@ -108,6 +124,8 @@ class MarkdownConverter(BaseConverter):
         # lobster-trace: SwRequirements.sw_req_markdown_top_level_custom
         # lobster-trace: SwRequirements.sw_req_markdown_out_file_name_default
         # lobster-trace: SwRequirements.sw_req_markdown_out_file_name_custom
+        # lobster-trace: SwRequirements.sw_req_markdown_incremental
+        # lobster-trace: SwRequirements.sw_req_markdown_referenced_by
         """
         Register converter specific argument parser.
 
@@ -156,6 +174,24 @@ class MarkdownConverter(BaseConverter):
                 f"(default = {MarkdownConverter.TOP_LEVEL_DEFAULT})."
         )
 
+        BaseConverter._parser.add_argument(
+            "-inc",
+            "--incremental",
+            action="store_true",
+            required=False,
+            default=False,
+            help="Convert only the files whose output is outdated. Only considered in multiple document mode."
+        )
+
+        BaseConverter._parser.add_argument(
+            "-rb",
+            "--referenced-by",
+            action="store_true",
+            required=False,
+            default=False,
+            help="Add a row with the records, which reference the record, to every record table."
+        )
+
     def begin(self) -> Ret:
         # lobster-trace: SwRequirements.sw_req_markdown_single_doc_mode
         # lobster-trace: SwRequirements.sw_req_markdown_sd_top_level
@@ -183,6 +219,23 @@ class MarkdownConverter(BaseConverter):
 
             log_verbose(f"Empty attribute value: {self._empty_attribute_value}")
 
+            # Incremental conversion is only possible in multiple document mode.
+            if (self._args.single_document is False) and (getattr(self._args, "incremental", False) is True):
+                log_verbose("Incremental mode.")
+                model_file_names = None
+
+                if self._symbol_table is not None:
+                    model_file_names = get_model_file_names(self._symbol_table)
+
+                fingerprint = OutputManifest.create_fingerprint(self._args, model_file_names)
+                self._output_manifest = OutputManifest(self._out_path, fingerprint)
+                self._output_manifest.load()
+
+            # lobster-trace: SwRequirements.sw_req_markdown_referenced_by
+            # Create the index of all references before parallel worker processes are forked.
+            if getattr(self._args, "referenced_by", False) is True:
+                self._get_referenced_by_dict()
+
             # Single document mode?
             if self._args.single_document is True:
                 result = self._generate_out_file(self._args.name)
@@ -195,6 +248,132 @@ class MarkdownConverter(BaseConverter):
 
         return result
 
+    def is_file_up_to_date(self, file_name: str) -> bool:
+        # lobster-trace: SwRequirements.sw_req_markdown_incremental
+        """
+        Check whether the Markdown file of the given TRLC file is up to date.
+        This is only the case in incremental mode, if neither the TRLC file nor the
+        files its record references point into nor the converter arguments changed.
+        With the "Referenced by" row, no reference into its records shall be added or removed too.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            bool: True if the conversion of the file can be skipped, otherwise False.
+        """
+        is_up_to_date = False
+
+        if self._output_manifest is not None:
+            is_up_to_date = self._output_manifest.is_up_to_date(self._file_name_trlc_to_md(file_name), file_name,
+                                                                self._get_referenced_by_hash(file_name))
+
+        return is_up_to_date
+
+    def is_parallel_file_processing_supported(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Check whether the files can be converted in parallel worker processes.
+        This is the case in multiple document mode, because every TRLC file is
+        converted into its own Markdown file. A derived converter shall enable it explicitly,
+        see AbstractConverter.
+
+        Returns:
+            bool: True if parallel processing is supported, otherwise False.
+        """
+        return (type(self) is MarkdownConverter) and (self._args.single_document is False)
+
+    def get_file_result(self, file_name: str) -> Optional[dict]:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Get the result of a file conversion, which was done in a worker process.
+        In incremental mode its the manifest entry of the Markdown file.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            Optional[dict]: The manifest entry or None.
+        """
+        file_result = None
+
+        if self._output_manifest is not None:
+            file_result = self._output_manifest.get_entry(self._file_name_trlc_to_md(file_name))
+
+        return file_result
+
+    def merge_file_result(self, file_name: str, file_result: Optional[dict]) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Merge the result of a file conversion, which was done in a worker process.
+
+        Args:
+            file_name (str): File name
+            file_result (Optional[dict]): The manifest entry provided by get_file_result().
+        """
+        if (self._output_manifest is not None) and (file_result is not None):
+            self._output_manifest.set_entry(self._file_name_trlc_to_md(file_name), file_result)
+
+    def is_parallel_item_processing_supported(self) -> bool:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Check whether the items can be rendered into fragments in parallel worker processes.
+        This is the case in single document mode, because after the top level heading
+        every item is written in the same way, independent of the items before.
+        A derived converter shall enable it explicitly, see AbstractConverter.
+
+        Returns:
+            bool: True if parallel processing is supported, otherwise False.
+        """
+        return (type(self) is MarkdownConverter) and (self._args.single_document is True)
+
+    def begin_fragment(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Begin to render the following items into a fragment instead of the Markdown file.
+        """
+        assert self._fd is not None
+        assert self._fd_document is None
+
+        self._fd_document = self._fd
+        self._fd = io.StringIO()
+
+        # Keep the file name like a file descriptor, project specific handlers may use it.
+        self._fd.name = self._fd_document.name
+
+    def end_fragment(self) -> str:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        End to render items into a fragment.
+
+        Returns:
+            str: The rendered fragment.
+        """
+        assert self._fd_document is not None
+
+        fragment = self._fd.getvalue()
+        self._fd = self._fd_document
+        self._fd_document = None
+
+        return fragment
+
+    def write_fragment(self, fragment: str) -> Ret:
+        # lobster-trace: SwRequirements.sw_req_cli_jobs
+        """
+        Write a fragment, which was rendered by a worker process, to the Markdown file.
+
+        Args:
+            fragment (str): The fragment provided by end_fragment().
+
+        Returns:
+            Ret: Status
+        """
+        assert self._fd is not None
+
+        self._fd.write(fragment)
+
+        return Ret.OK
+
     def enter_file(self, file_name: str) -> Ret:
         # lobster-trace: SwRequirements.sw_req_markdown_multiple_doc_mode
         """
@@ -215,6 +394,9 @@ class MarkdownConverter(BaseConverter):
             file_name_md = self._file_name_trlc_to_md(file_name)
             result = self._generate_out_file(file_name_md)
 
+            if self._output_manifest is not None:
+                self._output_manifest.begin_entry(file_name_md, file_name, self._get_referenced_by_hash(file_name))
+
             # The very first written Markdown part shall not have a empty line before.
             self._empty_line_required = False
 
@@ -298,13 +480,29 @@ class MarkdownConverter(BaseConverter):
         Finish the conversion process.
         """
 
+        # lobster-trace: SwRequirements.sw_req_translation_misses
+        self._translator.log_misses()
+
+        # lobster-trace: SwRequirements.sw_req_plantuml_async
+        result = self.finish_background_jobs()
+
         # Single document mode?
         if self._args.single_document is True:
             assert self._fd is not None
             self._fd.close()
             self._fd = None
 
-        return Ret.OK
+        # lobster-trace: SwRequirements.sw_req_markdown_incremental
+        if self._output_manifest is not None:
+            self._output_manifest.remove_deleted_sources()
+
+            try:
+                self._output_manifest.save()
+            except OSError as e:
+                log_error(f"Failed to write manifest: {e}")
+                result = Ret.ERROR
+
+        return result
 
     def _write_top_level_heading_on_demand(self) -> None:
         # lobster-trace: SwRequirements.sw_req_markdown_md_top_level
@@ -424,6 +622,42 @@ class MarkdownConverter(BaseConverter):
         Returns:
             str: Markdown link
         """
+        return MarkdownConverter.markdown_create_link(str(record_reference.to_python_object()),
+                                                      self._get_link_target(record_reference.target))
+
+    def _get_link_target(self, record: Record_Object) -> str:
+        # lobster-trace: SwRequirements.sw_req_markdown_record
+        """
+        Get the anchor of the given record object in the output, e.g. to link to it.
+        It is resolved on the first request and looked up for every further reference.
+        Project specific record handlers may use it as well.
+
+        Args:
+            record (Record_Object): The referenced record object.
+
+        Returns:
+            str: The anchor, which consists of the output file name and the record name.
+        """
+        link_target = self._link_target_dict.get(record)
+
+        if link_target is None:
+            link_target = self._create_link_target(record)
+            self._link_target_dict[record] = link_target
+
+        return link_target
+
+    def _create_link_target(self, record: Record_Object) -> str:
+        # lobster-trace: SwRequirements.sw_req_markdown_record
+        """
+        Create the anchor of the given record object, considering the single or
+        multiple document mode and the excluded paths.
+
+        Args:
+            record (Record_Object): The referenced record object.
+
+        Returns:
+            str: The anchor.
+        """
         file_name = ""
 
         # Single document mode?
@@ -433,19 +667,15 @@ class MarkdownConverter(BaseConverter):
             # Is the link to a excluded file?
             for excluded_path in self._excluded_paths:
 
-                if os.path.commonpath([excluded_path, record_reference.target.location.file_name]) == excluded_path:
-                    file_name = self._file_name_trlc_to_md(record_reference.target.location.file_name)
+                if os.path.commonpath([excluded_path, record.location.file_name]) == excluded_path:
+                    file_name = self._file_name_trlc_to_md(record.location.file_name)
                     break
 
         # Multiple document mode
         else:
-            file_name = self._file_name_trlc_to_md(record_reference.target.location.file_name)
-
-        record_name = record_reference.target.name
+            file_name = self._file_name_trlc_to_md(record.location.file_name)
 
-        anchor_tag = file_name + "#" + record_name.lower().replace(" ", "-")
-
-        return MarkdownConverter.markdown_create_link(str(record_reference.to_python_object()), anchor_tag)
+        return file_name + "#" + record.name.lower().replace(" ", "-")
 
     def _get_trlc_ast_walker(self) -> TrlcAstWalker:
         # lobster-trace: SwRequirements.sw_req_markdown_record
@@ -478,6 +708,101 @@ class MarkdownConverter(BaseConverter):
 
         return trlc_ast_walker
 
+    def _get_render_plan(self, record_type: Record_Type, translation: Optional[dict]) -> RecordTypeRenderPlan:
+        # lobster-trace: SwRequirements.sw_req_markdown_record
+        """
+        Get the rendering plan of the record type. It is compiled on the first record of the type.
+
+        Args:
+            record_type (Record_Type): The record type.
+            translation (Optional[dict]): Translation dictionary for the record type.
+                                            If None, no translation is applied.
+
+        Returns:
+            RecordTypeRenderPlan: The rendering plan.
+        """
+        render_plan = self._render_plan_dict.get(record_type)
+
+        if (render_plan is None) or (render_plan.translation is not translation):
+            if self._trlc_ast_walker is None:
+                self._trlc_ast_walker = self._get_trlc_ast_walker()
+
+            render_plan = RecordTypeRenderPlan(record_type, translation, self.markdown_escape, self._get_value_handler)
+            self._render_plan_dict[record_type] = render_plan
+
+        return render_plan
+
+    def _get_value_handler(self, field_type: Type) -> callable:
+        # lobster-trace: SwRequirements.sw_req_markdown_record
+        """
+        Get the handler which converts a record field value of the given type.
+
+        Args:
+            field_type (Type): The record field type.
+
+        Returns:
+            callable: The value handler.
+        """
+        value_handler = self._on_scalar_value
+
+        if isinstance(field_type, Array_Type):
+            value_handler = self._on_array_value
+        elif isinstance(field_type, (Record_Type, Union_Type)):
+            value_handler = self._on_reference_value
+
+        return value_handler
+
+    def _on_scalar_value(self, value: Expression) -> str:
+        # lobster-trace: SwRequirements.sw_req_markdown_record
+        """
+        Convert a record field value, which is neither a record reference nor an array.
+
+        Args:
+            value (Expression): The record field value.
+
+        Returns:
+            str: The converted value.
+        """
+        attribute_value = ""
+
+        if isinstance(value, Implicit_Null):
+            attribute_value = self._on_implict_null(value)
+        else:
+            attribute_value = MarkdownConverter.markdown_escape(str(value.to_python_object()))
+
+        return attribute_value
+
+    def _on_reference_value(self, value: Expression) -> str:
+        # lobster-trace: SwRequirements.sw_req_markdown_record
+        """
+        Convert a record field value, which is a record reference.
+
+        Args:
+            value (Expression): The record field value.
+
+        Returns:
+            str: The converted value.
+        """
+        return self._trlc_ast_walker.walk(value)
+
+    def _on_array_value(self, value: Expression) -> str:
+        # lobster-trace: SwRequirements.sw_req_markdown_record
+        """
+        Convert a record field value, which is an array. It results in a list.
+
+        Args:
+            value (Expression): The record field value.
+
+        Returns:
+            str: The converted value.
+        """
+        attribute_value = self._trlc_ast_walker.walk(value)
+
+        if isinstance(attribute_value, list):
+            attribute_value = self.markdown_create_list(attribute_value, True, False)
+
+        return attribute_value
+
     # pylint: disable=too-many-locals
     def _convert_record_object(self, record: Record_Object, level: int, translation: Optional[dict]) -> Ret:
         # lobster-trace: SwRequirements.sw_req_markdown_record
@@ -506,33 +831,55 @@ class MarkdownConverter(BaseConverter):
         markdown_table_head = self.markdown_create_table_head(column_titles)
         self._fd.write(markdown_table_head)
 
-        # Walk through the record object fields and write the table rows.
-        trlc_ast_walker = self._get_trlc_ast_walker()
-
-        for name, value in record.field.items():
-            # Translate the attribute name if available.
-            attribute_name = name
-            if translation is not None:
-                if name in translation:
-                    attribute_name = translation[name]
+        # Walk through the record object fields with the rendering plan of the record type
+        # and write the table rows.
+        render_plan = self._get_render_plan(record.n_typ, translation)
 
-            attribute_name = self.markdown_escape(attribute_name)
+        # lobster-trace: SwRequirements.sw_req_translation_misses
+        self._translator.count_misses(record.n_typ.name, render_plan.untranslated_list)
 
+        for name, attribute_name, value_handler in render_plan.field_list:
             # Retrieve the attribute value by processing the field value.
-            walker_result = trlc_ast_walker.walk(value)
-
-            attribute_value = ""
-            if isinstance(walker_result, list):
-                attribute_value = self.markdown_create_list(walker_result, True, False)
-            else:
-                attribute_value = walker_result
+            attribute_value = value_handler(record.field[name])
 
             # Write the attribute name and value to the Markdown table as row.
             markdown_table_row = self.markdown_append_table_row([attribute_name, attribute_value], False)
             self._fd.write(markdown_table_row)
 
+        # lobster-trace: SwRequirements.sw_req_markdown_referenced_by
+        if getattr(self._args, "referenced_by", False) is True:
+            markdown_table_row = self.markdown_append_table_row([
+                self.markdown_escape(BaseConverter.REFERENCED_BY_ATTRIBUTE_NAME),
+                self._get_referenced_by_value(record)
+            ], False)
+            self._fd.write(markdown_table_row)
+
         return Ret.OK
 
+    def _get_referenced_by_value(self, record: Record_Object) -> str:
+        # lobster-trace: SwRequirements.sw_req_markdown_referenced_by
+        """
+        Get the links to the record objects, which reference the given record object.
+
+        Args:
+            record (Record_Object): The record object.
+
+        Returns:
+            str: The list of links or the empty attribute value if the record object isn't referenced.
+        """
+        link_list = [MarkdownConverter.markdown_create_link(referencing_record.fully_qualified_name(),
+                                                            self._get_link_target(referencing_record))
+                     for referencing_record in self._get_referenced_by(record)]
+
+        attribute_value = ""
+
+        if 0 == len(link_list):
+            attribute_value = self.markdown_escape(self._empty_attribute_value)
+        else:
+            attribute_value = self.markdown_create_list(link_list, True, False)
+
+        return attribute_value
+
     @staticmethod
     def markdown_escape(text: str) -> str:
         # lobster-trace: SwRequirements.sw_req_markdown_escape
@@ -545,12 +892,7 @@ class MarkdownConverter(BaseConverter):
         Returns:
             str: Escaped text
         """
-        characters = ["\\", "`", "*", "_", "{", "}", "[", "]", "<", ">", "(", ")", "#", "+", "-", ".", "!", "|"]
-
-        for character in characters:
-            text = text.replace(character, "\\" + character)
-
-        return text
+        return text_format.escape(text)
 
     @staticmethod
     def markdown_lf2soft_return(text: str) -> str:
@@ -610,36 +952,7 @@ class MarkdownConverter(BaseConverter):
         Returns:
             str: Table head
         """
-        table_head = "|"
-
-        for column_title in column_titles:
-            column_title_raw = column_title
-
-            if escape is True:
-                column_title_raw = MarkdownConverter.markdown_escape(column_title)
-
-            table_head += f" {column_title_raw} |"
-
-        table_head += "\n"
-
-        table_head += "|"
-
-        for column_title in column_titles:
-            column_title_raw = column_title
-
-            if escape is True:
-                column_title_raw = MarkdownConverter.markdown_escape(column_title)
-
-            table_head += " "
-
-            for _ in range(len(column_title_raw)):
-                table_head += "-"
-
-            table_head += " |"
-
-        table_head += "\n"
-
-        return table_head
+        return text_format.markdown_create_table_head(column_titles, escape)
 
     @staticmethod
     def markdown_append_table_row(row_values: List[str], escape: bool = True) -> str:
@@ -655,22 +968,7 @@ class MarkdownConverter(BaseConverter):
         Returns:
             str: Table row
         """
-        table_row = "|"
-
-        for row_value in row_values:
-            row_value_raw = row_value
-
-            if escape is True:
-                row_value_raw = MarkdownConverter.markdown_escape(row_value)
-
-            # Replace every LF with a HTML <br>.
-            row_value_raw = row_value_raw.replace("\n", "<br>")
-
-            table_row += f" {row_value_raw} |"
-
-        table_row += "\n"
-
-        return table_row
+        return text_format.markdown_create_table_row(row_values, escape)
 
     @staticmethod
     def markdown_create_list(list_values: List[str], use_html: bool = False, escape: bool = True) -> str:
@@ -0,0 +1,333 @@
+"""Converter which passes every item to several converters, to convert into several
+    formats by walking the TRLC items only once.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import json
+from typing import List
+from pyTRLCConverter.abstract_converter import AbstractConverter
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.trlc_helper import Record_Object, Symbol_Table
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+class MultiplexConverter(AbstractConverter):
+    # lobster-trace: SwRequirements.sw_req_cli_multiple_converters
+    """
+    Converter which passes every call of the item walker to all of its converters.
+
+    A file is only entered by the converters whose output of the file is not up to date.
+    The files or items are processed in parallel worker processes only if all converters
+    support it in the same way.
+    """
+
+    def __init__(self, converter_list: List[AbstractConverter]) -> None:
+        """
+        Initializes the converter.
+
+        Args:
+            converter_list (List[AbstractConverter]): The converters to pass the items to.
+        """
+        self._converter_list = converter_list
+
+        # The converters, which convert a file, per file name.
+        self._file_converter_dict = {}  # type: dict[str, List[AbstractConverter]]
+
+        # The converters, which convert the current file.
+        self._file_converter_list = converter_list
+
+    def set_symbol_table(self, symbol_table: Symbol_Table) -> None:
+        """
+        Set the symbol table, which is walked afterwards, for all converters.
+
+        Args:
+            symbol_table (Symbol_Table): The TRLC symbol table.
+        """
+        for converter in self._converter_list:
+            converter.set_symbol_table(symbol_table)
+
+    def begin(self) -> Ret:
+        """
+        Begin the conversion process of all converters.
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        for converter in self._converter_list:
+            result = converter.begin()
+
+            if result != Ret.OK:
+                break
+
+        return result
+
+    def is_file_up_to_date(self, file_name: str) -> bool:
+        """
+        Check whether the output of the given file is up to date for all converters.
+        The converters, which are not up to date, are remembered to convert the file.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            bool: True if the conversion of the file can be skipped, otherwise False.
+        """
+        file_converter_list = [converter for converter in self._converter_list
+                               if converter.is_file_up_to_date(file_name) is False]
+
+        self._file_converter_dict[file_name] = file_converter_list
+
+        return 0 == len(file_converter_list)
+
+    def is_parallel_file_processing_supported(self) -> bool:
+        """
+        Check whether the files can be converted in parallel worker processes.
+        This is the case if all converters support it.
+
+        Returns:
+            bool: True if parallel processing is supported, otherwise False.
+        """
+        return all(converter.is_parallel_file_processing_supported() for converter in self._converter_list)
+
+    def get_file_result(self, file_name: str) -> List[any]:
+        """
+        Get the results of a file conversion of all converters, which converted the file.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            List[any]: The file conversion results in the order of the converters.
+        """
+        return [converter.get_file_result(file_name) for converter in self._get_file_converter_list(file_name)]
+
+    def merge_file_result(self, file_name: str, file_result: List[any]) -> None:
+        """
+        Merge the results of a file conversion, which was done in a worker process.
+
+        Args:
+            file_name (str): File name
+            file_result (List[any]): The file conversion results provided by get_file_result().
+        """
+        for converter, converter_file_result in zip(self._get_file_converter_list(file_name), file_result):
+            converter.merge_file_result(file_name, converter_file_result)
+
+    def take_worker_misses(self) -> List[any]:
+        """
+        Take the failed translations of all converters in a worker process since the last call.
+
+        Returns:
+            List[any]: The failed translations in the order of the converters.
+        """
+        return [converter.take_worker_misses() for converter in self._converter_list]
+
+    def merge_worker_misses(self, misses: List[any]) -> None:
+        """
+        Merge the failed translations of all converters in a worker process.
+
+        Args:
+            misses (List[any]): The failed translations provided by take_worker_misses().
+        """
+        for converter, converter_misses in zip(self._converter_list, misses):
+            converter.merge_worker_misses(converter_misses)
+
+    def is_parallel_item_processing_supported(self) -> bool:
+        """
+        Check whether the items can be rendered into fragments in parallel worker processes.
+        This is the case if all converters support it.
+
+        Returns:
+            bool: True if parallel processing is supported, otherwise False.
+        """
+        return all(converter.is_parallel_item_processing_supported() for converter in self._converter_list)
+
+    def begin_fragment(self) -> None:
+        """
+        Begin to render the following items into a fragment per converter.
+        The fragments are rendered by all converters, because a converter which supports it
+        converts every file into the same output, therefore no file is up to date.
+        """
+        for converter in self._converter_list:
+            converter.begin_fragment()
+
+    def end_fragment(self) -> str:
+        """
+        End to render items into a fragment per converter.
+
+        Returns:
+            str: The fragments of the converters, encoded as JSON array.
+        """
+        return json.dumps([converter.end_fragment() for converter in self._converter_list])
+
+    def write_fragment(self, fragment: str) -> Ret:
+        """
+        Write the fragments, which were rendered by a worker process, to the converters.
+
+        Args:
+            fragment (str): The fragments provided by end_fragment().
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        for converter, converter_fragment in zip(self._converter_list, json.loads(fragment)):
+            result = converter.write_fragment(converter_fragment)
+
+            if result != Ret.OK:
+                break
+
+        return result
+
+    def finish_background_jobs(self) -> Ret:
+        """
+        Wait until all jobs, which the converters started in the background, are finished.
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        # Wait for the jobs of all converters, even if one of them failed.
+        for converter in self._converter_list:
+            if converter.finish_background_jobs() != Ret.OK:
+                result = Ret.ERROR
+
+        return result
+
+    def enter_file(self, file_name: str) -> Ret:
+        """
+        Let the converters, whose output of the file is not up to date, enter the file.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+        self._file_converter_list = self._get_file_converter_list(file_name)
+
+        for converter in self._file_converter_list:
+            result = converter.enter_file(file_name)
+
+            if result != Ret.OK:
+                break
+
+        return result
+
+    def leave_file(self, file_name: str) -> Ret:
+        """
+        Let the converters leave the file.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        for converter in self._file_converter_list:
+            result = converter.leave_file(file_name)
+
+            if result != Ret.OK:
+                break
+
+        return result
+
+    def convert_section(self, section: str, level: int) -> Ret:
+        """
+        Pass the given section item to the converters.
+
+        Args:
+            section (str): The section name
+            level (int): The section indentation level
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        for converter in self._file_converter_list:
+            result = converter.convert_section(section, level)
+
+            if result != Ret.OK:
+                break
+
+        return result
+
+    def convert_record_object(self, record: Record_Object, level: int) -> Ret:
+        """
+        Pass the given record object to the converters.
+
+        Args:
+            record (Record_Object): The record object
+            level (int): The record indentation level
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        for converter in self._file_converter_list:
+            result = converter.convert_record_object(record, level)
+
+            if result != Ret.OK:
+                break
+
+        return result
+
+    def finish(self) -> Ret:
+        """
+        Finish the conversion process of all converters.
+
+        Returns:
+            Ret: Status
+        """
+        result = Ret.OK
+
+        # Finish all converters, even if one of them failed, to close their output files.
+        for converter in self._converter_list:
+            if converter.finish() != Ret.OK:
+                result = Ret.ERROR
+
+        return result
+
+    def _get_file_converter_list(self, file_name: str) -> List[AbstractConverter]:
+        """
+        Get the converters, which convert the given file.
+
+        Args:
+            file_name (str): File name
+
+        Returns:
+            List[AbstractConverter]: The converters whose output of the file is not up to date.
+        """
+        return self._file_converter_dict.get(file_name, self._converter_list)
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
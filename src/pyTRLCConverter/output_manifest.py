@@ -0,0 +1,291 @@
+"""Manifest of generated output files for incremental conversion.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import hashlib
+import json
+import os
+from typing import List, Optional
+from pyTRLCConverter.logger import log_verbose
+from pyTRLCConverter import version
+
+# Variables ********************************************************************
+
+# Program arguments which have no influence on the generated output.
+NON_OUTPUT_ARGS = ["verbose", "cache_dir", "watch", "incremental", "jobs", "profile"]
+
+# Program arguments which refer to files whose content influences the generated output.
+FILE_ARGS = ["project", "translation"]
+
+# Classes **********************************************************************
+
+class OutputManifest():
+    # lobster-trace: SwRequirements.sw_req_markdown_incremental
+    # lobster-trace: SwRequirements.sw_req_rst_incremental
+    """
+    The manifest records for every generated output file the hash of its TRLC source file,
+    the hashes of the files its record references point into, the hash of the references
+    into its records and a fingerprint of the converter arguments and the TRLC model.
+    An output file is up to date if none of them changed.
+    """
+
+    FILE_NAME = ".pyTRLCConverter_manifest.json"
+
+    # Version of the manifest file format.
+    FORMAT_VERSION = 1
+
+    def __init__(self, out_path: str, fingerprint: str) -> None:
+        """
+        Initializes the manifest.
+
+        Args:
+            out_path (str): The output folder where the manifest is stored.
+            fingerprint (str): Fingerprint of the converter arguments.
+        """
+        self._file_name = os.path.join(out_path, OutputManifest.FILE_NAME)
+        self._out_path = out_path
+        self._fingerprint = fingerprint
+        self._entries = {}  # type: dict[str, dict]
+        self._current_entry = None
+        self._file_hash_dict = {}  # type: dict[str, Optional[str]]
+
+    @staticmethod
+    def create_fingerprint(args: any, model_file_names: Optional[List[str]] = None) -> str:
+        """
+        Create the fingerprint of the given program arguments and TRLC model.
+        It considers the tool version, the arguments which influence the output,
+        the content of the project specific converter and the translation file and
+        the content of the .rsl files, because every output depends on the types.
+
+        Args:
+            args (any): The parsed program arguments.
+            model_file_names (Optional[List[str]]): The .rsl files of the TRLC model.
+
+        Returns:
+            str: Fingerprint
+        """
+        args_dict = {"version": version.__version__}
+
+        for arg_name, arg_value in sorted(vars(args).items()):
+            if arg_name not in NON_OUTPUT_ARGS:
+                args_dict[arg_name] = str(arg_value)
+
+            if (arg_name in FILE_ARGS) and isinstance(arg_value, str):
+                file_name = arg_value
+
+                # The project specific converter may be given without file extension.
+                if (arg_name == "project") and (os.path.isfile(file_name) is False):
+                    file_name += ".py"
+
+                args_dict[arg_name + "_hash"] = OutputManifest._hash_file(file_name)
+
+        if model_file_names is not None:
+            args_dict["model_hash"] = {file_name: OutputManifest._hash_file(file_name) for file_name in model_file_names}
+
+        args_json = json.dumps(args_dict, sort_keys=True)
+
+        return hashlib.sha256(args_json.encode("utf-8")).hexdigest()
+
+    def load(self) -> None:
+        """
+        Load the manifest from the output folder.
+        If there is no valid manifest or it was created with different arguments,
+        all output files are considered as stale.
+        """
+        self._entries = {}
+
+        try:
+            with open(self._file_name, "r", encoding="utf-8") as fd:
+                manifest = json.load(fd)
+
+            if manifest.get("format") != OutputManifest.FORMAT_VERSION:
+                log_verbose(f"Ignoring manifest {self._file_name} due to unsupported format.")
+            elif manifest.get("fingerprint") != self._fingerprint:
+                log_verbose(f"Ignoring manifest {self._file_name}, " \
+                            "because the converter arguments or the TRLC model changed.")
+            else:
+                self._entries = manifest.get("files", {})
+
+        except FileNotFoundError:
+            log_verbose(f"No manifest {self._file_name} available.")
+
+        except (OSError, ValueError, AttributeError) as exc:
+            log_verbose(f"Ignoring invalid manifest {self._file_name}: {exc}")
+
+    def save(self) -> None:
+        """
+        Save the manifest to the output folder.
+
+        Raises:
+            OSError: Failed to write the manifest.
+        """
+        self._current_entry = None
+
+        manifest = {
+            "format": OutputManifest.FORMAT_VERSION,
+            "fingerprint": self._fingerprint,
+            "files": self._entries
+        }
+
+        with open(self._file_name, "w", encoding="utf-8") as fd:
+            json.dump(manifest, fd, indent=4, sort_keys=True)
+
+    def is_up_to_date(self, out_file_name: str, source_file_name: str,
+                      referenced_by_hash: Optional[str] = None) -> bool:
+        """
+        Check whether the output file is up to date.
+
+        Args:
+            out_file_name (str): The output file name without path.
+            source_file_name (str): The TRLC source file name.
+            referenced_by_hash (Optional[str]): The hash of the references into the records of
+                the TRLC source file, if the output shows them.
+
+        Returns:
+            bool: True if the output file is up to date, otherwise False.
+        """
+        is_up_to_date = False
+        entry = self._entries.get(out_file_name)
+
+        if (entry is not None) and \
+           (os.path.isfile(os.path.join(self._out_path, out_file_name)) is True) and \
+           (entry.get("source") == source_file_name) and \
+           (entry.get("source_hash") == self._get_file_hash(source_file_name)) and \
+           (entry.get("referenced_by_hash") == referenced_by_hash):
+
+            is_up_to_date = True
+
+            for reference_file_name, reference_hash in entry.get("references", {}).items():
+                if self._get_file_hash(reference_file_name) != reference_hash:
+                    is_up_to_date = False
+                    break
+
+        return is_up_to_date
+
+    def remove_deleted_sources(self) -> None:
+        """
+        Remove the entries and the output files of the TRLC source files which don't exist anymore.
+        """
+        for out_file_name, entry in list(self._entries.items()):
+            if os.path.isfile(entry.get("source", "")) is False:
+                log_verbose(f"Removing {out_file_name}, because its source {entry.get('source')} was deleted.")
+
+                try:
+                    os.remove(os.path.join(self._out_path, out_file_name))
+                except FileNotFoundError:
+                    pass
+
+                del self._entries[out_file_name]
+
+    def begin_entry(self, out_file_name: str, source_file_name: str,
+                    referenced_by_hash: Optional[str] = None) -> None:
+        """
+        Begin the manifest entry of a output file which is generated now.
+        All references added afterwards belong to this entry.
+
+        Args:
+            out_file_name (str): The output file name without path.
+            source_file_name (str): The TRLC source file name.
+            referenced_by_hash (Optional[str]): The hash of the references into the records of
+                the TRLC source file, if the output shows them.
+        """
+        self._current_entry = {
+            "source": source_file_name,
+            "source_hash": self._get_file_hash(source_file_name),
+            "referenced_by_hash": referenced_by_hash,
+            "references": {}
+        }
+        self._entries[out_file_name] = self._current_entry
+
+    def get_entry(self, out_file_name: str) -> Optional[dict]:
+        """
+        Get the manifest entry of a output file.
+
+        Args:
+            out_file_name (str): The output file name without path.
+
+        Returns:
+            Optional[dict]: The manifest entry or None if not available.
+        """
+        return self._entries.get(out_file_name)
+
+    def set_entry(self, out_file_name: str, entry: dict) -> None:
+        """
+        Set the manifest entry of a output file, e.g. one created by a worker process.
+
+        Args:
+            out_file_name (str): The output file name without path.
+            entry (dict): The manifest entry.
+        """
+        self._entries[out_file_name] = entry
+
+    def add_reference(self, file_name: str) -> None:
+        """
+        Add a file where a record reference of the current output file points into.
+
+        Args:
+            file_name (str): The file name of the referenced record.
+        """
+        if self._current_entry is not None:
+            file_name = os.path.normpath(file_name)
+
+            if file_name != self._current_entry["source"]:
+                self._current_entry["references"][file_name] = self._get_file_hash(file_name)
+
+    def _get_file_hash(self, file_name: str) -> Optional[str]:
+        """
+        Get the hash of the file content. Every file is read only once per run.
+
+        Args:
+            file_name (str): The file name.
+
+        Returns:
+            Optional[str]: The file hash or None if the file doesn't exist.
+        """
+        if file_name not in self._file_hash_dict:
+            self._file_hash_dict[file_name] = OutputManifest._hash_file(file_name)
+
+        return self._file_hash_dict[file_name]
+
+    @staticmethod
+    def _hash_file(file_name: str) -> Optional[str]:
+        """
+        Calculate the hash of the file content.
+
+        Args:
+            file_name (str): The file name.
+
+        Returns:
+            Optional[str]: The file hash or None if the file can't be read.
+        """
+        file_hash = None
+
+        try:
+            with open(file_name, "rb") as fd:
+                file_hash = hashlib.sha256(fd.read()).hexdigest()
+        except OSError:
+            pass
+
+        return file_hash
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
@@ -0,0 +1,274 @@
+"""Persistent, content-addressed cache for parsed TRLC symbol tables.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import hashlib
+import os
+from typing import List, Optional
+from trlc.ast import Symbol_Table
+from trlc.version import TRLC_VERSION
+from pyTRLCConverter.logger import log_verbose
+from pyTRLCConverter.symbol_table_pickle import PICKLING_ERRORS, UNPICKLING_ERRORS, SymbolTablePickler, \
+    SymbolTableUnpickler
+
+# Variables ********************************************************************
+
+# File extension of a cache entry inside the cache folder.
+CACHE_FILE_EXTENSION = ".pickle"
+
+# Default max. number of cache entries. Every change of a TRLC file results in a new entry,
+# e.g. in watch mode, but usually only the most recent ones are used again.
+PARSE_CACHE_ENTRIES_MAX_DEFAULT = 4
+
+# Classes **********************************************************************
+
+class ParseCache():
+    # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+    # lobster-trace: SwRequirements.sw_req_cli_watch
+    """
+    On-disk cache for TRLC symbol tables.
+
+    A cache entry is addressed by a key which is derived from the TRLC version and
+    the names and contents of all registered source and include files. If any of them
+    changes, a different key results and the TRLC files will be parsed again.
+
+    The most recent symbol table is additionally kept in memory, which avoids loading
+    it again in a long running process.
+
+    If the number of entries exceeds the limit, the least recently used entries are
+    removed. Every cache hit updates the modification time of its entry, which is used
+    to find the least recently used ones.
+    """
+
+    def __init__(self, cache_dir: Optional[str], entries_max: int = PARSE_CACHE_ENTRIES_MAX_DEFAULT) -> None:
+        """
+        Initializes the parse cache.
+
+        Args:
+            cache_dir (Optional[str]): The folder where the cache entries are stored.
+                                       If None, the symbol table is only cached in memory.
+            entries_max (int): Max. number of cache entries in the cache folder.
+        """
+        self._cache_dir = cache_dir
+        self._entries_max = entries_max
+        self._hits = 0
+        self._misses = 0
+        self._last_key = None
+        self._last_symbol_table = None
+
+    def get_hits(self) -> int:
+        """
+        Get the number of cache hits.
+
+        Returns:
+            int: Number of cache hits
+        """
+        return self._hits
+
+    def get_misses(self) -> int:
+        """
+        Get the number of cache misses.
+
+        Returns:
+            int: Number of cache misses
+        """
+        return self._misses
+
+    @staticmethod
+    def create_key(file_list: List[str], excludes: Optional[List[str]] = None) -> str:
+        """
+        Create the cache key from the given files.
+
+        Args:
+            file_list (List[str]): The registered source and include files.
+            excludes (Optional[List[str]]): The excluded paths, whose files are parsed on demand only.
+
+        Returns:
+            str: Cache key
+        """
+        hash_obj = hashlib.sha256()
+        hash_obj.update(TRLC_VERSION.encode("utf-8"))
+
+        if excludes is not None:
+            for excluded_path in sorted(os.path.abspath(path) for path in excludes):
+                hash_obj.update(b"\0exclude\0")
+                hash_obj.update(excluded_path.encode("utf-8"))
+
+        for file_name in sorted(file_list):
+            hash_obj.update(b"\0")
+            hash_obj.update(file_name.encode("utf-8"))
+            hash_obj.update(b"\0")
+
+            with open(file_name, "rb") as fd:
+                hash_obj.update(hashlib.sha256(fd.read()).digest())
+
+        return hash_obj.hexdigest()
+
+    def load(self, key: str) -> Optional[Symbol_Table]:
+        """
+        Load the symbol table of the given cache key.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Optional[Symbol_Table]: The cached symbol table or None in case of a cache miss.
+        """
+        symbol_table = None
+
+        if key == self._last_key:
+            log_verbose("Using symbol table from memory.")
+            symbol_table = self._last_symbol_table
+
+        elif self._cache_dir is not None:
+            symbol_table = self._load_file(key)
+
+        if symbol_table is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._last_key = key
+            self._last_symbol_table = symbol_table
+
+        return symbol_table
+
+    def _load_file(self, key: str) -> Optional[Symbol_Table]:
+        """
+        Load the symbol table of the given cache key from the cache folder.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Optional[Symbol_Table]: The cached symbol table or None if not available.
+        """
+        symbol_table = None
+        file_name = self._get_file_name(key)
+
+        if os.path.isfile(file_name):
+            try:
+                with open(file_name, "rb") as fd:
+                    symbol_table = SymbolTableUnpickler(fd).load()
+
+            except UNPICKLING_ERRORS as exc:
+                log_verbose(f"Failed to load parse cache entry {file_name}: {exc}")
+                symbol_table = None
+
+        if symbol_table is not None:
+            log_verbose(f"Loaded symbol table from parse cache entry {file_name}.")
+
+            try:
+                # Mark it as most recently used.
+                os.utime(file_name)
+
+            except OSError:
+                pass
+
+        return symbol_table
+
+    def store(self, key: str, symbol_table: Symbol_Table) -> None:
+        """
+        Store the symbol table for the given cache key.
+        A failure is not critical, because it just results in a cache miss in the next run.
+
+        Args:
+            key (str): Cache key
+            symbol_table (Symbol_Table): The symbol table to store.
+        """
+        self._last_key = key
+        self._last_symbol_table = symbol_table
+
+        if self._cache_dir is not None:
+            self._store_file(key, symbol_table)
+
+    def _store_file(self, key: str, symbol_table: Symbol_Table) -> None:
+        """
+        Store the symbol table for the given cache key in the cache folder.
+
+        Args:
+            key (str): Cache key
+            symbol_table (Symbol_Table): The symbol table to store.
+        """
+        file_name = self._get_file_name(key)
+        file_name_tmp = file_name + f".{os.getpid()}.tmp"
+
+        try:
+            if not os.path.exists(self._cache_dir):
+                os.makedirs(self._cache_dir)
+
+            with open(file_name_tmp, "wb") as fd:
+                SymbolTablePickler(fd).dump(symbol_table)
+
+            # Replace it atomically to avoid that a parallel run reads a partial written entry.
+            os.replace(file_name_tmp, file_name)
+
+            log_verbose(f"Stored symbol table in parse cache entry {file_name}.")
+
+        except PICKLING_ERRORS as exc:
+            log_verbose(f"Failed to store parse cache entry {file_name}: {exc}")
+
+            if os.path.exists(file_name_tmp):
+                os.remove(file_name_tmp)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the number of entries is within the limit.
+        """
+        entry_list = []
+
+        try:
+            with os.scandir(self._cache_dir) as dir_iter:
+                for entry in dir_iter:
+                    if (entry.is_file() is True) and (entry.name.endswith(CACHE_FILE_EXTENSION) is True):
+                        entry_list.append((entry.stat().st_mtime_ns, entry.path))
+
+        except OSError:
+            pass
+
+        # Oldest first.
+        entry_list.sort()
+
+        for _, entry_path in entry_list[:max(0, len(entry_list) - self._entries_max)]:
+            try:
+                os.remove(entry_path)
+                log_verbose(f"Removed parse cache entry {entry_path}.")
+
+            except OSError:
+                # Maybe removed by a parallel run already.
+                pass
+
+    def _get_file_name(self, key: str) -> str:
+        """
+        Get the cache entry file name of the given key.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            str: File name with path
+        """
+        return os.path.join(self._cache_dir, key + CACHE_FILE_EXTENSION)
+
+# Functions ********************************************************************
+
+# Main *************************************************************************
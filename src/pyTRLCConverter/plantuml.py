@@ -20,16 +20,25 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import hashlib
 import os
+import shutil
 import subprocess
 import sys
+import threading
 import zlib
 import base64
 import urllib
 import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from pyTRLCConverter.image_cache import ImageCache, IMAGE_CACHE_SIZE_MAX_DEFAULT
 from pyTRLCConverter.logger import log_verbose, log_error
+from pyTRLCConverter.profiler import CATEGORY_PLANTUML, measure
 
 # Variables ********************************************************************
 
@@ -38,17 +47,71 @@ from pyTRLCConverter.logger import log_verbose, log_error
 BASE64_ENCODE_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
 PLANTUML_ENCODE_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-_"
 
+# Default max. number of diagrams which are generated concurrently in the background.
+MAX_JOBS_DEFAULT = 4
+
+# Max. number of diagrams which are generated by one batch in the background.
+# A batch is split into several PlantUML java processes by the max. command line length.
+BATCH_SIZE_MAX = 400
+
+# Max. length of the command line of a PlantUML java process.
+# It is limited to 32767 characters on Windows, the rest is kept as reserve.
+COMMAND_LINE_LENGTH_MAX = 32000
+
+# Default timeout in seconds of a request to the PlantUML server.
+TIMEOUT_DEFAULT = 10
+
+# Default max. number of retries of a failed request to the PlantUML server.
+RETRIES_DEFAULT = 3
+
+# Backoff factor of the retries, the n-th retry waits factor * 2 ^ (n - 1) seconds.
+RETRY_BACKOFF_FACTOR = 0.5
+
+# HTTP status codes of temporary server failures, which are retried.
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
 # Classes **********************************************************************
 
 
 class PlantUML():
     # lobster-trace: SwRequirements.sw_req_plantuml
     """PlantUML image generator.
+
+    The images can be generated synchronous by generate() or in the background by
+    generate_async(). Background jobs run concurrently in a thread pool and
+    wait_for_jobs() waits until all of them are finished.
+
+    With the local PlantUML java jar file, the background jobs are collected in batches
+    and every batch is generated by a single java process. This way the startup time of
+    the java virtual machine is spent once per batch instead of once per diagram.
+
+    With an image cache folder, the generated images are cached and an unchanged diagram
+    is copied from the cache without contacting the server or starting java. The folder
+    is given by parameter or by the PLANTUML_CACHE environment variable and its max. size
+    in MB by the PLANTUML_CACHE_SIZE environment variable.
+
+    All requests to the PlantUML server share a session, which keeps the connections alive
+    and retries temporary failures with backoff. The timeout in seconds is given by the
+    PLANTUML_TIMEOUT and the max. number of retries by the PLANTUML_RETRIES environment
+    variable. The same diagram is requested only once per run.
     """
-    def __init__(self) -> None:
+    def __init__(self, max_jobs: int = MAX_JOBS_DEFAULT, cache_dir: Optional[str] = None) -> None:
+        """Initializes the PlantUML image generator.
+
+        Args:
+            max_jobs (int): Max. number of diagrams which are generated concurrently in the background.
+            cache_dir (Optional[str]): The image cache folder. If None, the PLANTUML_CACHE environment
+                                       variable is used and if not set, no image cache is used.
+        """
         self._server_url = None
         self._plantuml_jar = None
         self._working_directory = os.path.abspath(os.getcwd())
+        self._max_jobs = max_jobs
+        self._executor = None  # type: Optional[ThreadPoolExecutor]
+        self._executor_pid = None  # type: Optional[int]
+        self._jobs = []  # type: List[Tuple[str, Future]]
+        self._batches = {}  # type: Dict[Tuple[str, str], List[Tuple[str, Future]]]
+        self._jobs_lock = threading.Lock()
 
         if "PLANTUML" in os.environ:
             plantuml_access = os.environ["PLANTUML"]
@@ -61,6 +124,54 @@ class PlantUML():
             except ValueError:
                 self._plantuml_jar = os.environ["PLANTUML"]
 
+        # lobster-trace: SwRequirements.sw_req_plantuml_cache
+        self._image_cache = None  # type: Optional[ImageCache]
+        self._backend_id = None  # type: Optional[str]
+
+        if (cache_dir is None) and ("PLANTUML_CACHE" in os.environ):
+            cache_dir = os.environ["PLANTUML_CACHE"]
+
+        if cache_dir is not None:
+            cache_size_max = PlantUML._get_env_number("PLANTUML_CACHE_SIZE", int, None)
+
+            if cache_size_max is None:
+                cache_size_max = IMAGE_CACHE_SIZE_MAX_DEFAULT
+            else:
+                cache_size_max *= 1024 * 1024
+
+            self._image_cache = ImageCache(cache_dir, cache_size_max)
+
+        # lobster-trace: SwRequirements.sw_req_plantuml_session
+        self._timeout = PlantUML._get_env_number("PLANTUML_TIMEOUT", float, TIMEOUT_DEFAULT)
+        self._retries = PlantUML._get_env_number("PLANTUML_RETRIES", int, RETRIES_DEFAULT)
+        self._session = None  # type: Optional[requests.Session]
+        self._session_pid = None  # type: Optional[int]
+        # The requests in progress and the image files written by completed requests, by URL.
+        self._requests = {}  # type: Dict[str, Future]
+        self._request_files = {}  # type: Dict[str, str]
+
+    @staticmethod
+    def _get_env_number(name: str, number_type: type, default: any) -> any:
+        """Get a number from an environment variable.
+
+        Args:
+            name (str): Name of the environment variable.
+            number_type (type): Type of the number, e.g. int or float.
+            default (any): Default value if the environment variable is not set or invalid.
+
+        Returns:
+            any: The number or the default value.
+        """
+        number = default
+
+        if name in os.environ:
+            try:
+                number = number_type(os.environ[name])
+            except ValueError:
+                log_error(f"{name} shall be a number.", True)
+
+        return number
+
     def _get_absolute_path(self, path):
         """Get absolute path to the diagram.
             This is required by PlantUML java program for the output path.
@@ -134,6 +245,14 @@ class PlantUML():
 
         return query_url
 
+    def get_image_cache(self) -> Optional[ImageCache]:
+        """Get the image cache.
+
+        Returns:
+            Optional[ImageCache]: The image cache or None if no image cache is used.
+        """
+        return self._image_cache
+
     def generate(self, diagram_type: str, diagram_path: str, dst_path: str) -> None:
         """Generate plantuml image.
 
@@ -148,10 +267,289 @@ class PlantUML():
             requests.exceptions.RequestException: Error during GET request to PlantUML server.
             OSError: Destination path does not exist.
         """
+        self.generate_batch(diagram_type, [diagram_path], dst_path)
+
+    def generate_batch(self, diagram_type: str, diagram_path_list: List[str], dst_path: str) -> None:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Generate plantuml images of several diagrams.
+            In local mode all diagrams are generated by a single java process.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
+            diagram_path_list (List[str]): Paths to the PlantUML diagrams.
+            dst_path (str): Path to the destination of the generated images.
+
+        Raises:
+            FileNotFoundError: PlantUML java jar file not found in local mode.
+            FileNotFoundError: PlantUML diagram file not found.
+            requests.exceptions.RequestException: Error during GET request to PlantUML server.
+            OSError: Destination path does not exist.
+        """
+        with measure(CATEGORY_PLANTUML, diagram_type, len(diagram_path_list)):
+            if self._image_cache is None:
+                self._generate_uncached(diagram_type, diagram_path_list, dst_path)
+            else:
+                self._generate_cached(diagram_type, diagram_path_list, dst_path)
+
+    def _generate_uncached(self, diagram_type: str, diagram_path_list: List[str], dst_path: str) -> None:
+        """Generate plantuml images of several diagrams by the server or the local java jar file.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
+            diagram_path_list (List[str]): Paths to the PlantUML diagrams.
+            dst_path (str): Path to the destination of the generated images.
+        """
         if self._server_url is not None:
-            self._generate_server(diagram_type, diagram_path, dst_path)
+            for diagram_path in diagram_path_list:
+                self._generate_server(diagram_type, diagram_path, dst_path)
         else:
-            self._generate_local(diagram_type, diagram_path, dst_path)
+            self._generate_local(diagram_type, diagram_path_list, dst_path)
+
+    def _generate_cached(self, diagram_type: str, diagram_path_list: List[str], dst_path: str) -> None:
+        # lobster-trace: SwRequirements.sw_req_plantuml_cache
+        """Generate plantuml images of several diagrams, but take the unchanged ones from the image cache.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
+            diagram_path_list (List[str]): Paths to the PlantUML diagrams.
+            dst_path (str): Path to the destination of the generated images.
+        """
+        backend_id = self._get_backend_id()
+        missing_list = []  # type: List[Tuple[str, Optional[str], Optional[int]]]
+
+        os.makedirs(dst_path, exist_ok=True)
+
+        for diagram_path in diagram_path_list:
+            key = None
+            output_file = PlantUML.get_output_file(diagram_type, diagram_path, dst_path)
+
+            if backend_id is not None:
+                key = ImageCache.get_key(diagram_type, diagram_path, backend_id)
+
+            if (key is None) or (self._image_cache.fetch(key, diagram_type, output_file) is False):
+                missing_list.append((diagram_path, key, PlantUML._get_mtime(output_file)))
+
+        if 0 < len(missing_list):
+            self._generate_uncached(diagram_type, [diagram_path for diagram_path, _, _ in missing_list], dst_path)
+
+            for diagram_path, key, mtime in missing_list:
+                output_file = PlantUML.get_output_file(diagram_type, diagram_path, dst_path)
+                new_mtime = PlantUML._get_mtime(output_file)
+
+                # Only a new generated image is stored, not one which is left from a previous run.
+                if (key is not None) and (new_mtime is not None) and (new_mtime != mtime):
+                    self._image_cache.store(key, diagram_type, output_file)
+
+            self._image_cache.evict()
+
+    def _get_backend_id(self) -> Optional[str]:
+        """Get the identity of the backend which generates the images.
+            Its the server URL or the hash of the local java jar file.
+
+        Returns:
+            Optional[str]: The backend identity or None if the java jar file can't be read.
+        """
+        with self._jobs_lock:
+            if self._backend_id is None:
+                if self._server_url is not None:
+                    self._backend_id = f"server:{self._server_url}"
+
+                elif self._plantuml_jar is not None:
+                    try:
+                        hash_obj = hashlib.sha256()
+
+                        with open(self._plantuml_jar, "rb") as fd:
+                            for chunk in iter(lambda: fd.read(1024 * 1024), b""):
+                                hash_obj.update(chunk)
+
+                        self._backend_id = f"jar:{hash_obj.hexdigest()}"
+                    except OSError:
+                        pass
+
+            backend_id = self._backend_id
+
+        return backend_id
+
+    @staticmethod
+    def _get_mtime(file_name: str) -> Optional[int]:
+        """Get the modification time of a file.
+
+        Args:
+            file_name (str): The file name with path.
+
+        Returns:
+            Optional[int]: The modification time in ns or None if the file doesn't exist.
+        """
+        mtime = None
+
+        try:
+            mtime = os.stat(file_name).st_mtime_ns
+        except OSError:
+            pass
+
+        return mtime
+
+    @staticmethod
+    def get_output_file(diagram_type: str, diagram_path: str, dst_path: str) -> str:
+        """Get the file name of the generated image.
+            PlantUML uses the diagram name if available, which may differ from the file name.
+            Therefore its expected that both are equal.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
+            diagram_path (str): Path to the PlantUML diagram.
+            dst_path (str): Path to the destination of the generated image.
+
+        Returns:
+            str: The image file name with path.
+        """
+        output_file = os.path.splitext(os.path.basename(diagram_path))[0]
+        output_file += "." + diagram_type
+
+        return os.path.join(dst_path, output_file)
+
+    def generate_async(self, diagram_type: str, diagram_path: str, dst_path: str) -> Future:
+        # lobster-trace: SwRequirements.sw_req_plantuml_async
+        """Generate plantuml image in the background.
+            The image file name is known in advance by get_output_file(), so a link to the
+            image can be written immediately. Call wait_for_jobs() before the images are used.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
+            diagram_path (str): Path to the PlantUML diagram.
+            dst_path (str): Path to the destination of the generated image.
+
+        Returns:
+            Future: Its result is the image file name with path. It raises the exceptions
+                    of generate() or FileNotFoundError if the image was not generated.
+        """
+        with self._jobs_lock:
+            # A forked worker process inherits the executor, but not its threads.
+            if (self._executor is None) or (self._executor_pid != os.getpid()):
+                self._executor = ThreadPoolExecutor(max_workers=self._max_jobs,
+                                                    thread_name_prefix="plantuml")
+                self._executor_pid = os.getpid()
+                self._jobs = []
+                self._batches = {}
+
+            # lobster-trace: SwRequirements.sw_req_plantuml_batch
+            if self._plantuml_jar is not None:
+                future = Future()
+                batch = self._batches.setdefault((diagram_type, dst_path), [])
+                batch.append((diagram_path, future))
+
+                if BATCH_SIZE_MAX <= len(batch):
+                    self._submit_batch(diagram_type, dst_path)
+            else:
+                future = self._executor.submit(self._generate_job, diagram_type, diagram_path, dst_path)
+
+            self._jobs.append((diagram_path, future))
+
+        return future
+
+    def wait_for_jobs(self) -> List[str]:
+        # lobster-trace: SwRequirements.sw_req_plantuml_async
+        """Wait until all background jobs are finished.
+
+        Returns:
+            List[str]: The error messages of all failed jobs in the order they were started.
+        """
+        errors = []
+
+        with self._jobs_lock:
+            # Start the not yet full batches.
+            for diagram_type, dst_path in list(self._batches):
+                self._submit_batch(diagram_type, dst_path)
+
+            jobs = self._jobs
+            self._jobs = []
+
+        wait([future for _, future in jobs])
+
+        for diagram_path, future in jobs:
+            exc = future.exception()
+
+            if exc is not None:
+                errors.append(f"{diagram_path}: {exc}")
+
+        return errors
+
+    def _generate_job(self, diagram_type: str, diagram_path: str, dst_path: str) -> str:
+        """Generate plantuml image and check the generated image file.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
+            diagram_path (str): Path to the PlantUML diagram.
+            dst_path (str): Path to the destination of the generated image.
+
+        Raises:
+            FileNotFoundError: The image file was not generated.
+
+        Returns:
+            str: The image file name with path.
+        """
+        self.generate(diagram_type, diagram_path, dst_path)
+
+        return PlantUML._check_output_file(diagram_type, diagram_path, dst_path)
+
+    def _submit_batch(self, diagram_type: str, dst_path: str) -> None:
+        """Submit the collected batch of diagrams to the executor.
+            The caller shall hold the jobs lock.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
+            dst_path (str): Path to the destination of the generated images.
+        """
+        batch = self._batches.pop((diagram_type, dst_path))
+        self._executor.submit(self._generate_batch_job, diagram_type, batch, dst_path)
+
+    def _generate_batch_job(self, diagram_type: str, batch: List[Tuple[str, Future]], dst_path: str) -> None:
+        # lobster-trace: SwRequirements.sw_req_plantuml_batch
+        """Generate plantuml images of a batch and resolve the future of every diagram.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
+            batch (List[Tuple[str, Future]]): The diagram paths with their futures.
+            dst_path (str): Path to the destination of the generated images.
+        """
+        try:
+            self.generate_batch(diagram_type, [diagram_path for diagram_path, _ in batch], dst_path)
+
+            for diagram_path, future in batch:
+                try:
+                    future.set_result(PlantUML._check_output_file(diagram_type, diagram_path, dst_path))
+                except FileNotFoundError as exc:
+                    future.set_exception(exc)
+
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for _, future in batch:
+                if future.done() is False:
+                    future.set_exception(exc)
+
+    @staticmethod
+    def _check_output_file(diagram_type: str, diagram_path: str, dst_path: str) -> str:
+        """Check that the image file of the diagram was generated.
+
+        Args:
+            diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
+            diagram_path (str): Path to the PlantUML diagram.
+            dst_path (str): Path to the destination of the generated image.
+
+        Raises:
+            FileNotFoundError: The image file was not generated.
+
+        Returns:
+            str: The image file name with path.
+        """
+        output_file = PlantUML.get_output_file(diagram_type, diagram_path, dst_path)
+
+        if os.path.isfile(output_file) is False:
+            raise FileNotFoundError(
+                f"{diagram_path} diagram name ('@startuml <name>') may differ from file name, "
+                f"expected {output_file}."
+            )
+
+        return output_file
 
     def _generate_server(self, diagram_type: str, diagram_path: str, dst_path: str) -> None:
         """Generate image using a plantuml server.
@@ -169,32 +567,113 @@ class PlantUML():
             OSError: Destination path does not exist.
             requests.exceptions.RequestException: Error during GET request to PlantUML server.
         """
-        if not os.path.exists(dst_path):
-            os.makedirs(dst_path)
+        # Concurrent jobs may create it at the same time.
+        os.makedirs(dst_path, exist_ok=True)
 
-        # Send GET request to the PlantUML server.
+        # Send GET request to the PlantUML server and save the response content in image file.
         url = self._make_server_url(diagram_type, diagram_path)
-        log_verbose(f"Sending GET request {url}")
-        response = requests.get(url, timeout=10)
-
-        if response.status_code == 200:
-            # Save the response content in image file.
-            output_file = os.path.splitext(os.path.basename(diagram_path))[0]
-            output_file += "." + diagram_type
-            output_file = os.path.join(dst_path, output_file)
-            with open(output_file, 'wb') as f:
-                f.write(response.content)
-
-            log_verbose(f"Diagram saved as {output_file}.")
-        else:
-            raise requests.exceptions.RequestException(f"{response.status_code} - {response.text}")
+        output_file = PlantUML.get_output_file(diagram_type, diagram_path, dst_path)
+        self._request_server_image(url, output_file)
 
-    def _generate_local(self, diagram_type, diagram_path, dst_path):
-        """Generate image local call to plantuml.jar.
+        log_verbose(f"Diagram saved as {output_file}.")
+
+    def _request_server_image(self, url: str, output_file: str) -> None:
+        # lobster-trace: SwRequirements.sw_req_plantuml_session
+        """Request the image by a GET request to the PlantUML server and save it in the output file.
+            An URL is requested only once, all further calls copy the image file written by the first one.
+            Concurrent calls with the same URL wait for the first one. Only the image file name is
+            kept per URL, not the response content.
+
+        Args:
+            url (str): The URL of the GET request.
+            output_file (str): The image file name with path.
+
+        Raises:
+            OSError: Image file can't be written.
+            requests.exceptions.RequestException: Error during GET request to PlantUML server.
+        """
+        with self._jobs_lock:
+            session = self._get_session()
+            image_file = self._request_files.get(url)
+
+            # The image file may be removed in the meantime, e.g. in watch mode.
+            if (image_file is not None) and (os.path.isfile(image_file) is False):
+                image_file = None
+                self._request_files.pop(url, None)
+
+            future = self._requests.get(url)
+            is_requester = (image_file is None) and (future is None)
+
+            if is_requester is True:
+                future = Future()
+                self._requests[url] = future
+
+        if is_requester is True:
+            try:
+                log_verbose(f"Sending GET request {url}")
+                response = session.get(url, timeout=self._timeout)
+
+                if response.status_code != 200:
+                    raise requests.exceptions.RequestException(f"{response.status_code} - {response.text}")
+
+                with open(output_file, 'wb') as f:
+                    f.write(response.content)
+
+                with self._jobs_lock:
+                    self._request_files[url] = output_file
+                    self._requests.pop(url, None)
+
+                future.set_result(output_file)
+
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # A later call shall try it again.
+                with self._jobs_lock:
+                    self._requests.pop(url, None)
+
+                future.set_exception(exc)
+
+        if image_file is None:
+            image_file = future.result()
+
+        if os.path.abspath(image_file) != os.path.abspath(output_file):
+            shutil.copyfile(image_file, output_file)
+
+    def _get_session(self) -> requests.Session:
+        # lobster-trace: SwRequirements.sw_req_plantuml_session
+        """Get the session for the requests to the PlantUML server.
+            The caller shall hold the jobs lock.
+
+        Returns:
+            requests.Session: The session.
+        """
+        # A forked worker process shall not share the connections with its parent.
+        if (self._session is None) or (self._session_pid != os.getpid()):
+            retry = Retry(
+                total=self._retries,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=["GET"],
+                raise_on_status=False
+            )
+            adapter = HTTPAdapter(pool_maxsize=self._max_jobs, max_retries=retry)
+
+            self._session = requests.Session()
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            self._session_pid = os.getpid()
+            self._requests = {}
+            self._request_files = {}
+
+        return self._session
+
+    def _generate_local(self, diagram_type, diagram_path_list, dst_path):
+        """Generate images local call to plantuml.jar.
+            All diagrams are generated by a single java process, unless its command line
+            would exceed COMMAND_LINE_LENGTH_MAX. Then they are split into several ones.
 
         Args:
             diagram_type (str): Diagram type, e.g. svg. See PlantUML -t options.
-            diagram_path (str): Path to the PlantUML diagram.
+            diagram_path_list (List[str]): Paths to the PlantUML diagrams.
             dst_path (str): Path to the destination of the generated image.
 
         Raises:
@@ -203,33 +682,66 @@ class PlantUML():
         """
         if self._plantuml_jar is not None:
 
-            if not os.path.exists(dst_path):
-                os.makedirs(dst_path)
+            # Concurrent jobs may create it at the same time.
+            os.makedirs(dst_path, exist_ok=True)
 
             plantuml_cmd = ["java" ]
 
             if sys.platform.startswith("linux"):
                 plantuml_cmd.append("-Djava.awt.headless=true")
 
-            plantuml_cmd.extend(
-                [
-                    "-jar", f"{self._plantuml_jar}",
-                    f"{diagram_path}",
-                    f"-t{diagram_type}",
-                    "-o", self._get_absolute_path(dst_path)
-                ]
-            )
-
-            try:
-                output = subprocess.run(plantuml_cmd, capture_output=True, text=True, check=False)
-                if output.stderr:
-                    log_error(output.stderr, True)
-                print(output.stdout)
-            except FileNotFoundError as exc:
-                raise FileNotFoundError(f"{self._plantuml_jar} not found.") from exc
+            plantuml_cmd.extend(["-jar", f"{self._plantuml_jar}"])
+            plantuml_options = [
+                f"-t{diagram_type}",
+                "-o", self._get_absolute_path(dst_path)
+            ]
+            paths_length_max = COMMAND_LINE_LENGTH_MAX - len(subprocess.list2cmdline(plantuml_cmd + plantuml_options))
+
+            for diagram_paths in _split_by_command_line_length(diagram_path_list, paths_length_max):
+                try:
+                    output = subprocess.run(plantuml_cmd + diagram_paths + plantuml_options,
+                                            capture_output=True, text=True, check=False)
+                    if output.stderr:
+                        log_error(output.stderr, True)
+                    print(output.stdout)
+                except FileNotFoundError as exc:
+                    raise FileNotFoundError(f"{self._plantuml_jar} not found.") from exc
         else:
             raise FileNotFoundError("plantuml.jar not found, set PLANTUML environment variable.")
 
 # Functions ********************************************************************
 
+def _split_by_command_line_length(diagram_path_list: List[str], length_max: int) -> List[List[str]]:
+    # lobster-trace: SwRequirements.sw_req_plantuml_batch
+    """Split the diagram paths into parts, whose command line arguments don't exceed the given length.
+        Every part contains at least one diagram path.
+
+    Args:
+        diagram_path_list (List[str]): Paths to the PlantUML diagrams.
+        length_max (int): Max. length of the command line arguments of a part.
+
+    Returns:
+        List[List[str]]: The parts of the diagram paths in the original order.
+    """
+    part_list = []
+    part = []
+    part_length = 0
+
+    for diagram_path in diagram_path_list:
+        # The argument is separated by a space and quoted if required.
+        length = len(subprocess.list2cmdline([diagram_path])) + 1
+
+        if (0 < len(part)) and (length_max < part_length + length):
+            part_list.append(part)
+            part = []
+            part_length = 0
+
+        part.append(diagram_path)
+        part_length += length
+
+    if 0 < len(part):
+        part_list.append(part)
+
+    return part_list
+
 # Main *************************************************************************
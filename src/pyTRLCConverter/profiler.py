@@ -0,0 +1,282 @@
+"""Profiler which records the wall and CPU time of the conversion phases.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Tuple
+
+# Variables ********************************************************************
+
+# Categories of the recorded samples in the order of the summary.
+CATEGORY_PHASE = "phase"
+CATEGORY_FILE = "file"
+CATEGORY_RECORD_TYPE = "record_type"
+CATEGORY_RECORD_HANDLER = "record_handler"
+CATEGORY_PLANTUML = "plantuml"
+CATEGORY_OUTPUT = "output"
+CATEGORY_LIST = [
+    CATEGORY_PHASE,
+    CATEGORY_FILE,
+    CATEGORY_RECORD_TYPE,
+    CATEGORY_RECORD_HANDLER,
+    CATEGORY_PLANTUML,
+    CATEGORY_OUTPUT
+]
+
+# Max. number of entries per category in the summary, the JSON file contains all.
+SUMMARY_ENTRIES_MAX = 20
+
+_PROFILE_ENABLED = False
+
+# Recorded samples: category -> name -> [count, wall time, CPU time].
+_SAMPLES = {}  # type: Dict[str, Dict[str, List[float]]]
+_SAMPLES_LOCK = threading.Lock()
+
+# Returned by measure() if the profiler is disabled.
+_NULL_MEASUREMENT = nullcontext()
+
+# Classes **********************************************************************
+
+class _Measurement():
+    """
+    Measures the wall and CPU time of a code block and records it as sample.
+    The CPU time is the one of the current thread, so background threads are not included.
+    """
+    __slots__ = ("_category", "_name", "_count", "_wall_start", "_cpu_start")
+
+    def __init__(self, category: str, name: str, count: int) -> None:
+        """
+        Initializes the measurement.
+
+        Args:
+            category (str): Category of the sample.
+            name (str): Name of the sample.
+            count (int): Number of measured items.
+        """
+        self._category = category
+        self._name = name
+        self._count = count
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+
+    def __enter__(self) -> "_Measurement":
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type: any, exc_value: any, traceback: any) -> None:
+        add_sample(self._category, self._name,
+                   time.perf_counter() - self._wall_start,
+                   time.thread_time() - self._cpu_start,
+                   self._count)
+
+# Functions ********************************************************************
+
+def is_profile_enabled() -> bool:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Check if the profiler is enabled.
+
+    Returns:
+        bool: True if the profiler is enabled, False otherwise.
+    """
+    return _PROFILE_ENABLED
+
+def enable_profile(enable: bool) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Enable or disable the profiler.
+
+    Args:
+        enable (bool): True to enable the profiler, False to disable it.
+    """
+    global _PROFILE_ENABLED # pylint: disable=global-statement
+    _PROFILE_ENABLED = enable
+
+def get_timestamp() -> Tuple[float, float]:
+    """Get the current wall and CPU time, e.g. to measure a phase which starts before
+    the profiler is enabled.
+
+    Returns:
+        Tuple[float, float]: Wall and CPU time in seconds.
+    """
+    return time.perf_counter(), time.thread_time()
+
+def get_elapsed(timestamp: Tuple[float, float]) -> Tuple[float, float]:
+    """Get the elapsed wall and CPU time since the given timestamp.
+
+    Args:
+        timestamp (Tuple[float, float]): Wall and CPU time from get_timestamp().
+
+    Returns:
+        Tuple[float, float]: Elapsed wall and CPU time in seconds.
+    """
+    wall, cpu = get_timestamp()
+
+    return wall - timestamp[0], cpu - timestamp[1]
+
+def add_sample(category: str, name: str, wall: float, cpu: float, count: int = 1) -> None:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Record a sample, if the profiler is enabled.
+    Samples with the same category and name are accumulated.
+
+    Args:
+        category (str): Category of the sample.
+        name (str): Name of the sample.
+        wall (float): Wall time in seconds.
+        cpu (float): CPU time in seconds.
+        count (int): Number of measured items.
+    """
+    if _PROFILE_ENABLED is True:
+        with _SAMPLES_LOCK:
+            sample = _SAMPLES.setdefault(category, {}).setdefault(name, [0, 0.0, 0.0])
+            sample[0] += count
+            sample[1] += wall
+            sample[2] += cpu
+
+def measure(category: str, name: str, count: int = 1) -> any:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Get a context manager which records the wall and CPU time of its code block.
+    If the profiler is disabled, it records nothing.
+
+    Args:
+        category (str): Category of the sample.
+        name (str): Name of the sample.
+        count (int): Number of measured items.
+
+    Returns:
+        any: Context manager
+    """
+    measurement = _NULL_MEASUREMENT
+
+    if _PROFILE_ENABLED is True:
+        measurement = _Measurement(category, name, count)
+
+    return measurement
+
+def take_samples() -> Dict[str, Dict[str, List[float]]]:
+    """Take all recorded samples, e.g. to pass them from a worker process to its parent.
+    The recorded samples are empty afterwards.
+
+    Returns:
+        Dict[str, Dict[str, List[float]]]: Samples by category and name.
+    """
+    global _SAMPLES # pylint: disable=global-statement
+
+    with _SAMPLES_LOCK:
+        samples = _SAMPLES
+        _SAMPLES = {}
+
+    return samples
+
+def merge_samples(samples: Dict[str, Dict[str, List[float]]]) -> None:
+    """Merge the samples, e.g. of a worker process, into the recorded ones.
+
+    Args:
+        samples (Dict[str, Dict[str, List[float]]]): Samples by category and name.
+    """
+    for category, name_dict in samples.items():
+        for name, (count, wall, cpu) in name_dict.items():
+            add_sample(category, name, wall, cpu, count)
+
+def _get_sorted_samples() -> Dict[str, List[dict]]:
+    """Get the recorded samples per category, the most expensive ones first.
+
+    Returns:
+        Dict[str, List[dict]]: Samples by category.
+    """
+    with _SAMPLES_LOCK:
+        samples = {category: dict(name_dict) for category, name_dict in _SAMPLES.items()}
+
+    # Known categories first.
+    category_list = [category for category in CATEGORY_LIST if category in samples]
+    category_list += sorted(category for category in samples if category not in CATEGORY_LIST)
+    sorted_samples = {}
+
+    for category in category_list:
+        entry_list = [
+            {"name": name, "count": count, "wall": wall, "cpu": cpu}
+            for name, (count, wall, cpu) in samples[category].items()
+        ]
+
+        # The phases in the order of the conversion, all others by their wall time.
+        if category != CATEGORY_PHASE:
+            entry_list.sort(key=lambda entry: entry["wall"], reverse=True)
+
+        sorted_samples[category] = entry_list
+
+    return sorted_samples
+
+def get_summary() -> str:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Get a human-readable summary of the recorded samples.
+
+    Returns:
+        str: Summary
+    """
+    lines = []
+
+    for category, entry_list in _get_sorted_samples().items():
+        name_width = max([len(category)] + [len(entry["name"]) for entry in entry_list[:SUMMARY_ENTRIES_MAX]])
+
+        lines.append(f"{category:<{name_width}} {'Count':>8} {'Wall [s]':>10} {'CPU [s]':>10}")
+        lines.append("-" * (name_width + 31))
+
+        for entry in entry_list[:SUMMARY_ENTRIES_MAX]:
+            lines.append(f"{entry['name']:<{name_width}} {entry['count']:>8} "
+                         f"{entry['wall']:>10.3f} {entry['cpu']:>10.3f}")
+
+        if SUMMARY_ENTRIES_MAX < len(entry_list):
+            lines.append(f"... {len(entry_list) - SUMMARY_ENTRIES_MAX} more, see JSON file.")
+
+        lines.append("")
+
+    return "\n".join(lines)
+
+def write_profile(file_name: str) -> str:
+    # lobster-trace: SwRequirements.sw_req_cli_profile
+    """Write the recorded samples as JSON file and the summary as text file beside it.
+
+    Args:
+        file_name (str): The JSON file name.
+
+    Raises:
+        OSError: Failed to write a file.
+
+    Returns:
+        str: The file name of the summary.
+    """
+    summary_file_name = os.path.splitext(file_name)[0] + ".txt"
+
+    if summary_file_name == file_name:
+        summary_file_name += ".txt"
+
+    with open(file_name, "w", encoding="utf-8") as fd:
+        json.dump(_get_sorted_samples(), fd, indent=4)
+
+    with open(summary_file_name, "w", encoding="utf-8") as fd:
+        fd.write(get_summary())
+
+    return summary_file_name
+
+# Main *************************************************************************
@@ -0,0 +1,143 @@
+"""Snapshot of a parsed TRLC symbol table, which can be converted by several runs
+    without parsing the TRLC files again.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import os
+from typing import List, Optional
+from trlc.ast import Symbol_Table
+from trlc.version import TRLC_VERSION
+from pyTRLCConverter.logger import log_error, log_verbose
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.symbol_table_pickle import PICKLING_ERRORS, UNPICKLING_ERRORS, SymbolTablePickler, \
+    SymbolTableUnpickler
+
+# Variables ********************************************************************
+
+# Identifies a snapshot file, followed by the pickled header and symbol table.
+SNAPSHOT_MAGIC = b"pyTRLCConverter snapshot\n"
+
+# Version of the snapshot format. Increase it if the content changes incompatible.
+SNAPSHOT_FORMAT_VERSION = 2
+
+# Classes **********************************************************************
+
+class Snapshot():
+    # lobster-trace: SwRequirements.sw_req_cli_snapshot
+    """
+    The parsed TRLC symbol table with the source and include paths it was parsed from.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, symbol_table: Symbol_Table, source_items: List[str], includes: Optional[List[str]]) -> None:
+        """
+        Initializes the snapshot.
+
+        Args:
+            symbol_table (Symbol_Table): The TRLC symbol table.
+            source_items (List[str]): The source paths, the symbol table was parsed from.
+            includes (Optional[List[str]]): The include paths or None.
+        """
+        self.symbol_table = symbol_table
+        self.source_items = source_items
+        self.includes = includes
+
+# Functions ********************************************************************
+
+def write_snapshot(file_name: str, snapshot: Snapshot) -> Ret:
+    # lobster-trace: SwRequirements.sw_req_cli_snapshot
+    """Write the snapshot to the given file.
+
+    Args:
+        file_name (str): The snapshot file name.
+        snapshot (Snapshot): The snapshot to write.
+
+    Returns:
+        Ret: Status
+    """
+    result = Ret.OK
+    file_name_tmp = file_name + f".{os.getpid()}.tmp"
+    header = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "trlc": TRLC_VERSION,
+        "source": snapshot.source_items,
+        "include": snapshot.includes
+    }
+
+    try:
+        with open(file_name_tmp, "wb") as fd:
+            fd.write(SNAPSHOT_MAGIC)
+
+            pickler = SymbolTablePickler(fd)
+            pickler.dump(header)
+            pickler.dump(snapshot.symbol_table)
+
+        # Replace it atomically to avoid that a parallel run reads a partial written snapshot.
+        os.replace(file_name_tmp, file_name)
+
+        log_verbose(f"Snapshot written to {file_name}.")
+
+    except PICKLING_ERRORS as exc:
+        log_error(f"Failed to write snapshot {file_name}: {exc}")
+        result = Ret.ERROR
+
+        if os.path.exists(file_name_tmp):
+            os.remove(file_name_tmp)
+
+    return result
+
+def read_snapshot(file_name: str) -> Optional[Snapshot]:
+    # lobster-trace: SwRequirements.sw_req_cli_snapshot
+    """Read the snapshot from the given file.
+
+    Args:
+        file_name (str): The snapshot file name.
+
+    Returns:
+        Optional[Snapshot]: The snapshot or None if it can't be read.
+    """
+    snapshot = None
+
+    try:
+        with open(file_name, "rb") as fd:
+            if fd.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                log_error(f"{file_name} is not a snapshot.")
+
+            else:
+                unpickler = SymbolTableUnpickler(fd)
+                header = unpickler.load()
+
+                if (header.get("format") != SNAPSHOT_FORMAT_VERSION) or (header.get("trlc") != TRLC_VERSION):
+                    log_error(f"Snapshot {file_name} was written with format {header.get('format')} "
+                              f"and TRLC {header.get('trlc')}, but format {SNAPSHOT_FORMAT_VERSION} "
+                              f"and TRLC {TRLC_VERSION} is required.")
+
+                else:
+                    snapshot = Snapshot(unpickler.load(), header["source"], header["include"])
+                    log_verbose(f"Snapshot read from {file_name}.")
+
+    except UNPICKLING_ERRORS + (KeyError,) as exc:
+        log_error(f"Failed to read snapshot {file_name}: {exc}")
+        snapshot = None
+
+    return snapshot
+
+# Main *************************************************************************
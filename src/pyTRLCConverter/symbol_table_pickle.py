@@ -0,0 +1,133 @@
+"""Serialization of parsed TRLC symbol tables, shared by the parse cache and the snapshots.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import copyreg
+import gc
+import pickle
+from trlc.errors import Message_Handler
+from trlc.lexer import Token_Stream
+
+# Variables ********************************************************************
+
+# Exceptions which are raised if pickled data can't be loaded.
+UNPICKLING_ERRORS = (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError)
+
+# Exceptions which are raised if a symbol table can't be pickled.
+PICKLING_ERRORS = (OSError, pickle.PicklingError, RecursionError)
+
+# Classes **********************************************************************
+
+class SymbolTablePickler(pickle.Pickler):
+    # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+    # lobster-trace: SwRequirements.sw_req_cli_snapshot
+    """
+    Pickler for TRLC symbol tables.
+
+    It doesn't store the TRLC message handler, because it refers to the console output
+    streams which can't be serialized. It doesn't store the TRLC token streams either.
+    Every source reference refers to the token stream of its file, which contains the
+    whole file content. They are only needed by TRLC to report messages with the source
+    context, not for the conversion.
+
+    They are replaced by a dispatch table instead of persistent ids, because a persistent id
+    is requested by a Python call for every pickled object, which doubles the pickling time.
+    """
+
+    def __init__(self, file: any) -> None:
+        """
+        Initializes the pickler with the highest pickle protocol.
+
+        Args:
+            file (any): The binary file to write to.
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.dispatch_table = copyreg.dispatch_table.copy()
+        self.dispatch_table[Token_Stream] = _reduce_token_stream
+        self.dispatch_table[Message_Handler] = _reduce_message_handler
+
+class SymbolTableUnpickler(pickle.Unpickler):
+    # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+    # lobster-trace: SwRequirements.sw_req_cli_snapshot
+    """
+    Unpickler for TRLC symbol tables, written by the SymbolTablePickler.
+    The removed TRLC message handler is replaced with a fresh one and the removed
+    token streams are restored as None.
+    """
+
+    def load(self) -> any:
+        """
+        Load the next pickled object. The garbage collector is disabled meanwhile, because
+        the symbol table consists of many small objects, which would trigger it very often.
+
+        Returns:
+            any: The loaded object.
+        """
+        is_gc_enabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            obj = super().load()
+
+        finally:
+            if is_gc_enabled is True:
+                gc.enable()
+
+        return obj
+
+# Functions ********************************************************************
+
+def restore_token_stream() -> None:
+    """
+    Restore a TRLC token stream, which was not stored by the SymbolTablePickler.
+    It is referred by name in the pickled data, therefore it is public.
+
+    Returns:
+        None: The token stream is not available.
+    """
+    return None
+
+def _reduce_token_stream(_token_stream: Token_Stream) -> tuple:
+    """
+    Reduce a TRLC token stream, which is not stored.
+
+    Args:
+        _token_stream (Token_Stream): The token stream.
+
+    Returns:
+        tuple: The function which restores it and its arguments.
+    """
+    return restore_token_stream, ()
+
+def _reduce_message_handler(_message_handler: Message_Handler) -> tuple:
+    """
+    Reduce a TRLC message handler, which is restored as a fresh one.
+
+    Args:
+        _message_handler (Message_Handler): The message handler.
+
+    Returns:
+        tuple: The function which restores it and its arguments.
+    """
+    return Message_Handler, ()
+
+# Main *************************************************************************
@@ -0,0 +1,138 @@
+"""Text formatting kernel for the escaping and the tables of the text based converters.
+
+    Author: Andreas Merkle (andreas.merkle@newtec.de)
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+from typing import List
+
+# Variables ********************************************************************
+
+# Characters which are escaped with a backslash in Markdown and reStructuredText.
+ESCAPE_CHARACTERS = ["\\", "`", "*", "_", "{", "}", "[", "]", "<", ">", "(", ")", "#", "+", "-", ".", "!", "|"]
+
+# Pairs of special character and its escaped form, precomputed for the escaping.
+# The backslash shall be the first one, otherwise the escape backslashes would be escaped again.
+ESCAPE_PAIRS = tuple((character, "\\" + character) for character in ESCAPE_CHARACTERS)
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+def escape(text: str) -> str:
+    # lobster-trace: SwRequirements.sw_req_markdown_escape
+    # lobster-trace: SwRequirements.sw_req_rst_escape
+    """
+    Escapes the text with a backslash before every special character.
+    Only the special characters which the text contains are replaced. Looking for a
+    character is a fast scan over the text, which is faster than translating the text
+    character by character.
+
+    Args:
+        text (str): Text to escape
+
+    Returns:
+        str: Escaped text
+    """
+    for character, escaped_character in ESCAPE_PAIRS:
+        if character in text:
+            text = text.replace(character, escaped_character)
+
+    return text
+
+def markdown_create_table_head(column_titles: List[str], escape_titles: bool = True) -> str:
+    # lobster-trace: SwRequirements.sw_req_markdown_table
+    """
+    Create the table head for a Markdown table.
+
+    Args:
+        column_titles ([str]): List of column titles.
+        escape_titles (bool): Escape the titles (default: True).
+
+    Returns:
+        str: Table head
+    """
+    if escape_titles is True:
+        column_titles = [escape(column_title) for column_title in column_titles]
+
+    title_row = "".join([f" {column_title} |" for column_title in column_titles])
+    separator_row = "".join([f" {'-' * len(column_title)} |" for column_title in column_titles])
+
+    return f"|{title_row}\n|{separator_row}\n"
+
+def markdown_create_table_row(row_values: List[str], escape_values: bool = True) -> str:
+    # lobster-trace: SwRequirements.sw_req_markdown_table
+    """
+    Create a row of a Markdown table. Every LF in a value is replaced with a HTML <br>.
+
+    Args:
+        row_values ([str]): List of row values.
+        escape_values (bool): Escapes every row value (default: True).
+
+    Returns:
+        str: Table row
+    """
+    if escape_values is True:
+        row_values = [escape(row_value) for row_value in row_values]
+
+    cells = "".join([f" {row_value} |" for row_value in row_values])
+
+    # Replace every LF with a HTML <br>, at once for all cells.
+    return "|" + cells.replace("\n", "<br>") + "\n"
+
+def rst_create_table_row(row_values: List[str], max_widths: List[int], escape_values: bool = True) -> str:
+    # lobster-trace: SwRequirements.sw_req_rst_table
+    """
+    Create a row of a reStructuredText table in grid format with its separator row.
+    Supports multi-line cell values.
+
+    Args:
+        row_values ([str]): List of row values.
+        max_widths ([int]): List of maximum widths for each column.
+        escape_values (bool): Escapes every row value (default: True).
+
+    Returns:
+        str: Table row
+    """
+    if escape_values is True:
+        row_values = [escape(row_value) for row_value in row_values]
+
+    # Split each cell value into lines.
+    split_values = [row_value.split("\n") for row_value in row_values]
+    max_lines = max(len(lines) for lines in split_values)
+    empty_cells = [" " * (max_width + 2) for max_width in max_widths]
+    parts = []
+
+    for line_idx in range(max_lines):
+        parts.append("    |")
+
+        for col_idx, lines in enumerate(split_values):
+            if line_idx < len(lines):
+                parts.append(f" {lines[line_idx].ljust(max_widths[col_idx])} |")
+            else:
+                parts.append(empty_cells[col_idx] + "|")
+
+        parts.append("\n")
+
+    # Create the separator row.
+    parts.append("    +" + "+".join(["-" * (max_width + 2) for max_width in max_widths]) + "+\n")
+
+    return "".join(parts)
+
+# Main *************************************************************************
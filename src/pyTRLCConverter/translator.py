@@ -22,8 +22,9 @@ Author: Andreas Merkle (andreas.merkle@newtec.de)
 
 # Imports **********************************************************************
 import json
-from typing import Dict, Optional
-from pyTRLCConverter.logger import log_verbose
+from typing import Dict, Iterable, Optional
+from pyTRLCConverter.logger import log_error, log_verbose
+from pyTRLCConverter.trlc_helper import Record_Type
 
 # Variables ********************************************************************
 
@@ -33,20 +34,37 @@ class Translator():
     # lobster-trace: SwRequirements.sw_req_translation
     """
     This class implements the requirement attribute translator.
+
+    The translation file contains per requirement type the translated attribute names.
+    A translation file with several languages contains them per language below the
+    LANGUAGES_KEY, e.g. {"$languages": {"en": {...}, "de": {...}}}.
     """
 
+    # Key of the languages in a translation file with several languages.
+    LANGUAGES_KEY = "$languages"
+
     def __init__(self):
         """
         Constructs the requirement attribute translator.
         """
-        self._translation = {}
+        # The translated attribute names per requirement type.
+        self._translation = {}  # type: dict[str, dict[str, str]]
+
+        # Number of failed translations per requirement type and attribute name.
+        self._miss_dict = {}  # type: dict[str, int]
+
+        # Failed translations are only counted if a translation file is loaded.
+        self._is_loaded = False
 
-    def load(self, file_name: str) -> bool:
+    def load(self, file_name: str, language: Optional[str] = None) -> bool:
+        # lobster-trace: SwRequirements.sw_req_translation_language
         """
-        Load the trasnlation JSON file.
+        Load the translation JSON file and check the translated attribute names per requirement type.
+        Of a translation file with several languages only the given one is kept.
 
         Args:
             file_name (str): The name of the JSON file to load.
+            language (Optional[str]): The language to load. If None, the first one is used.
 
         Returns:
             bool: True if the file was loaded successfully, False otherwise.
@@ -58,13 +76,63 @@ class Translator():
         # Load the JSON file
         try:
             with open(file_name, 'r', encoding="utf-8") as file:
-                self._translation = json.load(file)
+                translation = json.load(file)
 
             status = True
 
         except FileNotFoundError as e:
             log_verbose(f"Failed to load file {file_name}: {e}")
 
+        except (OSError, json.JSONDecodeError) as e:
+            log_error(f"Failed to load file {file_name}: {e}")
+
+        if (status is True) and isinstance(translation, dict) and (Translator.LANGUAGES_KEY in translation):
+            translation = self._select_language(file_name, translation[Translator.LANGUAGES_KEY], language)
+
+            if translation is None:
+                status = False
+
+        if status is True:
+            status = self._check_translation(file_name, translation)
+
+        self._is_loaded = status
+
+        return status
+
+    def validate(self, record_types: Iterable[Record_Type]) -> bool:
+        # lobster-trace: SwRequirements.sw_req_translation_validation
+        """
+        Validate the translation against the requirement types of the TRLC model.
+        A requirement type or attribute which doesn't exist is reported in verbose mode,
+        but not as error, because a translation file may be shared by several models.
+
+        Args:
+            record_types (Iterable[Record_Type]): The requirement types of the TRLC model.
+
+        Returns:
+            bool: True if all translated requirement types and attributes exist, False otherwise.
+        """
+        status = True
+        attribute_names_dict = {}  # type: dict[str, set[str]]
+
+        # Requirement types with the same name may exist in several packages.
+        for record_type in record_types:
+            attribute_names = attribute_names_dict.setdefault(record_type.name, set())
+            attribute_names.update(component.name for component in record_type.all_components())
+
+        for req_type_name, attr_translation in self._translation.items():
+            attribute_names = attribute_names_dict.get(req_type_name)
+
+            if attribute_names is None:
+                log_verbose(f"Translation of unknown requirement type {req_type_name}.")
+                status = False
+
+            else:
+                for attr_name in attr_translation:
+                    if attr_name not in attribute_names:
+                        log_verbose(f"Translation of unknown attribute {req_type_name}.{attr_name}.")
+                        status = False
+
         return status
 
     def get_translation(self, req_type_name: str) -> Optional[Dict]:
@@ -77,17 +145,13 @@ class Translator():
         Returns:
             Optional[Dict]: The translation dictionary for the requirement type, or None if not found.
         """
-        translation = None
-
-        if req_type_name in self._translation:
-            translation = self._translation[req_type_name]
-
-        return translation
-
+        return self._translation.get(req_type_name)
 
     def translate(self, req_type_name: str, attr_name: str) -> str:
+        # lobster-trace: SwRequirements.sw_req_translation_misses
         """
         Translate the requirement attribute.
+        A failed translation is counted and reported by log_misses().
 
         Args:
             req_type_name (str): The name of the requirement type.
@@ -96,21 +160,128 @@ class Translator():
         Returns:
             str: The translated attribute name.
         """
-        translation = attr_name
+        translation = self._translation.get(req_type_name, {}).get(attr_name)
 
-        if req_type_name not in self._translation:
-            log_verbose(f"Failed to translate {req_type_name}: No translation available.")
+        if translation is None:
+            self.count_misses(req_type_name, [attr_name])
+            translation = attr_name
 
-        else:
+        return translation
 
-            if attr_name not in self._translation[req_type_name]:
-                log_verbose(f"Failed to translate {req_type_name}.{attr_name}: No translation available.")
-            else:
-                translation = self._translation[req_type_name][attr_name]
+    def count_misses(self, req_type_name: str, attr_names: Iterable[str]) -> None:
+        # lobster-trace: SwRequirements.sw_req_translation_misses
+        """
+        Count failed translations, which were looked up without translate(), e.g. by the
+        rendering plan of a requirement type. They are only counted if a translation file is loaded.
+
+        Args:
+            req_type_name (str): The name of the requirement type.
+            attr_names (Iterable[str]): The names of the attributes without translation.
+        """
+        if self._is_loaded is True:
+            for attr_name in attr_names:
+                miss_key = f"{req_type_name}.{attr_name}"
+                self._miss_dict[miss_key] = self._miss_dict.get(miss_key, 0) + 1
+
+    def take_misses(self) -> Dict[str, int]:
+        # lobster-trace: SwRequirements.sw_req_translation_misses
+        """
+        Take the failed translations since the last call, e.g. of a worker process.
+
+        Returns:
+            Dict[str, int]: The number of failed translations per requirement type and attribute.
+        """
+        miss_dict = self._miss_dict
+        self._miss_dict = {}
+
+        return miss_dict
+
+    def merge_misses(self, miss_dict: Dict[str, int]) -> None:
+        # lobster-trace: SwRequirements.sw_req_translation_misses
+        """
+        Merge the failed translations, which were taken by take_misses() of a worker process.
+
+        Args:
+            miss_dict (Dict[str, int]): The number of failed translations per requirement type and attribute.
+        """
+        for miss_key, count in miss_dict.items():
+            self._miss_dict[miss_key] = self._miss_dict.get(miss_key, 0) + count
+
+    def log_misses(self) -> None:
+        # lobster-trace: SwRequirements.sw_req_translation_misses
+        """
+        Report all failed translations since the last report at once.
+        """
+        if 0 < len(self._miss_dict):
+            log_verbose(f"No translation available for {len(self._miss_dict)} attribute(s):")
+
+            for miss_key, count in sorted(self._miss_dict.items()):
+                log_verbose(f"* {miss_key} ({count} time(s))")
+
+            self._miss_dict = {}
+
+    def _select_language(self, file_name: str, language_dict: any, language: Optional[str]) -> Optional[dict]:
+        # lobster-trace: SwRequirements.sw_req_translation_language
+        """
+        Select the translation of the given language.
+
+        Args:
+            file_name (str): The name of the JSON file.
+            language_dict (any): The translations per language.
+            language (Optional[str]): The language to select. If None, the first one is used.
+
+        Returns:
+            Optional[dict]: The translation of the language or None if it is not available.
+        """
+        translation = None
+
+        if (not isinstance(language_dict, dict)) or (0 == len(language_dict)):
+            log_error(f"No languages in translation file {file_name}.")
+
+        elif language is None:
+            language, translation = next(iter(language_dict.items()))
+            log_verbose(f"Using the first language {language}.")
+
+        elif language not in language_dict:
+            log_error(f"Language {language} is not available in translation file {file_name}, " \
+                      f"available are: {', '.join(language_dict)}.")
+
+        else:
+            log_verbose(f"Using language {language}.")
+            translation = language_dict[language]
 
         return translation
 
-# Functions ********************************************************************
+    def _check_translation(self, file_name: str, translation: any) -> bool:
+        """
+        Check the translation and take over the translated attribute names per requirement type.
+        It checks that the translated attribute names are strings.
+
+        Args:
+            file_name (str): The name of the JSON file.
+            translation (any): The translation as loaded from the JSON file.
 
+        Returns:
+            bool: True if the translation is valid, False otherwise.
+        """
+        status = True
+        self._translation = {}
+
+        if not isinstance(translation, dict):
+            log_error(f"Translation file {file_name} shall contain an object per requirement type.")
+            status = False
+
+        else:
+            for req_type_name, attr_translation in translation.items():
+                if (not isinstance(attr_translation, dict)) or \
+                   (not all(isinstance(value, str) for value in attr_translation.values())):
+                    log_error(f"Translation of {req_type_name} in {file_name} shall map attribute names to strings.")
+                    status = False
+                else:
+                    self._translation[req_type_name] = dict(attr_translation)
+
+        return status
+
+# Functions ********************************************************************
 
 # Main *************************************************************************
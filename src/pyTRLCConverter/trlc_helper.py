@@ -20,11 +20,13 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import itertools
 import os
-from typing import Union, Optional
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 from trlc.errors import Message_Handler
 from trlc.trlc import Source_Manager
-from trlc.ast import Array_Aggregate, Expression, Record_Object
+from trlc.ast import Array_Aggregate, Expression, Package, Record_Object, Record_Reference, Record_Type, \
+    Symbol_Table, Tuple_Aggregate, Type
 from pyTRLCConverter.logger import log_verbose
 
 # Variables ********************************************************************
@@ -183,16 +185,269 @@ class TrlcAstWalker():
 
         return result
 
+class RecordTypeRenderPlan():
+    # lobster-trace: SwRequirements.sw_req_markdown_record
+    # lobster-trace: SwRequirements.sw_req_rst_record
+    """
+    The rendering plan of a record type. It is compiled once per record type and
+    reused for every record of this type.
+
+    It contains for every field in the field order of the record type the field name,
+    the translated and escaped attribute name and the value handler, which was selected
+    by the field type. The names of the fields without translation are kept to count
+    them as failed translations.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self,
+                 record_type: Record_Type,
+                 translation: Optional[dict],
+                 escape: Callable[[str], str],
+                 get_value_handler: Callable[[Type], Callable[[Expression], str]]) -> None:
+        """
+        Compiles the rendering plan.
+
+        Args:
+            record_type (Record_Type): The record type.
+            translation (Optional[dict]): Translation dictionary for the record type.
+                                            If None, no translation is applied.
+            escape (Callable[[str], str]): Escapes the attribute name for the output format.
+            get_value_handler (Callable[[Type], Callable[[Expression], str]]): Provides
+                the value handler for a field type.
+        """
+        self.translation = translation
+        self.field_list = []  # type: List[Tuple[str, str, Callable[[Expression], str]]]
+        self.untranslated_list = []  # type: List[str]
+
+        for component in record_type.all_components():
+            # Translate the attribute name if available.
+            attribute_name = component.name
+
+            if (translation is not None) and (component.name in translation):
+                attribute_name = translation[component.name]
+            else:
+                self.untranslated_list.append(component.name)
+
+            self.field_list.append((component.name, escape(attribute_name), get_value_handler(component.n_typ)))
+
+class RecordAttributes():
+    # lobster-trace: SwRequirements.sw_req_record_attributes
+    """
+    View on the attribute values of a record object. In contrast to Record_Object.to_python_dict(),
+    a value is only converted on its first access and kept for every further access.
+    """
+
+    def __init__(self, record: Record_Object) -> None:
+        """
+        Initializes the view.
+
+        Args:
+            record (Record_Object): The record object.
+        """
+        self._record = record
+
+        # The converted attribute values, filled on access.
+        self._value_dict = {}  # type: dict[str, any]
+
+    def get_record(self) -> Record_Object:
+        """
+        Get the record object of the view.
+
+        Returns:
+            Record_Object: The record object.
+        """
+        return self._record
+
+    def get_value(self, attribute_name: str) -> any:
+        """
+        Get the attribute value as Python object, like Record_Object.to_python_dict() provides it.
+        The value is shared by all accesses, therefore it shall not be modified.
+
+        Args:
+            attribute_name (str): The attribute name.
+
+        Returns:
+            any: The attribute value or None if it is not set.
+
+        Raises:
+            KeyError: If the record object has no such attribute.
+        """
+        if attribute_name in self._value_dict:
+            value = self._value_dict[attribute_name]
+        else:
+            value = self._record.field[attribute_name].to_python_object()
+            self._value_dict[attribute_name] = value
+
+        return value
+
+    def get_string(self, attribute_name: str) -> Optional[str]:
+        """
+        Get the attribute value as string.
+
+        Args:
+            attribute_name (str): The attribute name.
+
+        Returns:
+            Optional[str]: The attribute value or None if it is not set.
+        """
+        value = self.get_value(attribute_name)
+
+        if (value is not None) and (not isinstance(value, str)):
+            value = str(value)
+
+        return value
+
+    def get_enum(self, attribute_name: str) -> Optional[str]:
+        """
+        Get the name of the enumeration literal of an enumeration attribute.
+
+        Args:
+            attribute_name (str): The attribute name.
+
+        Returns:
+            Optional[str]: The enumeration literal name or None if it is not set.
+        """
+        return self.get_value(attribute_name)
+
+    def get_reference(self, attribute_name: str) -> Optional[Record_Object]:
+        """
+        Get the record object, a record reference attribute points to.
+
+        Args:
+            attribute_name (str): The attribute name.
+
+        Returns:
+            Optional[Record_Object]: The referenced record object or None if it is not set.
+        """
+        target = None
+        expression = self._record.field[attribute_name]
+
+        if isinstance(expression, Record_Reference):
+            target = expression.target
+
+        return target
+
+    def get_array(self, attribute_name: str) -> list:
+        """
+        Get the elements of an array attribute as Python objects.
+
+        Args:
+            attribute_name (str): The attribute name.
+
+        Returns:
+            list: The array elements, which is empty if the attribute is not set.
+        """
+        value = self.get_value(attribute_name)
+
+        if value is None:
+            value = []
+
+        return value
+
+    def get_reference_array(self, attribute_name: str) -> List[Record_Object]:
+        """
+        Get the record objects, the elements of an array of record references point to.
+
+        Args:
+            attribute_name (str): The attribute name.
+
+        Returns:
+            List[Record_Object]: The referenced record objects, which is empty if the attribute is not set.
+        """
+        target_list = []
+        expression = self._record.field[attribute_name]
+
+        if isinstance(expression, Array_Aggregate):
+            target_list = [element.target for element in expression.value if isinstance(element, Record_Reference)]
+
+        return target_list
+
+class TrlcItem():
+    # lobster-trace: SwRequirements.sw_req_destination_format
+    """
+    Base class of the items, which are yielded while iterating over the symbol table.
+    The items use slots, because there is one per section and record.
+    """
+    # pylint: disable=too-few-public-methods
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        values = ", ".join(repr(getattr(self, name)) for name in self.__slots__)
+
+        return f"{type(self).__name__}({values})"
+
+class FileItem(TrlcItem):
+    # lobster-trace: SwRequirements.sw_req_destination_format
+    """
+    Begin of the items of a TRLC file.
+    """
+    # pylint: disable=too-few-public-methods
+    __slots__ = ("file_name",)
+
+    def __init__(self, file_name: str) -> None:
+        """
+        Initializes the item.
+
+        Args:
+            file_name (str): The TRLC file name.
+        """
+        self.file_name = file_name
+
+class SectionItem(TrlcItem):
+    # lobster-trace: SwRequirements.sw_req_destination_format
+    """
+    A section with its level in the section hierarchy.
+    """
+    # pylint: disable=too-few-public-methods
+    __slots__ = ("name", "level")
+
+    def __init__(self, name: str, level: int) -> None:
+        """
+        Initializes the item.
+
+        Args:
+            name (str): The section name.
+            level (int): The section level, starting with 0.
+        """
+        self.name = name
+        self.level = level
+
+class RecordItem(TrlcItem):
+    # lobster-trace: SwRequirements.sw_req_destination_format
+    """
+    A record object with its level in the section hierarchy.
+    """
+    # pylint: disable=too-few-public-methods
+    __slots__ = ("record", "level")
+
+    def __init__(self, record: Record_Object, level: int) -> None:
+        """
+        Initializes the item.
+
+        Args:
+            record (Record_Object): The record object.
+            level (int): The level of the record object, starting with 0.
+        """
+        self.record = record
+        self.level = level
+
 # Functions ********************************************************************
 
-def get_trlc_symbols(source_items, includes):
+def get_trlc_symbols(source_items, includes, parse_cache=None, excludes=None):
     # lobster-trace: SwRequirements.sw_req_destination_format
+    # lobster-trace: SwRequirements.sw_req_cli_cache_dir
+    # lobster-trace: SwRequirements.sw_req_cli_exclude
     """Get the TRLC symbol table by parsing the given folder.
 
     Args:
         source_items ([str]|str): One or more paths to folder with TRLC files \
                                   or a single path to a TRLC file.
         includes (str|None): Path for automatically file inclusion.
+        parse_cache (ParseCache|None): Cache for already parsed symbol tables. \
+                                       If None, the TRLC files are always parsed.
+        excludes ([str]|None): Paths inside the source paths, which shall not be converted. \
+                               Their TRLC files are only parsed if they are referenced, \
+                               like the ones in the include paths.
 
     Returns:
         Symbol_Table: TRLC symbol table
@@ -212,22 +467,113 @@ def get_trlc_symbols(source_items, includes):
                 sm.register_include(folder)
 
         for src_item in source_items:
-            if os.path.isdir(src_item):
+            if (excludes is not None) and (_is_path_excluded(src_item, excludes) is True):
+                _register_excluded_item(sm, src_item)
+            elif os.path.isdir(src_item):
                 log_verbose(f"Registering source folder: {src_item}")
-                sm.register_directory(src_item)
+
+                if excludes is None:
+                    sm.register_directory(src_item)
+                else:
+                    _register_directory(sm, src_item, excludes)
             else:
                 log_verbose(f"Registering source file: {src_item}")
                 sm.register_file(src_item)
 
-        symbol_table = sm.process()
+        cache_key = None
+
+        if parse_cache is not None:
+            # The key covers every file which may contribute to the symbol table
+            # and the excluded paths, which decide whether a file is parsed on demand only.
+            cache_key = parse_cache.create_key(list(sm.all_files) + list(sm.includes.values()), excludes)
+            symbol_table = parse_cache.load(cache_key)
+
+        if symbol_table is None:
+            symbol_table = sm.process()
+
+            if (cache_key is not None) and (symbol_table is not None):
+                parse_cache.store(cache_key, symbol_table)
+
     except AssertionError:
         pass
 
     return symbol_table
 
+def _register_directory(sm, dir_name, excludes):
+    # lobster-trace: SwRequirements.sw_req_cli_exclude
+    """Register the TRLC files of the given source folder, like Source_Manager.register_directory().
+    The excluded folders and files are registered for automatic inclusion instead.
+
+    Args:
+        sm (Source_Manager): The TRLC source manager.
+        dir_name (str): Path to the source folder.
+        excludes ([str]): The excluded paths.
+    """
+    for path, dirs, files in os.walk(dir_name):
+        dirs.sort()
+
+        # Don't walk into the excluded folders.
+        for sub_dir_name in list(dirs):
+            sub_dir_path = os.path.join(path, sub_dir_name)
+
+            if _is_path_excluded(sub_dir_path, excludes) is True:
+                dirs.remove(sub_dir_name)
+                _register_excluded_item(sm, sub_dir_path)
+
+        for file_name in sorted(files):
+            if os.path.splitext(file_name)[1] in (".rsl", ".trlc"):
+                file_path = os.path.join(path, file_name)
+
+                if _is_path_excluded(file_path, excludes) is True:
+                    _register_excluded_item(sm, file_path)
+                else:
+                    sm.register_file(file_path)
+
+def _register_excluded_item(sm, path):
+    # lobster-trace: SwRequirements.sw_req_cli_exclude
+    """Register an excluded folder or TRLC file for automatic inclusion.
+    It is parsed only if a package inside is required by a not excluded file.
+
+    Args:
+        sm (Source_Manager): The TRLC source manager.
+        path (str): Path to the excluded folder or TRLC file.
+    """
+    log_verbose(f"Registering excluded path for inclusion: {path}")
+
+    if os.path.isdir(path):
+        sm.register_include(path)
+    else:
+        sm.register_file(path, primary=False)
+
+def _is_path_excluded(path, excludes):
+    # lobster-trace: SwRequirements.sw_req_cli_exclude
+    """Check whether the path is one of the excluded paths or inside of them.
+
+    Args:
+        path (str): The path to check.
+        excludes ([str]): The excluded paths.
+
+    Returns:
+        bool: True if the path is excluded, otherwise False.
+    """
+    is_excluded = False
+    path = os.path.abspath(path)
+
+    for excluded_path in excludes:
+        excluded_path = os.path.abspath(excluded_path)
+
+        if os.path.commonpath([excluded_path, path]) == excluded_path:
+            is_excluded = True
+            break
+
+    return is_excluded
+
 def is_item_file_name(item):
     # lobster-trace: SwRequirements.sw_req_destination_format
     """Check if the item is a file name.
+    The item checks classify the items of iter_record_objects_by_section(). The built-in converters
+    walk the typed items of iter_items_by_file() instead, but the checks are kept as public API for
+    project specific converters.
 
     Args:
         item (str|tuple): The item to check.
@@ -240,6 +586,7 @@ def is_item_file_name(item):
 def is_item_section(item):
     # lobster-trace: SwRequirements.sw_req_destination_format
     """Check if the item is a section.
+    Kept for project specific converters, see is_item_file_name().
 
     Args:
         item (str|tuple): The item to check.
@@ -255,6 +602,7 @@ def is_item_section(item):
 def is_item_record(item):
     # lobster-trace: SwRequirements.sw_req_destination_format
     """Check if the item is a record.
+    Kept for project specific converters, see is_item_file_name().
 
     Args:
         item (str|tuple): The item to check.
@@ -267,9 +615,104 @@ def is_item_record(item):
             isinstance(item[0], Record_Object) and \
             isinstance(item[1], int)
 
+def iter_record_objects_by_section(symbols):
+    # lobster-trace: SwRequirements.sw_req_destination_format
+    """Iterate over the file names, sections and record objects of the symbol table.
+
+    It yields the same items as Symbol_Table.iter_record_objects_by_section(), but keeps
+    the already yielded files and sections locally instead of in the symbol table.
+    Therefore a symbol table can be iterated more than once, e.g. if it is reused from
+    the parse cache.
+
+    Args:
+        symbols (Symbol_Table): The TRLC symbols.
+
+    Yields:
+        str|tuple: File name, (section name, level) or (record object, level).
+    """
+    file_names = set()
+    sections = set()
+
+    for record_object in symbols.iter_record_objects():
+        file_name = record_object.location.file_name
+
+        if file_name not in file_names:
+            file_names.add(file_name)
+            yield file_name
+
+        if record_object.section:
+            for level, section in enumerate(record_object.section):
+                if section not in sections:
+                    sections.add(section)
+                    yield section.name, level
+
+            yield record_object, len(record_object.section) - 1
+
+        else:
+            yield record_object, 0
+
+def iter_items(symbols: Symbol_Table) -> Iterator[TrlcItem]:
+    # lobster-trace: SwRequirements.sw_req_destination_format
+    """Iterate lazily over the files, sections and record objects of the symbol table.
+    Like iter_record_objects_by_section(), but the items are typed.
+
+    Args:
+        symbols (Symbol_Table): The TRLC symbols.
+
+    Yields:
+        TrlcItem: FileItem, SectionItem or RecordItem.
+    """
+    file_names = set()
+    sections = set()
+
+    for record_object in symbols.iter_record_objects():
+        file_name = record_object.location.file_name
+
+        if file_name not in file_names:
+            file_names.add(file_name)
+            yield FileItem(file_name)
+
+        if record_object.section:
+            for level, section in enumerate(record_object.section):
+                if section not in sections:
+                    sections.add(section)
+                    yield SectionItem(section.name, level)
+
+            yield RecordItem(record_object, len(record_object.section) - 1)
+
+        else:
+            yield RecordItem(record_object, 0)
+
+def iter_items_by_file(symbols: Symbol_Table) -> Iterator[Tuple[str, Iterator[TrlcItem]]]:
+    # lobster-trace: SwRequirements.sw_req_destination_format
+    """Iterate lazily over the files of the symbol table and their sections and record objects.
+    The items of a file are valid until the next file is requested. If they are not
+    consumed, they are skipped.
+
+    Args:
+        symbols (Symbol_Table): The TRLC symbols.
+
+    Yields:
+        Tuple[str, Iterator[TrlcItem]]: The file name and its SectionItem and RecordItem items.
+    """
+    file_name = None
+
+    def get_file_name(item: TrlcItem) -> str:
+        nonlocal file_name
+
+        if isinstance(item, FileItem):
+            file_name = item.file_name
+
+        return file_name
+
+    for group_file_name, item_iter in itertools.groupby(iter_items(symbols), key=get_file_name):
+        # The first item of the group is the file item itself.
+        yield group_file_name, itertools.islice(item_iter, 1, None)
+
 def get_file_dict_from_symbols(symbols):
     # lobster-trace: SwRequirements.sw_req_destination_format
     """Get a dictionary with the file names and their content.
+    Not used by the built-in converters, but kept as public API for project specific converters.
 
     Args:
         symbols (Symbol_Table): The TRLC symbols to dump.
@@ -281,7 +724,7 @@ def get_file_dict_from_symbols(symbols):
     item_list = None
 
     if symbols is not None:
-        for item in symbols.iter_record_objects_by_section():
+        for item in iter_record_objects_by_section(symbols):
             # Is item a file name?
             if is_item_file_name(item):
                 file_dict[item] = []
@@ -292,4 +735,93 @@ def get_file_dict_from_symbols(symbols):
 
     return file_dict
 
+def get_record_references(record):
+    # lobster-trace: SwRequirements.sw_req_destination_format
+    """Get all record references of the given record object.
+    References inside arrays and tuples are considered as well.
+
+    Args:
+        record (Record_Object): The record object.
+
+    Returns:
+        [Record_Reference]: The record references in field order.
+    """
+    references = []
+    expressions = list(record.field.values())
+
+    # Use an explicit stack instead of recursion, the values are processed in field order.
+    expressions.reverse()
+
+    while 0 < len(expressions):
+        expression = expressions.pop()
+
+        if isinstance(expression, Record_Reference):
+            references.append(expression)
+        elif isinstance(expression, Array_Aggregate):
+            expressions.extend(reversed(expression.value))
+        elif isinstance(expression, Tuple_Aggregate):
+            expressions.extend(reversed(list(expression.value.values())))
+
+    return references
+
+def get_referenced_by_dict(symbols: Symbol_Table) -> dict:
+    # lobster-trace: SwRequirements.sw_req_referenced_by
+    """Get the record objects, which reference a record object, for all record objects.
+    The record objects are walked only once, which is the reverse of get_record_references().
+
+    Args:
+        symbols (Symbol_Table): The TRLC symbols.
+
+    Returns:
+        dict[Record_Object, List[Record_Object]]: The referencing record objects per referenced record object
+            in walk order. A record object is listed once, even if it references the same record object several times.
+    """
+    referenced_by_dict = {}  # type: dict[Record_Object, List[Record_Object]]
+
+    for record in symbols.iter_record_objects():
+        for target in dict.fromkeys(record_reference.target for record_reference in get_record_references(record)):
+            referenced_by_list = referenced_by_dict.get(target)
+
+            if referenced_by_list is None:
+                referenced_by_dict[target] = [record]
+            else:
+                referenced_by_list.append(record)
+
+    return referenced_by_dict
+
+def iter_record_types(symbols: Symbol_Table) -> Iterator[Record_Type]:
+    # lobster-trace: SwRequirements.sw_req_translation_validation
+    """Iterate over the record types of all packages.
+
+    Args:
+        symbols (Symbol_Table): The TRLC symbols.
+
+    Yields:
+        Record_Type: The record types, ordered by package and type name.
+    """
+    for package in symbols.values(Package):
+        yield from package.symbols.values(Record_Type)
+
+def get_model_file_names(symbols: Symbol_Table) -> List[str]:
+    # lobster-trace: SwRequirements.sw_req_markdown_incremental
+    # lobster-trace: SwRequirements.sw_req_rst_incremental
+    """Get the names of the .rsl files, which define the types of all packages.
+
+    Args:
+        symbols (Symbol_Table): The TRLC symbols.
+
+    Returns:
+        List[str]: The normalized .rsl file names in sorted order.
+    """
+    file_names = set()
+
+    for package in symbols.values(Package):
+        for symbol in package.symbols.values():
+            file_name = symbol.location.file_name
+
+            if file_name.endswith(".rsl"):
+                file_names.add(os.path.normpath(file_name))
+
+    return sorted(file_names)
+
 # Main *************************************************************************
@@ -20,18 +20,17 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
-import importlib.metadata as meta
 import os
 import sys
-import toml
+from typing import Optional
 
 # Variables ********************************************************************
 
-__version__ = "???"
-__author__ = "???"
-__email__ = "???"
-__repository__ = "???"
-__license__ = "???"
+# Names of the tool related information, which are loaded on demand.
+METADATA_NAMES = ["__version__", "__author__", "__email__", "__repository__", "__license__"]
+
+# The loaded tool related information or None if not loaded yet.
+_METADATA = None  # type: Optional[dict]
 
 # Classes **********************************************************************
 
@@ -58,6 +57,8 @@ def init_from_metadata():
     Returns:
         list: Tool related information
     """
+    # Imported on demand, because the tool related information is loaded on demand.
+    import importlib.metadata as meta  # pylint: disable=import-outside-toplevel
 
     my_metadata = meta.metadata('pyTRLCConverter')
 
@@ -77,6 +78,8 @@ def init_from_toml():
     Returns:
         list: Tool related information
     """
+    # Imported on demand, because the tool related information is loaded on demand.
+    import toml  # pylint: disable=import-outside-toplevel
 
     toml_file = resource_path("pyproject.toml")
     data = toml.load(toml_file)
@@ -88,10 +91,46 @@ def init_from_toml():
         data["project"]["urls"]["repository"], \
         data["project"]["license"]["text"]
 
-# Main *************************************************************************
+def _load_metadata() -> dict:
+    # lobster-trace: SwRequirements.sw_req_version
+    """Load the tool related information, from the installed package or from the pyproject.toml file.
+
+    Returns:
+        dict: Tool related information by its dunder name.
+    """
+    import importlib.metadata as meta  # pylint: disable=import-outside-toplevel
+
+    try:
+        metadata = init_from_metadata()
+
+    except meta.PackageNotFoundError:
+        metadata = init_from_toml()
+
+    return dict(zip(METADATA_NAMES, metadata))
 
-try:
-    __version__, __author__, __email__, __repository__, __license__ = init_from_metadata()
+def __getattr__(name: str) -> str:
+    # lobster-trace: SwRequirements.sw_req_cli_lazy_loading
+    """Get the tool related information, e.g. __version__.
+    Its loaded on the first access, because querying the package metadata or parsing the
+    pyproject.toml file takes time, which most runs don't need.
 
-except meta.PackageNotFoundError:
-    __version__, __author__, __email__, __repository__, __license__ = init_from_toml()
+    Args:
+        name (str): Dunder name of the tool related information.
+
+    Raises:
+        AttributeError: Unknown name.
+
+    Returns:
+        str: Tool related information
+    """
+    global _METADATA # pylint: disable=global-statement
+
+    if name not in METADATA_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if _METADATA is None:
+        _METADATA = _load_metadata()
+
+    return _METADATA[name]
+
+# Main *************************************************************************
@@ -19,10 +19,28 @@
 
 # Imports **********************************************************************
 
+from argparse import Namespace
+import json
+import os
 import re
+import shutil
+import subprocess
+import sys
 import pytest
-
-from pyTRLCConverter.__main__ import main
+from trlc.trlc import Source_Manager
+
+from pyTRLCConverter.__main__ import BUILD_IN_CONVERTER_LIST, main
+from pyTRLCConverter.file_watcher import FileWatcher
+from pyTRLCConverter import item_walker
+from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.docx_converter import DocxConverter
+from pyTRLCConverter.json_converter import JsonConverter
+from pyTRLCConverter.markdown_converter import MarkdownConverter
+from pyTRLCConverter.parse_cache import CACHE_FILE_EXTENSION, ParseCache
+from pyTRLCConverter.profiler import enable_profile, take_samples
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.rst_converter import RstConverter
+from pyTRLCConverter.trlc_helper import get_file_dict_from_symbols, get_trlc_symbols, is_item_record
 
 # Variables ********************************************************************
 
@@ -57,7 +75,7 @@ def test_tc_help(record_property, capsys, monkeypatch):
 
     # Check just the first line of the help message.
     print(captured.out)
-    regex = r"usage: pyTRLCConverter \[\-h\] \[\-\-version\] \[\-v\] \[\-i INCLUDE\] \-s SOURCE"
+    regex = r"usage: pyTRLCConverter \[\-h\] \[\-\-version\] \[\-v\] \[\-i INCLUDE\]\s+\(\-s SOURCE \| \-fs FROM_SNAPSHOT\)"
     assert re.match(regex, captured.out)
 
 def test_tc_help_prj_spec(record_property, capsys, monkeypatch):
@@ -88,7 +106,7 @@ def test_tc_help_prj_spec(record_property, capsys, monkeypatch):
 
     # Check just the first line of the help message.
     print(captured.out)
-    regex = r"usage: pyTRLCConverter \[\-h\] \[\-\-version\] \[\-v\] \[\-i INCLUDE\] \-s SOURCE"
+    regex = r"usage: pyTRLCConverter \[\-h\] \[\-\-version\] \[\-v\] \[\-i INCLUDE\]\s+\(\-s SOURCE \| \-fs FROM_SNAPSHOT\)"
     assert re.match(regex, captured.out)
 
 def test_tc_cli_exclude(record_property, capsys, monkeypatch):
@@ -131,6 +149,58 @@ def test_tc_cli_exclude(record_property, capsys, monkeypatch):
     assert lines[4] == "req_id_2"
     assert lines[5] == "description: Test description"
 
+def test_tc_cli_exclude_on_demand(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_exclude_on_demand
+    """
+    This test case checks whether the TRLC files of an excluded folder are only parsed,
+    if they are referenced by a not excluded TRLC file.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create the temporary source and output directories.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_exclude_on_demand")
+
+    source_dir = tmp_path / "src"
+    vendor_dir = source_dir / "vendor"
+    vendor_dir.mkdir(parents=True)
+    shutil.copy("./tests/utils/req.rsl", source_dir)
+
+    (source_dir / "own.trlc").write_text(
+        "package Own\nimport Requirements\nimport Vendor\n\n"
+        "Requirements.Requirement own_req {\n    description = \"Own\"\n    link = Vendor.vendor_req\n}\n",
+        encoding="utf-8")
+    (vendor_dir / "vendor.trlc").write_text(
+        "package Vendor\nimport Requirements\n\n"
+        "Requirements.Requirement vendor_req {\n    description = \"Vendor\"\n}\n",
+        encoding="utf-8")
+    (vendor_dir / "unused.trlc").write_text(
+        "package Unused\nimport Requirements\n\n"
+        "Requirements.Requirement unused_req {\n    description = \"Unused\"\n}\n",
+        encoding="utf-8")
+
+    symbols = get_trlc_symbols([str(source_dir)], None)
+    assert sorted(record.name for record in symbols.iter_record_objects()) == ["own_req", "unused_req", "vendor_req"]
+
+    # The referenced package of the excluded folder is parsed, the other one not.
+    symbols = get_trlc_symbols([str(source_dir)], None, None, [str(vendor_dir)])
+    assert sorted(record.name for record in symbols.iter_record_objects()) == ["own_req", "vendor_req"]
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", str(source_dir),
+        "--exclude", str(vendor_dir),
+        "--out", str(tmp_path / "out"),
+        "markdown"
+    ])
+
+    assert main() == Ret.OK
+    assert capsys.readouterr().err == ""
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == ["own.md"]
+    assert "vendor_req" in (tmp_path / "out" / "own.md").read_text(encoding="utf-8")
+
 def test_tc_cli_include(record_property, capsys, monkeypatch):
     # lobster-trace: SwTests.tc_cli_include
     """
@@ -169,5 +239,647 @@ def test_tc_cli_include(record_property, capsys, monkeypatch):
     assert "req_id_2" in lines
     assert "req_id_3" in lines
 
+def test_tc_cli_cache_dir(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_cache_dir
+    """
+    This test case checks whether the parsed TRLC files are cached and reused in the next run.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary cache directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_cache_dir")
+
+    # Mock program arguments to simulate running the script with a parse cache.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--verbose",
+        "--source", "./tests/utils/req.rsl",
+        "--source", "./tests/utils/single_req_with_section.trlc",
+        "--cache-dir", str(tmp_path),
+        "--project", "./tests/utils/psc_simple",
+        "simple"
+    ])
+
+    # The first run parses the TRLC files and stores the result in the cache.
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert "Parse cache: 0 hit(s), 1 miss(es)." in captured.out
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # The second run shall use the cached symbol table.
+    main()
+
+    captured_cached = capsys.readouterr()
+    assert captured_cached.err == ""
+    assert "Parse cache: 1 hit(s), 0 miss(es)." in captured_cached.out
+
+    # The output of the conversion shall not differ.
+    assert captured_cached.out.splitlines()[-4:] == captured.out.splitlines()[-4:]
+    assert captured_cached.out.splitlines()[-1] == "description: Test description"
+
+def test_tc_cli_cache_dir_hit(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_cache_dir_hit
+    """
+    This test case checks whether a cache hit skips the parsing of the TRLC files and whether the
+    least recently used cache entries are removed if the number of entries exceeds the limit.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to count the parse runs.
+        tmp_path (Path): Used to create a temporary cache directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_cache_dir_hit")
+
+    parse_list = []
+    process = Source_Manager.process
+
+    def count_process(self):
+        parse_list.append(self)
+        return process(self)
+
+    monkeypatch.setattr(Source_Manager, "process", count_process)
+
+    cache_dir = str(tmp_path / "cache")
+    file_list = ["./tests/utils/req.rsl", "./tests/utils/single_req_with_section.trlc"]
+
+    # A miss parses the TRLC files, a hit in another run loads them from the cache folder.
+    symbols = get_trlc_symbols(file_list, None, ParseCache(cache_dir))
+    assert len(parse_list) == 1
+
+    parse_cache = ParseCache(cache_dir)
+    symbols_cached = get_trlc_symbols(file_list, None, parse_cache)
+    assert len(parse_list) == 1
+    assert parse_cache.get_hits() == 1
+    assert [record.name for record in symbols_cached.iter_record_objects()] == \
+           [record.name for record in symbols.iter_record_objects()]
+
+    # The least recently used entries are removed.
+    cache_dir = str(tmp_path / "cache_lru")
+    parse_cache = ParseCache(cache_dir, 2)
+
+    for index, key in enumerate(["a", "b", "c"]):
+        parse_cache.store(key, symbols)
+        os.utime(os.path.join(cache_dir, key + CACHE_FILE_EXTENSION), ns=(index, index))
+
+    assert sorted(os.listdir(cache_dir)) == ["b" + CACHE_FILE_EXTENSION, "c" + CACHE_FILE_EXTENSION]
+    assert parse_cache.load("b") is not None
+    capsys.readouterr()
+
+    parse_cache.store("d", symbols)
+    assert sorted(os.listdir(cache_dir)) == ["b" + CACHE_FILE_EXTENSION, "d" + CACHE_FILE_EXTENSION]
+
+def test_tc_cli_watch(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_watch
+    """
+    This test case checks whether the TRLC files are converted again after a change in watch mode
+    and whether watching can be stopped during the first conversion.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary source and output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_watch")
+
+    src_path = tmp_path / "src"
+    out_path = tmp_path / "out"
+    shutil.copytree("./tests/utils", src_path)
+
+    # The file watcher shall detect a modified TRLC file.
+    file_watcher = FileWatcher([str(src_path)], 0)
+    assert not file_watcher.poll()
+
+    with open(src_path / "single_req_no_section.trlc", "a", encoding="utf-8") as trlc_file:
+        trlc_file.write("\n")
+
+    assert file_watcher.poll() == [str(src_path / "single_req_no_section.trlc")]
+    assert not file_watcher.poll()
+
+    # Simulate one detected change and stop watching afterwards with Ctrl+C.
+    changes = [[str(src_path / "single_req_no_section.trlc")]]
+
+    def wait_for_changes(_):
+        if not changes:
+            raise KeyboardInterrupt
+        return changes.pop()
+
+    monkeypatch.setattr(FileWatcher, "wait_for_changes", wait_for_changes)
+
+    # Mock program arguments to simulate running the script in watch mode.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--verbose",
+        "--source", str(src_path),
+        "--out", str(out_path),
+        "--watch",
+        "markdown"
+    ])
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert "Press Ctrl+C to stop." in captured.out
+    assert "Watching stopped." in captured.out
+
+    # The unchanged symbol table shall be reused and the unchanged output files shall be skipped.
+    assert "Parse cache: 1 hit(s), 1 miss(es)." in captured.out
+    assert captured.out.count("Skipping up to date file") == 3
+    assert (out_path / "single_req_no_section.md").is_file()
+
+    # Ctrl+C during the first conversion shall stop watching as well.
+    def convert(*_args):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr("pyTRLCConverter.__main__._convert", convert)
+
+    assert main() == Ret.ERROR
+
+    captured = capsys.readouterr()
+    assert "Press Ctrl+C to stop." not in captured.out
+    assert "Watching stopped." in captured.out
+
+def test_tc_cli_jobs(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_jobs
+    """
+    This test case checks whether the conversion with parallel worker processes results in the same
+    output as the sequential conversion.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create the temporary output directories.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_jobs")
+
+    captured_list = []
+
+    for jobs in ["1", "3"]:
+        # Mock program arguments to simulate running the script with the given number of jobs.
+        monkeypatch.setattr("sys.argv", [
+            "pyTRLCConverter",
+            "--verbose",
+            "--source", "./tests/utils",
+            "--out", str(tmp_path / jobs),
+            "--jobs", jobs,
+            "markdown",
+            "--incremental"
+        ])
+
+        main()
+
+        captured_list.append(capsys.readouterr())
+
+    # The messages shall be reported in the same order.
+    assert captured_list[0].err == captured_list[1].err
+    out_parallel = captured_list[1].out.replace(str(tmp_path / "3"), str(tmp_path / "1"))
+    out_parallel = out_parallel.replace("* jobs = 3", "* jobs = 1")
+    assert captured_list[0].out == out_parallel
+    assert captured_list[0].out.count("Processing file") == 3
+
+    # The output files shall be equal.
+    for md_file in (tmp_path / "1").glob("*.md"):
+        assert md_file.read_text(encoding="utf-8") == (tmp_path / "3" / md_file.name).read_text(encoding="utf-8")
+
+    # The manifest entries of the worker processes shall be merged.
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.out.count("Skipping up to date file") == 3
+
+def test_tc_cli_jobs_invalid(record_property, capsys, monkeypatch):
+    # lobster-trace: SwTests.tc_cli_jobs_invalid
+    """
+    This test case checks whether a number of worker processes below 1 is rejected.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_jobs_invalid")
+
+    for jobs in ["0", "-3", "two"]:
+        # Mock program arguments to simulate running the script with an invalid number of jobs.
+        monkeypatch.setattr("sys.argv", [
+            "pyTRLCConverter",
+            "--source", "./tests/utils",
+            "--jobs", jobs,
+            "markdown"
+        ])
+
+        # argparse will raise an exception if the argument is invalid.
+        with pytest.raises(SystemExit):
+            main()
+
+        captured = capsys.readouterr()
+        assert "argument -j/--jobs" in captured.err
+
+def test_tc_cli_jobs_worker_failure(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_jobs_worker_failure
+    """
+    This test case checks whether a terminated worker process is reported as error.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create the temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_jobs_worker_failure")
+
+    # The forked worker processes inherit the patched method and terminate abruptly.
+    monkeypatch.setattr("pyTRLCConverter.item_walker.ItemWalker._walk_file_captured",
+                        lambda self, file_name, item_list: os._exit(1))  # pylint: disable=protected-access
+
+    # Mock program arguments to simulate running the script with parallel worker processes.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils",
+        "--out", str(tmp_path),
+        "--jobs", "2",
+        "markdown"
+    ])
+
+    assert main() == Ret.ERROR
+
+    captured = capsys.readouterr()
+    assert "Worker process failed to process file" in captured.err
+
+def test_tc_cli_jobs_translation_misses(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_jobs_translation_misses
+    """
+    This test case checks whether the failed translations of the parallel worker processes are
+    part of the summary, like the ones of the sequential conversion.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create the temporary output directories.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_jobs_translation_misses")
+
+    expected_summary = [
+        "No translation available for 4 attribute(s):",
+        "* Requirement.index (3 time(s))",
+        "* Requirement.link (3 time(s))",
+        "* Requirement.precision (3 time(s))",
+        "* Requirement.valid (3 time(s))"
+    ]
+
+    for jobs, mode_list in [("1", []), ("3", []), ("3", ["--single-document"])]:
+        # Mock program arguments to simulate running the script with the given number of jobs.
+        monkeypatch.setattr("sys.argv", [
+            "pyTRLCConverter",
+            "--verbose",
+            "--source", "./tests/utils",
+            "--out", str(tmp_path / jobs),
+            "--translation", "./tests/utils/translation.json",
+            "--jobs", jobs,
+            "markdown"
+        ] + mode_list)
+
+        assert main() == Ret.OK
+
+        lines = capsys.readouterr().out.splitlines()
+        summary_index = lines.index(expected_summary[0])
+        assert lines[summary_index:summary_index + len(expected_summary)] == expected_summary
+
+def test_tc_cli_translation_misses(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_translation_misses
+    """
+    This test case checks whether the attributes without translation of the converted records
+    are reported in a summary by the built-in converters.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create the temporary output directories.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_translation_misses")
+
+    expected_summary = [
+        "No translation available for 4 attribute(s):",
+        "* Requirement.index (1 time(s))",
+        "* Requirement.link (1 time(s))",
+        "* Requirement.precision (1 time(s))",
+        "* Requirement.valid (1 time(s))"
+    ]
+
+    for converter in ["markdown", "rst", "docx"]:
+        # Mock program arguments to simulate running the script with the given converter.
+        monkeypatch.setattr("sys.argv", [
+            "pyTRLCConverter",
+            "--verbose",
+            "--source", "./tests/utils/req.rsl",
+            "--source", "./tests/utils/single_req_no_section.trlc",
+            "--out", str(tmp_path / converter),
+            "--translation", "./tests/utils/translation.json",
+            converter
+        ])
+
+        assert main() == Ret.OK
+
+        lines = capsys.readouterr().out.splitlines()
+        summary_index = lines.index(expected_summary[0])
+        assert lines[summary_index:summary_index + len(expected_summary)] == expected_summary
+
+def test_tc_cli_jobs_opt_in(record_property):
+    # lobster-trace: SwTests.tc_cli_jobs_opt_in
+    """
+    This test case checks whether the parallel conversion of files and items is only enabled for the built-in
+    converters, but not for derived project converters, which may keep state in their record handlers.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_jobs_opt_in")
+
+    args = Namespace(out=None, exclude=None, single_document=True, format=JsonConverter.FORMAT_NDJSON)
+
+    for converter_class in [MarkdownConverter, RstConverter, JsonConverter]:
+        class ProjectConverter(converter_class):  # pylint: disable=too-few-public-methods
+            """Derived project converter without explicit opt-in."""
+
+        assert converter_class(args).is_parallel_item_processing_supported() is True
+        assert ProjectConverter(args).is_parallel_item_processing_supported() is False
+
+    args = Namespace(out=None, exclude=None, single_document=False, multiple_document=True, template=None)
+
+    for converter_class in [MarkdownConverter, RstConverter, DocxConverter]:
+        class ProjectConverter(converter_class):  # pylint: disable=too-few-public-methods
+            """Derived project converter without explicit opt-in."""
+
+        assert converter_class(args).is_parallel_file_processing_supported() is True
+        assert ProjectConverter(args).is_parallel_file_processing_supported() is False
+
+def test_tc_cli_jobs_single_doc(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_jobs_single_doc
+    """
+    This test case checks whether the parallel conversion in single document mode results in the same
+    output file as the sequential conversion.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create the temporary output directories.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_jobs_single_doc")
+
+    # Render every item into its own fragment to check the order of the fragments.
+    monkeypatch.setattr(item_walker, "ITEM_CHUNK_SIZE", 1)
+
+    for converter, file_name in [("markdown", "output.md"), ("rst", "output.rst")]:
+        for jobs in ["1", "3"]:
+            # Mock program arguments to simulate running the script with the given number of jobs.
+            monkeypatch.setattr("sys.argv", [
+                "pyTRLCConverter",
+                "--source", "./tests/utils",
+                "--out", str(tmp_path / converter / jobs),
+                "--jobs", jobs,
+                converter,
+                "--single-document"
+            ])
+
+            (tmp_path / converter / jobs).mkdir(parents=True)
+            main()
+
+            captured = capsys.readouterr()
+            assert captured.err == ""
+
+        output_sequential = (tmp_path / converter / "1" / file_name).read_text(encoding="utf-8")
+        output_parallel = (tmp_path / converter / "3" / file_name).read_text(encoding="utf-8")
+        assert output_sequential == output_parallel
+
+
+
+def test_tc_cli_lazy_loading(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_cli_lazy_loading
+    """
+    This test case checks whether only the chosen built-in converter is imported and
+    whether the registry provides the same subcommands and descriptions as the converters.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create the temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_lazy_loading")
+
+    # A new interpreter is required, because other test cases import all converters.
+    script = "import sys\n" \
+             "from pyTRLCConverter.__main__ import main\n" \
+             f"sys.argv = ['pyTRLCConverter', '--source', './tests/utils', '--out', {str(tmp_path)!r}, 'markdown']\n" \
+             "print(main() == 0)\n" \
+             "print(sorted(name for name in sys.modules if name.startswith('pyTRLCConverter.')))\n" \
+             "print('docx' in sys.modules, 'toml' in sys.modules)\n"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                            env=dict(os.environ, PYTHONPATH="src"))
+    lines = result.stdout.splitlines()
+
+    assert lines[0] == "True"
+    assert "pyTRLCConverter.markdown_converter" in lines[1]
+    assert "pyTRLCConverter.docx_converter" not in lines[1]
+    assert "pyTRLCConverter.rst_converter" not in lines[1]
+    assert lines[2] == "False False"
+    assert os.path.isfile(tmp_path / "single_req_with_link.md")
+
+    for converter_entry in BUILD_IN_CONVERTER_LIST:
+        converter_class = converter_entry.load()
+
+        assert converter_entry.get_subcommand() == converter_class.get_subcommand()
+        assert converter_entry.get_description() == converter_class.get_description()
+
+def test_tc_cli_snapshot(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_snapshot
+    """
+    This test case checks whether the conversion of a snapshot results in the same output
+    as the conversion of the TRLC files, the snapshot was written from.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create the temporary output directories.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_snapshot")
+
+    snapshot_file = tmp_path / "model.snapshot"
+
+    # The TRLC files are parsed, converted and the snapshot is written.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils",
+        "--out", str(tmp_path / "source"),
+        "--to-snapshot", str(snapshot_file),
+        "markdown"
+    ])
+
+    assert main() == Ret.OK
+    assert capsys.readouterr().err == ""
+    assert snapshot_file.is_file()
+
+    # The snapshot is converted without the sources.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--from-snapshot", str(snapshot_file),
+        "--out", str(tmp_path / "snapshot"),
+        "markdown"
+    ])
+
+    assert main() == Ret.OK
+    assert capsys.readouterr().err == ""
+
+    md_file_list = sorted((tmp_path / "source").glob("*.md"))
+    assert len(md_file_list) == 3
+
+    for md_file in md_file_list:
+        assert md_file.read_text(encoding="utf-8") == \
+            (tmp_path / "snapshot" / md_file.name).read_text(encoding="utf-8")
+
+    # A file which is not a snapshot is rejected.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--from-snapshot", "./tests/utils/req.rsl",
+        "dump"
+    ])
+
+    assert main() == Ret.ERROR
+    assert "is not a snapshot" in capsys.readouterr().err
+
+def test_tc_cli_multiple_converters(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_multiple_converters
+    """
+    This test case checks whether several converters convert in one walk into the sub folders
+    of the output path, with the same output as by converting with each converter separately.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create the temporary output directories.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_multiple_converters")
+
+    # Every converter has its own arguments.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils",
+        "--out", str(tmp_path / "multiple"),
+        "markdown", "--top-level", "Markdown",
+        "+", "rst", "--single-document",
+        "+", "json"
+    ])
+
+    assert main() == Ret.OK
+    assert capsys.readouterr().err == ""
+
+    converter_argv_list = [
+        ["markdown", "--top-level", "Markdown"],
+        ["rst", "--single-document"],
+        ["json"]
+    ]
+
+    for converter_argv in converter_argv_list:
+        monkeypatch.setattr("sys.argv", [
+            "pyTRLCConverter",
+            "--source", "./tests/utils",
+            "--out", str(tmp_path / "single" / converter_argv[0])
+        ] + converter_argv)
+
+        assert main() == Ret.OK
+        assert capsys.readouterr().err == ""
+
+    file_list = sorted(path.relative_to(tmp_path / "single") for path in (tmp_path / "single").rglob("*.*"))
+    assert [str(path.parent) for path in file_list] == ["json"] + ["markdown"] * 3 + ["rst"]
+
+    for path in file_list:
+        assert (tmp_path / "multiple" / path).read_text(encoding="utf-8") == \
+            (tmp_path / "single" / path).read_text(encoding="utf-8")
+
+    # A converter can't be given twice, because they would write into the same folder.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils",
+        "markdown", "+", "markdown"
+    ])
+
+    with pytest.raises(SystemExit):
+        main()
+
+    assert "the converter markdown is given more than once" in capsys.readouterr().err
+
+def test_tc_cli_profile(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_cli_profile
+    """
+    This test case checks whether the wall and CPU time of the conversion phases, the files,
+    the record types and the project specific record handlers are written to the profile.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create the temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_cli_profile")
+
+    profile_file = tmp_path / "profile.json"
+
+    # The files are converted by worker processes, which report their samples too.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils",
+        "--out", str(tmp_path / "out"),
+        "--jobs", "2",
+        "--profile", str(profile_file),
+        "markdown"
+    ])
+
+    assert main() == Ret.OK
+    assert capsys.readouterr().err == ""
+
+    with open(profile_file, encoding="utf-8") as fd:
+        profile = json.load(fd)
+
+    assert [entry["name"] for entry in profile["phase"]] == ["arguments", "project_import", "parse", "walk", "total"]
+    assert sorted(os.path.basename(entry["name"]) for entry in profile["file"]) == \
+        ["single_req_no_section.trlc", "single_req_with_link.trlc", "single_req_with_section.trlc"]
+    assert [(entry["name"], entry["count"]) for entry in profile["record_type"]] == [("Requirement", 3)]
+    assert {entry["name"]: entry["count"] for entry in profile["output"]} == \
+        {"enter_file": 3, "leave_file": 3, "finish": 1}
+    assert all(0.0 <= entry["wall"] for entry_list in profile.values() for entry in entry_list)
+
+    summary = (tmp_path / "profile.txt").read_text(encoding="utf-8")
+    assert summary.startswith("phase")
+    assert "single_req_with_link.trlc" in summary
+
+    # The project specific record handlers are measured by their name.
+    def print_requirement(_record, _level, _translation) -> Ret:
+        return Ret.OK
+
+    symbols = get_trlc_symbols(["./tests/utils"], None)
+    record = next(item[0] for item_list in get_file_dict_from_symbols(symbols).values()
+                  for item in item_list if is_item_record(item))
+
+    converter = BaseConverter(None)
+    converter._set_project_record_handler(record.n_typ.name, print_requirement)
+
+    enable_profile(True)
+    assert converter.convert_record_object(record, 0) == Ret.OK
+    enable_profile(False)
+
+    samples = take_samples()
+    assert samples["record_handler"][print_requirement.__qualname__][0] == 1
+    assert "record_type" not in samples
 
 # Main *************************************************************************
@@ -22,9 +22,13 @@ import os
 from argparse import Namespace
 from collections import namedtuple
 import docx
+from docx.oxml.ns import qn
+from bench_docx_tables import run_benchmark
+from trlc_corpus import CorpusConfig
 
 from pyTRLCConverter.__main__ import main
 from pyTRLCConverter.docx_converter import DocxConverter
+from pyTRLCConverter.ret import Ret
 
 # Variables ********************************************************************
 
@@ -194,3 +198,115 @@ def test_tc_docx_template(record_property, capsys, monkeypatch, tmp_path):
 
     # Check that the requirement is present.
     assert created_docx.paragraphs[1].text == "req_id_1 (Requirement)"
+
+def test_tc_docx_table_xml(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_docx_table_xml
+    """
+    The headings and record tables generated as XML shall be equivalent to the ones
+    generated by the python-docx API.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_docx_table_xml")
+
+    config = CorpusConfig(packages=1, files=2, sections=2, records=3, attributes=2, array_size=3)
+    results = run_benchmark(config, 1, str(tmp_path))
+    assert results["equivalent"] is True
+
+    # Texts with characters, which are not written as text.
+    rows = [("Element", "Value"), (" leading", "trailing "), ("a\tb", "line 1\nline 2\r\n<&>\"'"), ("", "x")]
+
+    converter = DocxConverter(Namespace(template=None))
+    converter._add_xml(converter._get_table_xml(rows))
+
+    reference = docx.Document()
+    table = reference.add_table(rows=0, cols=2)
+    for row in rows:
+        cells = table.add_row().cells
+        cells[0].text = row[0]
+        cells[1].text = row[1]
+
+    created_runs = converter._docx.element.body.findall(".//" + qn("w:r"))
+    reference_runs = reference.element.body.findall(".//" + qn("w:r"))
+
+    # Compare the runs without their namespace declarations.
+    assert [run.xml.split(">", 1)[1] for run in created_runs] == \
+        [run.xml.split(">", 1)[1] for run in reference_runs]
+    assert converter._docx.tables[0].cell(2, 1).text == reference.tables[0].cell(2, 1).text
+
+def test_tc_docx_multiple_doc_mode(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_docx_multiple_doc_mode
+    """
+    The test case checks whether a docx file per TRLC file is created sequentially and by parallel
+    worker processes and whether every docx file starts with the template content.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_docx_multiple_doc_mode")
+
+    # The documents are created from copies of the template sequentially and by worker processes.
+    for jobs in ["1", "2"]:
+        out_path = tmp_path / jobs
+
+        monkeypatch.setattr("sys.argv", [
+            "pyTRLCConverter",
+            "--source", "./tests/utils",
+            "--out", str(out_path),
+            "--jobs", jobs,
+            "docx",
+            "--multiple-document",
+            "--template", "./tests/utils/template.docx",
+        ])
+
+        assert main() == 0
+
+        # Check that no errors were reported.
+        assert capsys.readouterr().err == ""
+
+        assert sorted(os.listdir(out_path)) == \
+            ["single_req_no_section.docx", "single_req_with_link.docx", "single_req_with_section.docx"]
+
+        created_docx = docx.Document(docx=str(out_path / "single_req_no_section.docx"))
+        assert created_docx.paragraphs[0].text == "Template text."
+        assert created_docx.paragraphs[1].text == "req_id_1 (Requirement)"
+        assert len(created_docx.tables) == 1
+
+        created_docx = docx.Document(docx=str(out_path / "single_req_with_section.docx"))
+        assert created_docx.paragraphs[0].text == "Template text."
+        assert created_docx.paragraphs[1].text == "Test section"
+
+def test_tc_docx_finish_background_jobs(record_property, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_docx_finish_background_jobs
+    """
+    The test case checks whether the docx converter waits for the jobs in the background,
+    e.g. the diagram generation, before the document is saved.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        monkeypatch (Any): Used to record the calls.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_docx_finish_background_jobs")
+
+    call_list = []
+
+    def finish_background_jobs(_self):
+        call_list.append("finish_background_jobs")
+        return Ret.OK
+
+    def save_document(_self, file_name):
+        call_list.append(f"save {file_name}")
+        return Ret.OK
+
+    monkeypatch.setattr(DocxConverter, "finish_background_jobs", finish_background_jobs)
+    monkeypatch.setattr(DocxConverter, "_save_document", save_document)
+
+    converter = DocxConverter(Namespace(template=None, translation=None, name="output.docx", out=str(tmp_path)))
+    assert converter.finish() == Ret.OK
+    assert call_list == ["finish_background_jobs", "save output.docx"]
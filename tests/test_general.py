@@ -19,10 +19,18 @@
 
 # Imports **********************************************************************
 
+import json
 import re
+from argparse import Namespace
 import pytest
 
 from pyTRLCConverter.__main__ import main
+from pyTRLCConverter.logger import enable_verbose
+from pyTRLCConverter.markdown_converter import MarkdownConverter
+from pyTRLCConverter.ret import Ret
+from pyTRLCConverter.translator import Translator
+from pyTRLCConverter.trlc_helper import FileItem, RecordAttributes, RecordItem, SectionItem, get_trlc_symbols, \
+    iter_items, iter_items_by_file, iter_record_objects_by_section
 
 # Variables ********************************************************************
 
@@ -96,6 +104,143 @@ def test_tc_translation(record_property, capsys, monkeypatch):
     assert lines[0] == "req_id_1"
     assert lines[1] == "Translated Description: Test description"
 
+def test_tc_translation_language(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_translation_language
+    """
+    Check whether the given language of a translation file with several languages is applied.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary translation file.
+    """
+    record_property("lobster-trace", "SwTests.tc_translation_language")
+
+    translation_file = tmp_path / "translation.json"
+    translation_file.write_text(json.dumps({
+        Translator.LANGUAGES_KEY: {
+            "en": {"Requirement": {"description": "Description"}},
+            "de": {"Requirement": {"description": "Beschreibung"}}
+        }
+    }), encoding="utf-8")
+
+    for language, expected_attribute_name in [(None, "Description"), ("de", "Beschreibung")]:
+        argv = [
+            "pyTRLCConverter",
+            "--source", "./tests/utils/req.rsl",
+            "--source", "./tests/utils/single_req_no_section.trlc",
+            "--project", "./tests/utils/psc_simple.py",
+            "--translation", str(translation_file)
+        ]
+
+        if language is not None:
+            argv += ["--language", language]
+
+        monkeypatch.setattr("sys.argv", argv + ["simple"])
+
+        assert main() == Ret.OK
+
+        captured = capsys.readouterr()
+        assert captured.err == ""
+        assert captured.out.splitlines()[1] == f"{expected_attribute_name}: Test description"
+
+    # A not available language is reported.
+    monkeypatch.setattr("sys.argv", argv[:-1] + ["fr", "simple"])
+
+    assert main() == Ret.ERROR
+    assert "Language fr is not available" in capsys.readouterr().err
+
+def test_tc_translation_validation(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_translation_validation
+    """
+    Check whether a translation of an unknown requirement type or attribute is reported
+    in verbose mode, but doesn't fail the conversion.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary translation file.
+    """
+    record_property("lobster-trace", "SwTests.tc_translation_validation")
+
+    translation_file = tmp_path / "translation.json"
+    translation_file.write_text(json.dumps({
+        "Requirement": {"description": "Description", "typo": "Typo"},
+        "Unknown": {"description": "Description"}
+    }), encoding="utf-8")
+
+    argv = [
+        "pyTRLCConverter",
+        "--source", "./tests/utils/req.rsl",
+        "--source", "./tests/utils/single_req_no_section.trlc",
+        "--project", "./tests/utils/psc_simple.py",
+        "--translation", str(translation_file),
+        "simple"
+    ]
+    monkeypatch.setattr("sys.argv", argv)
+
+    assert main() == Ret.OK
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert "Translation of unknown" not in captured.out
+
+    monkeypatch.setattr("sys.argv", argv[:1] + ["--verbose"] + argv[1:])
+
+    assert main() == Ret.OK
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert "Translation of unknown attribute Requirement.typo.\n" \
+           "Translation of unknown requirement type Unknown.\n" in captured.out
+
+def test_tc_translation_misses(record_property, capsys, tmp_path):
+    # lobster-trace: SwTests.tc_translation_misses
+    """
+    Check whether the failed translations are reported together in a summary.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        tmp_path (Path): Used to create a temporary translation file.
+    """
+    record_property("lobster-trace", "SwTests.tc_translation_misses")
+
+    translation_file = tmp_path / "translation.json"
+    translation_file.write_text(json.dumps({"Requirement": {"description": "Description"}}), encoding="utf-8")
+
+    translator = Translator()
+    assert translator.load(str(translation_file)) is True
+
+    enable_verbose(True)
+
+    try:
+        capsys.readouterr()
+
+        # The misses are not reported one by one.
+        for _ in range(3):
+            assert translator.translate("Requirement", "description") == "Description"
+            assert translator.translate("Requirement", "index") == "index"
+            assert translator.translate("Unknown", "description") == "description"
+
+        assert capsys.readouterr().out == ""
+
+        translator.log_misses()
+        assert capsys.readouterr().out.splitlines() == [
+            "No translation available for 2 attribute(s):",
+            "* Requirement.index (3 time(s))",
+            "* Unknown.description (3 time(s))"
+        ]
+
+        # The misses are reported only once.
+        translator.log_misses()
+        assert capsys.readouterr().out == ""
+
+    finally:
+        enable_verbose(False)
+
 def test_tc_prj_spec(record_property, capsys, monkeypatch):
     # lobster-trace: SwTests.tc_prj_spec
     """
@@ -270,8 +415,143 @@ def test_tc_verbose(record_property, capsys, monkeypatch):
 
     # Check if the expected output.
     lines = captured.out.splitlines()
-    assert len(lines) == 17
-    assert lines[15] == "req_id_1"
-    assert lines[16] == "description: Test description"
+    assert len(lines) == 24
+    assert lines[22] == "req_id_1"
+    assert lines[23] == "description: Test description"
+
+def test_tc_iter_items(record_property, monkeypatch):
+    # lobster-trace: SwTests.tc_iter_items
+    """
+    Check whether the typed items are the same as the ones of the section iterator and
+    whether the items per file are consumed lazily.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        monkeypatch (Any): Used to count the consumed record objects.
+    """
+    record_property("lobster-trace", "SwTests.tc_iter_items")
+
+    symbols = get_trlc_symbols(["./tests/utils"], None)
+    expected = []
+
+    for item in iter_record_objects_by_section(symbols):
+        if isinstance(item, str):
+            expected.append((FileItem, item))
+        elif isinstance(item[0], str):
+            expected.append((SectionItem, item[0], item[1]))
+        else:
+            expected.append((RecordItem, item[0], item[1]))
+
+    items = list(iter_items(symbols))
+    assert [(type(item), *(getattr(item, name) for name in item.__slots__)) for item in items] == expected
+    assert all(not hasattr(item, "__dict__") for item in items)
+
+    # The record objects are consumed on demand, the items of skipped files are not materialized.
+    consumed = []
+    iter_record_objects = symbols.iter_record_objects
+
+    def iter_record_objects_counted():
+        for record_object in iter_record_objects():
+            consumed.append(record_object)
+            yield record_object
+
+    monkeypatch.setattr(symbols, "iter_record_objects", iter_record_objects_counted)
+
+    file_iter = iter_items_by_file(symbols)
+    file_name, item_iter = next(file_iter)
+    assert file_name == expected[0][1]
+    assert len(consumed) == 1
+
+    file_items = list(item_iter)
+    assert all(isinstance(item, (SectionItem, RecordItem)) for item in file_items)
+
+    # The next file is reached, even if the items of the current file are skipped.
+    file_names = [file_name] + [file_name for file_name, _ in file_iter]
+    assert file_names == [entry[1] for entry in expected if entry[0] is FileItem]
+
+def test_tc_record_attributes(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_record_attributes
+    """
+    Check whether the attribute view of a record object provides the typed attribute values,
+    converts every value only on its first access and is shared by all handler calls.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_record_attributes")
+
+    symbols = get_trlc_symbols(["./tests/utils"], None)
+    records = {record.name: record for record in symbols.iter_record_objects()}
+    record = records["req_id_3"]
+
+    converter = MarkdownConverter(Namespace(out=str(tmp_path), exclude=None))
+
+    # pylint: disable=protected-access
+    record_attributes = converter._get_attributes(record)
+    assert converter._get_attributes(record) is record_attributes
+
+    # Only the accessed values are converted.
+    assert record_attributes.get_string("description") == "Test description"
+    assert list(record_attributes._value_dict) == ["description"]
+
+    assert record_attributes.get_value("valid") is False
+    assert record_attributes.get_string("valid") == "False"
+    assert record_attributes.get_string("index") is None
+    assert record_attributes.get_value("link") == "Requirements.req_id_2"
+    assert record_attributes.get_reference("link") is records["req_id_2"]
+    assert record_attributes.get_reference("description") is None
+    assert record_attributes.get_reference_array("link") == []
+    assert record_attributes.get_array("index") == []
+
+    # The values are the same as the ones of the whole dictionary.
+    assert {name: record_attributes.get_value(name) for name in record.field} == record.to_python_dict()
+
+    # Empty values are replaced by the empty attribute value, unknown attributes are reported.
+    assert converter._get_attribute(record, "description") == "Test description"
+    assert converter._get_attribute(record, "index") == converter._empty_attribute_value
+
+    with pytest.raises(KeyError):
+        converter._get_attribute(record, "unknown")
+
+    # Only the view of the latest record object is kept and it is released after the conversion.
+    assert converter._get_attributes(records["req_id_2"]) is not record_attributes
+    assert converter._get_attributes(records["req_id_2"]).get_record() is records["req_id_2"]
+
+    handler_view_list = []
+
+    def record_handler(record, _level, _translation):
+        handler_view_list.append(converter._get_attributes(record))
+        return Ret.OK
+
+    converter._set_project_record_handler("Requirement", record_handler)
+    assert converter.convert_record_object(record, 1) == Ret.OK
+    assert handler_view_list[0].get_record() is record
+    assert converter._record_attributes is None
+
+def test_tc_record_attributes_enum(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_record_attributes_enum
+    """
+    Check whether the attribute view of a record object provides the literal name of an enumeration attribute.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create the temporary TRLC files.
+    """
+    record_property("lobster-trace", "SwTests.tc_record_attributes_enum")
+
+    (tmp_path / "model.rsl").write_text("package Enums\n\n" \
+                                        "enum Status {\n    draft\n    valid\n}\n\n" \
+                                        "type Item {\n    status optional Status\n}\n", encoding="utf-8")
+    (tmp_path / "items.trlc").write_text("package Enums\n\n" \
+                                         "Item item_valid {\n    status = Status.valid\n}\n\n" \
+                                         "Item item_unset {\n}\n", encoding="utf-8")
+
+    symbols = get_trlc_symbols([str(tmp_path)], None)
+    records = {record.name: record for record in symbols.iter_record_objects()}
+
+    assert RecordAttributes(records["item_valid"]).get_enum("status") == "valid"
+    assert RecordAttributes(records["item_valid"]).get_string("status") == "valid"
+    assert RecordAttributes(records["item_unset"]).get_enum("status") is None
 
 # Main *************************************************************************
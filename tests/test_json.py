@@ -0,0 +1,122 @@
+"""Test the JSON requirements.
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import json
+import os
+from pyTRLCConverter.__main__ import main
+from pyTRLCConverter.ret import Ret
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+def test_tc_json(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_json
+    """
+    The software shall support the conversion of TRLC source files into NDJSON format,
+    with one object per file, section and record.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_json")
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils",
+        "--out", str(tmp_path),
+        "json"
+    ])
+
+    assert main() == Ret.OK
+
+    # Check that no errors were reported.
+    assert capsys.readouterr().err == ""
+
+    with open(tmp_path / "output.ndjson", encoding="utf-8") as fd:
+        objects = [json.loads(line) for line in fd]
+
+    assert [(json_object["type"], json_object["name"]) for json_object in objects] == [
+        ("file", os.path.normpath("./tests/utils/single_req_no_section.trlc")),
+        ("record", "req_id_1"),
+        ("file", os.path.normpath("./tests/utils/single_req_with_link.trlc")),
+        ("record", "req_id_3"),
+        ("file", os.path.normpath("./tests/utils/single_req_with_section.trlc")),
+        ("section", "Test section"),
+        ("record", "req_id_2")
+    ]
+
+    assert objects[5]["level"] == 0
+
+    record = objects[3]
+    assert record["record_type"] == "Requirement"
+    assert record["package"] == "Requirements"
+    assert record["level"] == 0
+    assert record["line"] == 3
+    assert record["attributes"] == {
+        "description": "Test description",
+        "link": "Requirements.req_id_2",
+        "index": None,
+        "precision": None,
+        "valid": False
+    }
+
+    # The reference target is resolved.
+    assert len(record["references"]) == 1
+    assert record["references"][0]["name"] == "Requirements.req_id_2"
+    assert os.path.basename(record["references"][0]["file"]) == "single_req_with_section.trlc"
+    assert record["references"][0]["line"] == 4
+
+def test_tc_json_format(record_property, capsys, monkeypatch):
+    # lobster-trace: SwTests.tc_json_format
+    """
+    The software shall support the conversion into a single JSON array, written to stdout.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+    """
+    record_property("lobster-trace", "SwTests.tc_json_format")
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils",
+        "json",
+        "--format", "json",
+        "--name", "-"
+    ])
+
+    assert main() == Ret.OK
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+
+    objects = json.loads(captured.out)
+    assert [json_object["type"] for json_object in objects] == \
+        ["file", "record", "file", "record", "file", "section", "record"]
+    assert objects[-1]["attributes"]["precision"] == 0.01
+
+# Main *************************************************************************
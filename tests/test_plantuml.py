@@ -29,9 +29,15 @@ Tests:
 
 # Imports **********************************************************************
 import os
+import subprocess
 from unittest.mock import patch, mock_open
 import pytest
+import requests
+from pyTRLCConverter import plantuml as plantuml_module
 from pyTRLCConverter.plantuml import PlantUML
+from pyTRLCConverter.base_converter import BaseConverter
+from pyTRLCConverter.image_cache import ImageCache
+from pyTRLCConverter.ret import Ret
 
 # Variables ********************************************************************
 
@@ -83,4 +89,313 @@ def test_make_server_url(record_property: any, plantuml_instance: PlantUML):
     assert result_url.startswith("http://plantuml.com/plantuml/svg/")
     assert result_url == expected_url
 
+def test_tc_plantuml_async(record_property: any, tmp_path: any, monkeypatch: any):
+    # lobster-trace: SwTests.tc_plantuml_async
+    """
+    The diagrams shall be generated in the background and all failed diagrams shall be
+    reported together in the order they were started.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary output directory.
+        monkeypatch (Any): Used to mock the image generation.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_async")
+
+    def generate(_self: PlantUML, diagram_type: str, diagram_path: str, dst_path: str) -> None:
+        if "fail" in diagram_path:
+            raise FileNotFoundError("plantuml.jar not found.")
+
+        # The diagram name differs from the file name, therefore no image with the file name.
+        if "named" not in diagram_path:
+            with open(PlantUML.get_output_file(diagram_type, diagram_path, dst_path), "w", encoding="utf-8") as f:
+                f.write(diagram_path)
+
+    monkeypatch.setattr(PlantUML, "generate", generate)
+
+    converter = BaseConverter(None)
+    plantuml = converter._get_plantuml()
+    assert plantuml is converter._get_plantuml()
+
+    diagram_list = ["a.puml", "fail_1.puml", "b.puml", "named.puml", "fail_2.puml"]
+    future_list = [plantuml.generate_async("png", diagram, str(tmp_path)) for diagram in diagram_list]
+
+    assert future_list[0].result() == os.path.join(str(tmp_path), "a.png")
+    assert future_list[2].result() == os.path.join(str(tmp_path), "b.png")
+
+    # All failed diagrams are reported together.
+    assert plantuml.wait_for_jobs() == [
+        "fail_1.puml: plantuml.jar not found.",
+        f"named.puml: named.puml diagram name ('@startuml <name>') may differ from file name, " \
+        f"expected {os.path.join(str(tmp_path), 'named.png')}.",
+        "fail_2.puml: plantuml.jar not found."
+    ]
+    assert plantuml.wait_for_jobs() == []
+    assert os.path.isfile(os.path.join(str(tmp_path), "a.png")) is True
+
+    # The converter reports the failed diagrams at the end of the conversion.
+    plantuml.generate_async("png", "c.puml", str(tmp_path))
+    assert converter.finish() == Ret.OK
+
+    plantuml.generate_async("png", "fail_3.puml", str(tmp_path))
+    assert converter.finish() == Ret.ERROR
+
+def test_tc_plantuml_batch(record_property: any, tmp_path: any, monkeypatch: any):
+    # lobster-trace: SwTests.tc_plantuml_batch
+    """
+    The diagrams which are generated in the background by the local PlantUML java jar file
+    shall be generated in batches by a single java process per batch, unless its command line
+    would be too long.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary output directory.
+        monkeypatch (Any): Used to mock the java process.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_batch")
+
+    cmd_list = []
+
+    def run(cmd: list, **_kwargs) -> subprocess.CompletedProcess:
+        cmd_list.append(cmd)
+        dst_path = cmd[cmd.index("-o") + 1]
+
+        for diagram_path in cmd[cmd.index("plantuml.jar") + 1:cmd.index("-tpng")]:
+            # The diagram name differs from the file name, therefore no image with the file name.
+            if "named" not in diagram_path:
+                with open(PlantUML.get_output_file("png", diagram_path, dst_path), "w", encoding="utf-8") as f:
+                    f.write(diagram_path)
+
+        return subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(plantuml_module.subprocess, "run", run)
+    monkeypatch.setattr(plantuml_module, "BATCH_SIZE_MAX", 3)
+    monkeypatch.setenv("PLANTUML", "plantuml.jar")
+
+    plantuml = PlantUML()
+    diagram_list = ["a.puml", "b.puml", "named.puml", "c.puml"]
+    future_list = [plantuml.generate_async("png", diagram, str(tmp_path)) for diagram in diagram_list]
+
+    # The full batch is started at once, the rest when waiting for the jobs.
+    assert plantuml.wait_for_jobs() == [
+        f"named.puml: named.puml diagram name ('@startuml <name>') may differ from file name, " \
+        f"expected {os.path.join(str(tmp_path), 'named.png')}."
+    ]
+    assert len(cmd_list) == 2
+    assert cmd_list[0][cmd_list[0].index("plantuml.jar") + 1:cmd_list[0].index("-tpng")] == diagram_list[:3]
+    assert cmd_list[1][cmd_list[1].index("plantuml.jar") + 1:cmd_list[1].index("-tpng")] == diagram_list[3:]
+    assert future_list[3].result() == os.path.join(str(tmp_path), "c.png")
+
+    # A batch is split into several java processes by the max. command line length.
+    cmd_list.clear()
+    command_line_length_max = 100 + len(str(tmp_path))
+    monkeypatch.setattr(plantuml_module, "COMMAND_LINE_LENGTH_MAX", command_line_length_max)
+
+    diagram_list = [f"diagram_{index}.puml" for index in range(10)]
+    plantuml.generate_batch("png", diagram_list, str(tmp_path))
+
+    assert 1 < len(cmd_list)
+    assert [diagram_path for cmd in cmd_list
+            for diagram_path in cmd[cmd.index("plantuml.jar") + 1:cmd.index("-tpng")]] == diagram_list
+    assert all(len(subprocess.list2cmdline(cmd)) <= command_line_length_max for cmd in cmd_list)
+
+    # Without java all diagrams of the batch fail.
+    def run_without_java(cmd: list, **_kwargs) -> subprocess.CompletedProcess:
+        raise FileNotFoundError(cmd[0])
+
+    monkeypatch.setattr(plantuml_module.subprocess, "run", run_without_java)
+    plantuml.generate_async("png", "d.puml", str(tmp_path))
+    plantuml.generate_async("png", "e.puml", str(tmp_path))
+
+    assert plantuml.wait_for_jobs() == [
+        "d.puml: plantuml.jar not found.",
+        "e.puml: plantuml.jar not found."
+    ]
+
+def test_tc_plantuml_cache(record_property: any, tmp_path: any, monkeypatch: any):
+    # lobster-trace: SwTests.tc_plantuml_cache
+    """
+    An unchanged diagram shall be copied from the image cache without contacting the server
+    and the least recently used cache entries shall be removed if the size limit is exceeded.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary folder.
+        monkeypatch (Any): Used to mock the PlantUML server.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_cache")
+
+    url_list = []
+
+    def get(_self: requests.Session, url: str, **_kwargs) -> any:
+        url_list.append(url)
+        return type("Response", (), {"status_code": 200, "content": url.encode("utf-8")})
+
+    monkeypatch.setattr(requests.Session, "get", get)
+    monkeypatch.setenv("PLANTUML", "http://plantuml.com/plantuml")
+
+    cache_dir = str(tmp_path / "cache")
+    dst_path = str(tmp_path / "out")
+    diagram_path = str(tmp_path / "diagram.puml")
+    output_file = os.path.join(dst_path, "diagram.png")
+
+    with open(diagram_path, "w", encoding="utf-8") as f:
+        f.write("@startuml\nAlice -> Bob: Hello\n@enduml")
+
+    PlantUML(cache_dir=cache_dir).generate("png", diagram_path, dst_path)
+    assert len(url_list) == 1
+    os.remove(output_file)
+
+    # Unchanged diagram is copied from the cache.
+    plantuml = PlantUML(cache_dir=cache_dir)
+    plantuml.generate("png", diagram_path, dst_path)
+    assert len(url_list) == 1
+    assert plantuml.get_image_cache().get_hits() == 1
+    with open(output_file, "rb") as f:
+        assert f.read() == url_list[0].encode("utf-8")
+
+    # Another diagram type or server results in a different cache entry.
+    plantuml.generate("svg", diagram_path, dst_path)
+    monkeypatch.setenv("PLANTUML", "http://localhost:8080/plantuml")
+    PlantUML(cache_dir=cache_dir).generate("png", diagram_path, dst_path)
+    assert len(url_list) == 3
+
+    # Changed diagram is generated again.
+    with open(diagram_path, "w", encoding="utf-8") as f:
+        f.write("@startuml\nBob -> Alice: Hello\n@enduml")
+
+    plantuml.generate("png", diagram_path, dst_path)
+    assert len(url_list) == 4
+
+    # The least recently used entries are removed.
+    lru_cache_dir = str(tmp_path / "lru")
+    image_cache = ImageCache(lru_cache_dir, 2 * os.path.getsize(diagram_path))
+
+    for index, key in enumerate(["a", "b", "c"]):
+        image_cache.store(key, "png", diagram_path)
+        os.utime(os.path.join(lru_cache_dir, f"{key}.png"), ns=(index, index))
+
+    assert image_cache.fetch("a", "png", output_file) is True
+    image_cache.evict()
+
+    assert sorted(os.listdir(lru_cache_dir)) == ["a.png", "c.png"]
+    assert image_cache.fetch("b", "png", output_file) is False
+    assert image_cache.get_misses() == 1
+
+def test_tc_plantuml_cache_include(record_property: any, tmp_path: any):
+    # lobster-trace: SwTests.tc_plantuml_cache_include
+    """
+    The cache key of a diagram shall change if a file changes, which it includes directly or indirectly.
+    A diagram which includes a file by URL shall not be cached.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary folder.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_cache_include")
+
+    diagram_path = str(tmp_path / "diagram.puml")
+    (tmp_path / "common").mkdir()
+
+    with open(diagram_path, "w", encoding="utf-8") as f:
+        f.write("@startuml\n!include <C4/C4_Container>\n!include common/style.iuml\n" \
+                "!includesub common/parts.iuml!PART\nAlice -> Bob: Hello\n@enduml")
+
+    with open(tmp_path / "common" / "style.iuml", "w", encoding="utf-8") as f:
+        f.write("!include_once parts.iuml\n!include ../diagram.puml\n")
+
+    with open(tmp_path / "common" / "parts.iuml", "w", encoding="utf-8") as f:
+        f.write("!startsub PART\nskinparam monochrome true\n!endsub\n")
+
+    key = ImageCache.get_key("png", diagram_path, "backend")
+    assert key is not None
+    assert key == ImageCache.get_key("png", diagram_path, "backend")
+
+    # A change of an indirectly included file results in another key.
+    with open(tmp_path / "common" / "parts.iuml", "w", encoding="utf-8") as f:
+        f.write("!startsub PART\nskinparam monochrome false\n!endsub\n")
+
+    assert ImageCache.get_key("png", diagram_path, "backend") not in [None, key]
+
+    # A missing included file or an include by URL prevents the caching.
+    os.remove(tmp_path / "common" / "parts.iuml")
+    assert ImageCache.get_key("png", diagram_path, "backend") is None
+
+    with open(tmp_path / "common" / "parts.iuml", "w", encoding="utf-8") as f:
+        f.write("!includeurl https://example.com/parts.iuml\n")
+
+    assert ImageCache.get_key("png", diagram_path, "backend") is None
+
+def test_tc_plantuml_session(record_property: any, tmp_path: any, monkeypatch: any):
+    # lobster-trace: SwTests.tc_plantuml_session
+    """
+    All requests to the PlantUML server shall share one session with the configured timeout
+    and retries and the same diagram shall be requested only once, without keeping its content.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary folder.
+        monkeypatch (Any): Used to mock the PlantUML server.
+    """
+    record_property("lobster-trace", "SwTests.tc_plantuml_session")
+
+    request_list = []
+    status_code = 200
+
+    def get(session: requests.Session, url: str, timeout: float) -> any:
+        request_list.append((session, url, timeout))
+        return type("Response", (), {"status_code": status_code, "content": b"png", "text": "error"})
+
+    monkeypatch.setattr(requests.Session, "get", get)
+    monkeypatch.setenv("PLANTUML", "https://plantuml.example.com/plantuml")
+    monkeypatch.setenv("PLANTUML_TIMEOUT", "2.5")
+    monkeypatch.setenv("PLANTUML_RETRIES", "5")
+
+    diagram_list = []
+    for name in ["a", "b"]:
+        diagram_list.append(str(tmp_path / f"{name}.puml"))
+        with open(diagram_list[-1], "w", encoding="utf-8") as f:
+            f.write(f"@startuml\n{name} -> Bob: Hello\n@enduml")
+
+    plantuml = PlantUML()
+
+    for dst_path in ["out_1", "out_2"]:
+        for diagram_path in diagram_list:
+            plantuml.generate_async("png", diagram_path, str(tmp_path / dst_path))
+
+    assert plantuml.wait_for_jobs() == []
+    assert os.path.isfile(str(tmp_path / "out_2" / "b.png")) is True
+
+    # Every diagram is requested once by the same session.
+    assert sorted(url for _, url, _ in request_list) == \
+        sorted(plantuml._make_server_url("png", diagram_path) for diagram_path in diagram_list)
+    assert len({id(session) for session, _, _ in request_list}) == 1
+    assert {timeout for _, _, timeout in request_list} == {2.5}
+
+    retry = request_list[0][0].get_adapter("https://plantuml.example.com").max_retries
+    assert retry.total == 5
+    assert 503 in retry.status_forcelist
+
+    # The further diagrams are copied from the image files, the response contents are not kept.
+    with open(str(tmp_path / "out_2" / "a.png"), "rb") as f:
+        assert f.read() == b"png"
+
+    assert plantuml._requests == {}
+    assert sorted(os.path.basename(image_file) for image_file in plantuml._request_files.values()) == \
+        ["a.png", "b.png"]
+
+    # A removed image file is requested again.
+    os.remove(plantuml._request_files[plantuml._make_server_url("png", diagram_list[0])])
+    plantuml.generate("png", diagram_list[0], str(tmp_path / "out_3"))
+    assert len(request_list) == 3
+    assert os.path.isfile(str(tmp_path / "out_3" / "a.png")) is True
+
+    # A failed request is requested again by a later call.
+    status_code = 500
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.RequestException):
+            plantuml.generate("svg", diagram_list[0], str(tmp_path / "out_1"))
+
+    assert len(request_list) == 5
+
 # Main *************************************************************************
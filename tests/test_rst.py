@@ -18,13 +18,16 @@
 # If not, see <https://www.gnu.org/licenses/>.
 
 # Imports **********************************************************************
+import io
 import os
+import shutil
 
 from argparse import Namespace
 from collections import namedtuple
 
 from pyTRLCConverter.__main__ import main
 from pyTRLCConverter.rst_converter import RstConverter
+from pyTRLCConverter.trlc_helper import get_file_dict_from_symbols, get_trlc_symbols, is_item_record
 
 # Variables ********************************************************************
 
@@ -579,3 +582,294 @@ def test_tc_rst_multi_doc(record_property, capsys, monkeypatch, tmp_path):
         assert lines[13] == "    +----------------+------------------+\n"
         assert lines[14] == "    | link           | N/A              |\n"
         assert lines[15] == "    +----------------+------------------+\n"
+
+def test_tc_rst_incremental(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_rst_incremental
+    """
+    The software shall convert in incremental mode only the TRLC source files whose
+    reStructuredText file is outdated.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_rst_incremental")
+
+    # Copy the TRLC sources, because they will be modified.
+    src_path = tmp_path / "src"
+    out_path = tmp_path / "out"
+    shutil.copytree("./tests/utils", src_path)
+
+    # Mock program arguments to simulate running the script with inbuild reStructuredText converter.
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--verbose",
+        "--source", str(src_path / "req.rsl"),
+        "--source", str(src_path / "single_req_with_link.trlc"),
+        "--source", str(src_path / "single_req_with_section.trlc"),
+        "--out", str(out_path),
+        "rst",
+        "--incremental"
+    ])
+
+    # The first run shall convert all files.
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert "Skipping up to date file" not in captured.out
+    assert os.path.isfile(out_path / "single_req_with_link.rst")
+    assert os.path.isfile(out_path / "single_req_with_section.rst")
+
+    # Nothing changed, so no file shall be converted again.
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out.count("Skipping up to date file") == 2
+
+    # The referencing file shall be converted again, if the referenced file changed.
+    with open(src_path / "single_req_with_section.trlc", "a", encoding="utf-8") as trlc_file:
+        trlc_file.write("\n")
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert "Skipping up to date file" not in captured.out
+
+    # The referenced file shall not be converted again, if only the referencing file changed.
+    with open(src_path / "single_req_with_link.trlc", "a", encoding="utf-8") as trlc_file:
+        trlc_file.write("\n")
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out.count("Skipping up to date file") == 1
+    assert f"Skipping up to date file {os.path.normpath(src_path / 'single_req_with_section.trlc')}." in captured.out
+
+def test_tc_rst_record_render_plan(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_rst_record_render_plan
+    """
+    The rendering plan of a record type shall be compiled once and reused for all records of the type.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_rst_record_render_plan")
+
+    symbols = get_trlc_symbols(["./tests/utils"], None)
+    records = [item[0] for _, item_list in get_file_dict_from_symbols(symbols).items()
+               for item in item_list if is_item_record(item)]
+    assert len(records) == 3
+
+    rst_converter = RstConverter(Namespace(out=str(tmp_path), exclude=None, single_document=False))
+    rst_converter._fd = io.StringIO()  # pylint: disable=protected-access
+    rst_converter._fd.name = "output.rst"  # pylint: disable=protected-access
+    rst_converter._empty_attribute_value = "N/A"  # pylint: disable=protected-access
+    translation = {"description": "Translated Description"}
+
+    for record in records:
+        rst_converter._convert_record_object(record, 0, translation)  # pylint: disable=protected-access
+
+    # All records have the same type, therefore only one rendering plan is expected.
+    assert len(rst_converter._render_plan_dict) == 1  # pylint: disable=protected-access
+
+    output = rst_converter._fd.getvalue()  # pylint: disable=protected-access
+    assert output.count("| Translated Description | Test description ") == 3
+    assert r":ref:`Requirements\.req\_id\_2 <single_req_with_section.rst-req_id_2>`" in output
+    assert "| valid                  | False " in output
+
+def test_tc_rst_link_target(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_rst_link_target
+    """
+    The target ID of a referenced record object shall be resolved once, considering the
+    single document mode and the excluded paths.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_rst_link_target")
+
+    symbols = get_trlc_symbols(["./tests/utils"], None)
+    records = {record.name: record for record in symbols.iter_record_objects()}
+
+    rst_converter = RstConverter(Namespace(out=str(tmp_path),
+                                           exclude=["./tests/utils/single_req_with_link.trlc"],
+                                           single_document=True,
+                                           name="output.rst"))
+
+    # pylint: disable=protected-access
+    assert rst_converter._get_link_target(records["req_id_1"]) == "output.rst-req_id_1"
+    assert rst_converter._get_link_target(records["req_id_3"]) == "single_req_with_link.rst-req_id_3"
+
+    # Every further reference is looked up.
+    assert rst_converter._get_link_target(records["req_id_1"]) == "output.rst-req_id_1"
+    assert len(rst_converter._link_target_dict) == 2
+
+def test_tc_rst_referenced_by(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_rst_referenced_by
+    """
+    The software shall add a row with the records, which reference the record, to every record table.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_rst_referenced_by")
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--source", "./tests/utils/single_req_with_section.trlc",
+        "--source", "./tests/utils/single_req_with_link.trlc",
+        "--include", "./tests/utils",
+        "--out", str(tmp_path),
+        "rst",
+        "--referenced-by"
+    ])
+
+    main()
+
+    # Check that no errors were reported.
+    assert capsys.readouterr().err == ""
+
+    # The referencing record is linked in the table of the referenced record.
+    with open(tmp_path / "single_req_with_section.rst", "r", encoding="utf-8") as generated_file:
+        assert r"| Referenced by  | * :ref:`Requirements\.req\_id\_3 <single_req_with_link.rst-req_id_3>` |" \
+            in generated_file.read()
+
+    # A record which isn't referenced gets the empty attribute value.
+    with open(tmp_path / "single_req_with_link.rst", "r", encoding="utf-8") as generated_file:
+        assert r"| Referenced by  | N/A" in generated_file.read()
+
+def test_tc_rst_incremental_model(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_rst_incremental_model
+    """
+    The software shall convert in incremental mode all TRLC source files again if the model
+    changed and remove the reStructuredText files of deleted TRLC source files.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_rst_incremental_model")
+
+    # Copy the TRLC sources, because they will be modified.
+    src_path = tmp_path / "src"
+    out_path = tmp_path / "out"
+    shutil.copytree("./tests/utils", src_path)
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--verbose",
+        "--source", str(src_path),
+        "--out", str(out_path),
+        "rst",
+        "--incremental"
+    ])
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+
+    # A new attribute in the model shall be part of all converted files.
+    with open(src_path / "req.rsl", "r", encoding="utf-8") as rsl_file:
+        rsl = rsl_file.read()
+
+    with open(src_path / "req.rsl", "w", encoding="utf-8") as rsl_file:
+        rsl_file.write(rsl.replace("}", "    extra       optional    String\n}"))
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert "Skipping up to date file" not in captured.out
+
+    for file_name in ["single_req_no_section.rst", "single_req_with_link.rst", "single_req_with_section.rst"]:
+        with open(out_path / file_name, "r", encoding="utf-8") as generated_file:
+            assert "| extra " in generated_file.read()
+
+    # The reStructuredText file of a deleted TRLC source file shall be removed.
+    os.remove(src_path / "single_req_no_section.trlc")
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out.count("Skipping up to date file") == 2
+    assert not os.path.exists(out_path / "single_req_no_section.rst")
+    assert os.path.isfile(out_path / "single_req_with_link.rst")
+
+def test_tc_rst_incremental_referenced_by(record_property, capsys, monkeypatch, tmp_path):
+    # lobster-trace: SwTests.tc_rst_incremental_referenced_by
+    """
+    The software shall convert in incremental mode a TRLC source file again, if a reference into
+    its records is added or removed in another file and the "Referenced by" row is shown.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        capsys (Any): Used to capture stdout and stderr.
+        monkeypatch (Any): Used to mock program arguments.
+        tmp_path (Path): Used to create a temporary output directory.
+    """
+    record_property("lobster-trace", "SwTests.tc_rst_incremental_referenced_by")
+
+    # Copy the TRLC sources, because they will be modified.
+    src_path = tmp_path / "src"
+    out_path = tmp_path / "out"
+    shutil.copytree("./tests/utils", src_path)
+
+    monkeypatch.setattr("sys.argv", [
+        "pyTRLCConverter",
+        "--verbose",
+        "--source", str(src_path),
+        "--out", str(out_path),
+        "rst",
+        "--incremental",
+        "--referenced-by"
+    ])
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+
+    # A new reference into the records of an unchanged file.
+    with open(src_path / "single_req_no_section.trlc", "r", encoding="utf-8") as trlc_file:
+        trlc = trlc_file.read()
+
+    with open(src_path / "single_req_no_section.trlc", "w", encoding="utf-8") as trlc_file:
+        trlc_file.write(trlc.replace("index = 1", "index = 1\n    link = req_id_3"))
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out.count("Skipping up to date file") == 1
+    assert "Skipping up to date file " + str(src_path / "single_req_with_section.trlc") in captured.out
+
+    with open(out_path / "single_req_with_link.rst", "r", encoding="utf-8") as generated_file:
+        assert "<single_req_no_section.rst-req_id_1>" in generated_file.read()
+
+    # The reference is removed again.
+    with open(src_path / "single_req_no_section.trlc", "w", encoding="utf-8") as trlc_file:
+        trlc_file.write(trlc)
+
+    main()
+
+    captured = capsys.readouterr()
+    assert captured.err == ""
+    assert captured.out.count("Skipping up to date file") == 1
+
+    with open(out_path / "single_req_with_link.rst", "r", encoding="utf-8") as generated_file:
+        assert "<single_req_no_section.rst-req_id_1>" not in generated_file.read()
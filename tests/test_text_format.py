@@ -0,0 +1,61 @@
+"""Test the text formatting kernel against its reference implementation.
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import text_format_reference
+from bench_text_format import create_sample_texts
+from pyTRLCConverter.markdown_converter import MarkdownConverter
+from pyTRLCConverter.rst_converter import RstConverter
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+def test_tc_text_format(record_property):
+    # lobster-trace: SwTests.tc_text_format
+    """
+    The escaping and the table functions shall result in byte-identical output as their
+    reference implementation.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+    """
+    record_property("lobster-trace", "SwTests.tc_text_format")
+
+    texts = create_sample_texts(2000, 42) + ["", "\\", "\\\\*", "\n", "a\n\nb\n", "-.-|"]
+    rows = [list(row) for row in zip(texts[0::2], texts[1::2])] + [["", "a\nb\nc"], ["x", "", "y\n"]]
+
+    for text in texts:
+        assert MarkdownConverter.markdown_escape(text) == text_format_reference.markdown_escape(text)
+        assert RstConverter.rst_escape(text) == text_format_reference.rst_escape(text)
+
+    for row in rows:
+        max_widths = [max(len(line) for line in value.split("\n")) + 2 for value in row]
+
+        for escape in [True, False]:
+            assert MarkdownConverter.markdown_create_table_head(row, escape) == \
+                text_format_reference.markdown_create_table_head(row, escape)
+            assert MarkdownConverter.markdown_append_table_row(row, escape) == \
+                text_format_reference.markdown_append_table_row(row, escape)
+            assert RstConverter.rst_append_table_row(row, max_widths, escape) == \
+                text_format_reference.rst_append_table_row(row, max_widths, escape)
+
+# Main *************************************************************************
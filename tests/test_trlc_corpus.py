@@ -0,0 +1,72 @@
+"""Test the synthetic TRLC corpus generator and the end-to-end benchmark.
+"""
+
+# pyTRLCConverter - A tool to convert TRLC files to specific formats.
+# Copyright (c) 2024 - 2025 NewTec GmbH
+#
+# This file is part of pyTRLCConverter program.
+#
+# The pyTRLCConverter program is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# The pyTRLCConverter program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along with pyTRLCConverter.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Imports **********************************************************************
+import os
+from bench_end_to_end import CONVERTERS_DEFAULT, run_benchmark
+from trlc_corpus import CorpusConfig, generate_corpus
+from pyTRLCConverter.trlc_helper import get_file_dict_from_symbols, get_trlc_symbols, is_item_record
+
+# Variables ********************************************************************
+
+# Classes **********************************************************************
+
+# Functions ********************************************************************
+
+def test_tc_benchmark_corpus(record_property, tmp_path):
+    # lobster-trace: SwTests.tc_benchmark_corpus
+    """
+    The generated corpus shall be valid TRLC with the configured number of records and
+    references and the end-to-end benchmark shall measure every phase.
+
+    Args:
+        record_property (Any): Used to inject the test case reference into the test results.
+        tmp_path (Path): Used to create a temporary folder.
+    """
+    record_property("lobster-trace", "SwTests.tc_benchmark_corpus")
+
+    config = CorpusConfig(packages=2, files=2, sections=2, records=3, attributes=2, array_size=3,
+                          reference_density=1.5)
+    corpus_dir = str(tmp_path / "corpus")
+    file_list = generate_corpus(corpus_dir, config)
+
+    assert len(file_list) == 2 + 2 * 2
+    assert all(os.path.isfile(file_name) for file_name in file_list)
+
+    symbols = get_trlc_symbols([corpus_dir], None)
+    assert symbols is not None
+
+    records = [item for item_list in get_file_dict_from_symbols(symbols).values()
+               for item in item_list if is_item_record(item)]
+    assert len(records) == config.get_record_count()
+    assert 0 < sum(1 for record in records if record[0].field["derived"] is not None)
+
+    # The same configuration results in the same corpus.
+    file_list_2 = generate_corpus(str(tmp_path / "corpus_2"), config)
+    for file_name, file_name_2 in zip(file_list, file_list_2):
+        with open(file_name, encoding="utf-8") as fd, open(file_name_2, encoding="utf-8") as fd_2:
+            assert fd.read() == fd_2.read()
+
+    results = run_benchmark(config, CONVERTERS_DEFAULT, 1, str(tmp_path / "work"))
+
+    assert results["corpus"]["records"] == config.get_record_count()
+    assert list(results["phases"]) == ["get_trlc_symbols", "walk_symbols"] + CONVERTERS_DEFAULT
+    assert all(len(phase["runs"]) == 1 for phase in results["phases"].values())
+
+# Main *************************************************************************
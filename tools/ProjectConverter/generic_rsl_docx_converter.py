@@ -83,6 +83,7 @@ class GenericRslDocxConverter(DocxConverter):
         result = Ret.ERROR
 
         image_file = convert_plantuml_to_image(
+            self._get_plantuml(),
             self._get_attribute(record, "file_path"),
             self._args.out,
             self._args.source
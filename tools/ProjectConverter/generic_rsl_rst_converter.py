@@ -33,7 +33,7 @@ from pyTRLCConverter.rst_converter import RstConverter
 from pyTRLCConverter.trlc_helper import Record_Object
 
 # pylint: disable=wrong-import-order
-from image_processing import convert_plantuml_to_image, locate_file
+from image_processing import convert_plantuml_to_image_async, locate_file
 
 # Variables ********************************************************************
 
@@ -79,7 +79,9 @@ class GenericRslRstConverter(RstConverter):
         Returns:
            Ret: Status
         """
-        image_file = convert_plantuml_to_image(
+        # The diagram is generated in the background, the link to it can be written immediately.
+        image_file = convert_plantuml_to_image_async(
+            self._get_plantuml(),
             self._get_attribute(diagram, "file_path"),
             self._args.out,
             self._args.source
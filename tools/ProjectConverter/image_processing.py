@@ -32,7 +32,8 @@ from pyTRLCConverter.plantuml import PlantUML
 
 # Functions ********************************************************************
 
-def convert_plantuml_to_image(plantuml_file: str, dest_dir: str, directories: List[str]) -> Optional[Path]:
+def convert_plantuml_to_image(plantuml: PlantUML, plantuml_file: str, dest_dir: str,
+                              directories: List[str]) -> Optional[Path]:
     """
     Convert PlantUML diagram to image file.
     """
@@ -40,8 +41,7 @@ def convert_plantuml_to_image(plantuml_file: str, dest_dir: str, directories: Li
 
     file_path = locate_file(plantuml_file, directories)
     if file_path is not None:
-        puml = PlantUML()
-        puml.generate("png", file_path, dest_dir)
+        plantuml.generate("png", file_path, dest_dir)
 
         file_dst_path = os.path.basename(file_path)
         file_dst_path = os.path.splitext(file_dst_path)[0]
@@ -61,6 +61,30 @@ def convert_plantuml_to_image(plantuml_file: str, dest_dir: str, directories: Li
 
     return result
 
+def convert_plantuml_to_image_async(plantuml: PlantUML, plantuml_file: str, dest_dir: str,
+                                    directories: List[str]) -> Optional[str]:
+    """
+    Convert PlantUML diagram to image file in the background.
+    The image file name is returned immediately, the converter waits for the image in its finish().
+
+    Args:
+        plantuml (PlantUML): The PlantUML image generator of the converter.
+        plantuml_file (str): The PlantUML diagram file.
+        dest_dir (str): The destination directory of the image file.
+        directories (List[str]): A list of directories to search for the diagram file.
+
+    Returns:
+        Optional[str]: The expected image file name with path or None if the diagram file is not found.
+    """
+    result = None
+
+    file_path = locate_file(plantuml_file, directories)
+    if file_path is not None:
+        plantuml.generate_async("png", file_path, dest_dir)
+        result = PlantUML.get_output_file("png", file_path, dest_dir)
+
+    return result
+
 
 def locate_file(file_path: str, directories: List[str]) -> Optional[str]:
     """
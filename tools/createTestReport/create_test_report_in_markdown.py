@@ -107,12 +107,12 @@ class CustomMarkdownConverter(MarkdownConverter):
             self._print_table_head()
             self._is_table_head_req = False
 
-        test_case_result_attributes = test_case_result.to_python_dict()
+        test_case_result_attributes = self._get_attributes(test_case_result)
 
         test_function_name = self._get_attribute(test_case_result, "name")
         test_result = self._get_attribute(test_case_result, "result")
 
-        test_case = test_case_result_attributes["relates"]
+        test_case = test_case_result_attributes.get_string("relates")
         if test_case is None:
             test_case = self.markdown_escape("N/A")
         else:
@@ -118,12 +118,12 @@ class CustomRstConverter(RstConverter):
         Returns:
             list[str]: Table row
         """
-        test_case_result_attributes = test_case_result.to_python_dict()
+        test_case_result_attributes = self._get_attributes(test_case_result)
 
         test_function_name = self._get_attribute(test_case_result, "name")
         test_result = self._get_attribute(test_case_result, "result")
 
-        test_case = test_case_result_attributes["relates"]
+        test_case = test_case_result_attributes.get_string("relates")
         if test_case is None:
             test_case = self.rst_escape("N/A")
         else: